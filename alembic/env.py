@@ -8,7 +8,7 @@ from sqlalchemy import engine_from_config, pool
 from alembic import context
 from dotenv import load_dotenv
 from database.base_class import Base
-from models import user, audio_submission, vocabulary_item
+from models import user, audio_submission, vocabulary_item, translation_memory
 
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///app.db")
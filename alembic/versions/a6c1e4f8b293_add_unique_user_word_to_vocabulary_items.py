@@ -0,0 +1,47 @@
+"""Add unique (user_id, russian_word) index to vocabulary_items
+
+Revision ID: a6c1e4f8b293
+Revises: f3a9d2e7b614
+Create Date: 2026-10-19 18:03:41.752914
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+logger = logging.getLogger(__name__)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c1e4f8b293'
+down_revision: Union[str, None] = 'f3a9d2e7b614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the oldest item of every duplicated word so the unique index can be built.
+    # The deleted duplicates are gone for good: downgrade() cannot restore them.
+    deleted = op.get_bind().execute(sa.text(
+        """DELETE FROM vocabulary_items
+        WHERE user_id IS NOT NULL AND russian_word IS NOT NULL AND id NOT IN (
+            SELECT MIN(id) FROM vocabulary_items
+            WHERE user_id IS NOT NULL AND russian_word IS NOT NULL
+            GROUP BY user_id, russian_word
+        )"""
+    )).rowcount
+    if deleted:
+        logger.warning(
+            "Deleted %d duplicate vocabulary items (kept the oldest item per user and "
+            "word); downgrading does not restore them.", deleted
+        )
+    op.create_index(
+        'uq_vocabulary_items_user_word', 'vocabulary_items', ['user_id', 'russian_word'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_vocabulary_items_user_word', table_name='vocabulary_items')
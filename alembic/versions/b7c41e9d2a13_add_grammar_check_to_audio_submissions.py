@@ -0,0 +1,28 @@
+"""Add grammar check columns to audio_submissions
+
+Revision ID: b7c41e9d2a13
+Revises: e537f26cc96c
+Create Date: 2026-10-19 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c41e9d2a13'
+down_revision: Union[str, None] = 'e537f26cc96c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('audio_submissions', sa.Column('grammar_status', sa.String(), nullable=True))
+    op.add_column('audio_submissions', sa.Column('grammar_result', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('audio_submissions', 'grammar_result')
+    op.drop_column('audio_submissions', 'grammar_status')
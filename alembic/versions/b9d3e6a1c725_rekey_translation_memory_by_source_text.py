@@ -0,0 +1,28 @@
+"""Clear translation_memory entries keyed by lemma
+
+Revision ID: b9d3e6a1c725
+Revises: a6c1e4f8b293
+Create Date: 2026-10-19 21:14:09.318402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9d3e6a1c725'
+down_revision: Union[str, None] = 'a6c1e4f8b293'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Entries are now keyed by the word as entered. Lemma-keyed entries may hold the
+    # translation of another form ("was" under "быть"), so the cache is rebuilt.
+    op.execute("DELETE FROM translation_memory")
+
+
+def downgrade() -> None:
+    # Nothing to restore: the translation memory is a cache and refills on use.
+    pass
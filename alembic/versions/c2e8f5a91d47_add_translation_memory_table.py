@@ -0,0 +1,41 @@
+"""Add translation_memory table
+
+Revision ID: c2e8f5a91d47
+Revises: b7c41e9d2a13
+Create Date: 2026-10-19 11:02:17.540931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2e8f5a91d47'
+down_revision: Union[str, None] = 'b7c41e9d2a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'translation_memory',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('russian_word', sa.String(), nullable=False),
+        sa.Column('target_language', sa.String(), nullable=False),
+        sa.Column('translation', sa.String(), nullable=False),
+        sa.Column('model_name', sa.String(), nullable=False),
+        sa.Column(
+            'created_at', sa.DateTime(timezone=True),
+            server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('russian_word', 'target_language', name='uq_translation_memory_word'),
+    )
+    op.create_index(op.f('ix_translation_memory_id'), 'translation_memory', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_translation_memory_id'), table_name='translation_memory')
+    op.drop_table('translation_memory')
@@ -0,0 +1,48 @@
+"""Add lemma_key to vocabulary_items
+
+Revision ID: d4a7b3c1e590
+Revises: c2e8f5a91d47
+Create Date: 2026-10-19 14:26:51.208317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from services.morphology import lemma_key
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7b3c1e590'
+down_revision: Union[str, None] = 'c2e8f5a91d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('vocabulary_items', sa.Column('lemma_key', sa.String(), nullable=True))
+    op.create_index(
+        'ix_vocabulary_items_user_lemma', 'vocabulary_items', ['user_id', 'lemma_key'], unique=False
+    )
+
+    # Backfill the keys of existing items.
+    connection = op.get_bind()
+    items = sa.table(
+        'vocabulary_items',
+        sa.column('id', sa.Integer),
+        sa.column('russian_word', sa.String),
+        sa.column('lemma_key', sa.String),
+    )
+    rows = connection.execute(sa.select(items.c.id, items.c.russian_word)).fetchall()
+    for item_id, russian_word in rows:
+        connection.execute(
+            items.update()
+            .where(items.c.id == item_id)
+            .values(lemma_key=lemma_key(russian_word or ''))
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vocabulary_items_user_lemma', table_name='vocabulary_items')
+    op.drop_column('vocabulary_items', 'lemma_key')
@@ -0,0 +1,39 @@
+"""Add vocabulary pagination and full-text search indexes
+
+Revision ID: e8b2f6d4c137
+Revises: d4a7b3c1e590
+Create Date: 2026-10-19 16:05:42.913208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from database.fts import (
+    VOCABULARY_FTS_DDL,
+    VOCABULARY_FTS_DROP,
+    VOCABULARY_FTS_TABLE,
+    rebuild_statement,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b2f6d4c137'
+down_revision: Union[str, None] = 'd4a7b3c1e590'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_vocabulary_items_user_id_id', 'vocabulary_items', ['user_id', 'id'], unique=False
+    )
+    for statement in VOCABULARY_FTS_DDL:
+        op.execute(statement)
+    op.execute(rebuild_statement(VOCABULARY_FTS_TABLE))
+
+
+def downgrade() -> None:
+    for statement in VOCABULARY_FTS_DROP:
+        op.execute(statement)
+    op.drop_index('ix_vocabulary_items_user_id_id', table_name='vocabulary_items')
@@ -0,0 +1,30 @@
+"""Add full-text search index on audio_submissions transcripts
+
+Revision ID: f3a9d2e7b614
+Revises: e8b2f6d4c137
+Create Date: 2026-10-19 17:12:08.460519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from database.fts import AUDIO_FTS_DDL, AUDIO_FTS_DROP, AUDIO_FTS_TABLE, rebuild_statement
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9d2e7b614'
+down_revision: Union[str, None] = 'e8b2f6d4c137'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for statement in AUDIO_FTS_DDL:
+        op.execute(statement)
+    op.execute(rebuild_statement(AUDIO_FTS_TABLE))
+
+
+def downgrade() -> None:
+    for statement in AUDIO_FTS_DROP:
+        op.execute(statement)
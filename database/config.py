@@ -41,6 +41,7 @@ def init_db():
     import models.user # pylint: disable=C0415, W0611
     import models.audio_submission # pylint: disable=C0415, W0611
     import models.vocabulary_item # pylint: disable=C0415, W0611
+    import models.translation_memory # pylint: disable=C0415, W0611
     Base.metadata.create_all(bind=ENGINE)
 
 
@@ -4,18 +4,32 @@ on database models such as users, audio submissions,
 and vocabulary items.
 """
 # Group 1: Standard libraries
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 # Group 2: Third-party libraries
+from sqlalchemy import (
+    Integer, Row, column, exists, func, literal, literal_column, or_, select, table, text
+)
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session # Corrected import order (C0411)
 
 # Group 3: First-party modules
 from models.user import User
 from models.audio_submission import AudioSubmission
 from models.vocabulary_item import VocabularyItem
+from models.translation_memory import TranslationMemory
+from database.fts import (
+    AUDIO_FTS_TABLE,
+    HIGHLIGHT_END,
+    HIGHLIGHT_START,
+    VOCABULARY_FTS_TABLE,
+    fts_phrase,
+    fts_prefix_query,
+)
 from schemas.user import UserCreate, UserCreateTelegram
 from schemas.audio_submission import AudioSubmissionCreate
 from schemas.vocabulary_item import VocabularyItemCreate
+from services.morphology import lemma_key
 
 
 # --- User CRUD Operations ---
@@ -139,6 +153,149 @@ def get_audio_submissions_by_user(
     return query.all()
 
 
+def get_audio_submission_previews(
+    db: Session,
+    user_id: int,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+    limit: int = 5,
+    preview_length: int = 200,
+) -> Tuple[List[Row], bool]:
+    """
+    Retrieves one keyset-paginated page of transcript previews for a user, newest first.
+
+    Only the first ``preview_length`` characters of each transcript are loaded;
+    use ``get_audio_submission`` to fetch a full transcript.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The ID of the user.
+        before_id (Optional[int]): Return submissions older than this ID (next page).
+        after_id (Optional[int]): Return submissions newer than this ID (previous page).
+        limit (int): The page size.
+        preview_length (int): Maximum number of transcript characters to load per row.
+
+    Returns:
+        Tuple[List[Row], bool]: The page rows (``id``, ``created_at``, ``language``,
+        ``preview``, ``transcript_length``) ordered newest first, and whether more
+        rows exist beyond the page in the direction of travel.
+    """
+    query = db.query(
+        AudioSubmission.id,
+        AudioSubmission.created_at,
+        AudioSubmission.language,
+        func.substr(AudioSubmission.original_transcript, 1, preview_length).label("preview"),
+        func.length(AudioSubmission.original_transcript).label("transcript_length"),
+    ).filter(AudioSubmission.user_id == user_id)
+
+    if after_id is not None:
+        query = query.filter(AudioSubmission.id > after_id).order_by(AudioSubmission.id.asc())
+    else:
+        if before_id is not None:
+            query = query.filter(AudioSubmission.id < before_id)
+        query = query.order_by(AudioSubmission.id.desc())
+
+    # Fetch one extra row to know whether another page exists.
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if after_id is not None:
+        rows.reverse()
+    return rows, has_more
+
+
+def search_audio_submissions(
+    db: Session,
+    user_id: int,
+    text_query: str,
+    language: Optional[str] = None,
+    limit: int = 20,
+    snippet_tokens: int = 16,
+) -> List[Row]:
+    """
+    Full-text searches a user's transcripts, best matches first (bm25).
+
+    Every word of ``text_query`` must occur in the transcript, as a word or a
+    word prefix ('книг' finds 'книгу').
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The ID of the user.
+        text_query (str): The words to search for.
+        language (Optional[str]): Only transcripts in this language (e.g. 'ru').
+        limit (int): Maximum number of results.
+        snippet_tokens (int): Approximate length of each snippet in words.
+
+    Returns:
+        List[Row]: Rows with ``id``, ``created_at``, ``language``, ``snippet``
+        (matches between ``HIGHLIGHT_START`` and ``HIGHLIGHT_END``) and ``rank``
+        (bm25; lower is better).
+    """
+    match_query = fts_prefix_query(text_query)
+    if not match_query:
+        return []
+    fts = table(AUDIO_FTS_TABLE, column("rowid", Integer))
+    fts_ref = literal_column(AUDIO_FTS_TABLE)
+    query = db.query(
+        AudioSubmission.id,
+        AudioSubmission.created_at,
+        AudioSubmission.language,
+        func.snippet(
+            fts_ref, 0, HIGHLIGHT_START, HIGHLIGHT_END, "…", snippet_tokens
+        ).label("snippet"),
+        func.bm25(fts_ref).label("rank"),
+    ).join(fts, fts.c.rowid == AudioSubmission.id).filter(
+        fts_ref.op("MATCH")(match_query),
+        AudioSubmission.user_id == user_id,
+    )
+    if language:
+        query = query.filter(AudioSubmission.language == language)
+    return query.order_by(text("rank")).limit(limit).all()
+
+
+def get_audio_submission(db: Session, audio_id: int, user_id: int) -> Optional[AudioSubmission]:
+    """
+    Retrieves a single audio submission belonging to a user.
+
+    Args:
+        db (Session): The database session.
+        audio_id (int): The ID of the audio submission.
+        user_id (int): The ID of the user to whom the audio submission belongs.
+
+    Returns:
+        Optional[AudioSubmission]: The AudioSubmission object if found, otherwise None.
+    """
+    return db.query(AudioSubmission).filter(
+        AudioSubmission.id == audio_id,
+        AudioSubmission.user_id == user_id
+    ).first()
+
+
+def set_audio_grammar_result(
+    db: Session, audio_id: int, grammar_status: str, grammar_result: Optional[dict] = None
+) -> Optional[AudioSubmission]:
+    """
+    Stores the outcome of the automatic grammar check of a transcript.
+
+    Args:
+        db (Session): The database session.
+        audio_id (int): The ID of the audio submission.
+        grammar_status (str): 'pending', 'completed' or 'failed'.
+        grammar_result (Optional[dict]): The grammar check response, if completed.
+
+    Returns:
+        Optional[AudioSubmission]: The updated submission, or None if it no longer exists.
+    """
+    submission = db.get(AudioSubmission, audio_id)
+    if submission is None:
+        return None
+    submission.grammar_status = grammar_status
+    submission.grammar_result = grammar_result
+    db.commit()
+    db.refresh(submission)
+    return submission
+
+
 def delete_audio_submission(db: Session, audio_id: int, user_id: int) -> bool:
     """
     Deletes a specific audio submission for a user.
@@ -166,10 +323,16 @@ def delete_audio_submission(db: Session, audio_id: int, user_id: int) -> bool:
 # --- Vocabulary Item CRUD Operations ---
 def create_vocabulary_item(
     db: Session, item: VocabularyItemCreate, user_id: Optional[int] = None
-) -> VocabularyItem:
+) -> Optional[VocabularyItem]:
     """
-    Creates a new vocabulary item in the database,
-    optionally associated with a user.
+    Creates a vocabulary item, or updates the user's item with the same word,
+    unless the user has another form of it (same lemma key) and not this word.
+
+    One ``INSERT ... SELECT ... WHERE ... ON CONFLICT DO UPDATE ... RETURNING``
+    against the unique (user_id, russian_word) index, so a repeated or concurrent
+    request for the same word updates its translation and example instead of
+    duplicating it, and concurrent inflected forms cannot both be inserted (SQLite
+    runs the lemma check and the insert under one write lock).
 
     Args:
         db (Session): The database session.
@@ -178,18 +341,112 @@ def create_vocabulary_item(
                                    Can be None if not associated with a specific user.
 
     Returns:
-        VocabularyItem: The newly created and persisted VocabularyItem object.
+        Optional[VocabularyItem]: The created or updated VocabularyItem object, or
+        None if the user already has another form of the word.
     """
     db_item_data = item.model_dump()
+    db_item_data["lemma_key"] = lemma_key(item.russian_word)
     if user_id:
         db_item_data["user_id"] = user_id
-    db_item = VocabularyItem(**db_item_data)
-    db.add(db_item)
+    columns = VocabularyItem.__table__.c
+    same_user = VocabularyItem.user_id == (user_id or None)
+    other_form = exists().where(
+        same_user,
+        VocabularyItem.lemma_key == db_item_data["lemma_key"],
+        VocabularyItem.russian_word != item.russian_word,
+    )
+    same_word = exists().where(same_user, VocabularyItem.russian_word == item.russian_word)
+    values = select(*(
+        literal(value, columns[name].type).label(name) for name, value in db_item_data.items()
+    )).where(or_(~other_form, same_word))
+    statement = insert(VocabularyItem).from_select(list(db_item_data), values)
+    statement = statement.on_conflict_do_update(
+        index_elements=[VocabularyItem.user_id, VocabularyItem.russian_word],
+        set_={
+            "translation": statement.excluded.translation,
+            "example_sentence": statement.excluded.example_sentence,
+            "lemma_key": statement.excluded.lemma_key,
+        },
+    ).returning(VocabularyItem)
+    db_item = db.scalars(
+        statement, execution_options={"populate_existing": True}
+    ).one_or_none()
     db.commit()
-    db.refresh(db_item)
     return db_item
 
 
+def get_vocabulary_item_by_lemma(
+    db: Session, user_id: int, russian_word: str
+) -> Optional[VocabularyItem]:
+    """
+    Finds a user's vocabulary item with the same lemma key as ``russian_word``
+    (e.g. an item for 'книга' when adding 'книгу'), preferring the item with
+    exactly ``russian_word``.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The ID of the user.
+        russian_word (str): The word being added.
+
+    Returns:
+        Optional[VocabularyItem]: The existing item, or None.
+    """
+    return db.query(VocabularyItem).filter(
+        VocabularyItem.user_id == user_id,
+        VocabularyItem.lemma_key == lemma_key(russian_word),
+    ).order_by((VocabularyItem.russian_word == russian_word).desc()).first()
+
+
+def get_existing_lemma_keys(db: Session, user_id: int, lemma_keys: Iterable[str]) -> Set[str]:
+    """
+    Returns which of ``lemma_keys`` the user already has vocabulary items for.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The ID of the user.
+        lemma_keys (Iterable[str]): Lemma keys to check (one query).
+
+    Returns:
+        Set[str]: The lemma keys that exist.
+    """
+    keys = list(lemma_keys)
+    if not keys:
+        return set()
+    rows = db.query(VocabularyItem.lemma_key).filter(
+        VocabularyItem.user_id == user_id,
+        VocabularyItem.lemma_key.in_(keys),
+    )
+    return {row.lemma_key for row in rows}
+
+
+def bulk_create_vocabulary_items(
+    db: Session, user_id: int, items: List[Dict[str, Any]]
+) -> int:
+    """
+    Inserts many vocabulary items with one executemany and commits them.
+
+    Items whose word the user already has (by the unique (user_id, russian_word)
+    index) are skipped with ``ON CONFLICT DO NOTHING``.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The ID of the user who owns the items.
+        items (List[Dict[str, Any]]): Item columns (``russian_word``, ``translation``,
+            ``example_sentence`` and ``lemma_key``).
+
+    Returns:
+        int: The number of items actually inserted.
+    """
+    if not items:
+        return 0
+    statement = insert(VocabularyItem).on_conflict_do_nothing(
+        index_elements=[VocabularyItem.user_id, VocabularyItem.russian_word]
+    ).returning(VocabularyItem.id)
+    inserted = db.execute(statement, [{**item, "user_id": user_id} for item in items]).all()
+    db.commit()
+    return len(inserted)
+
+
 def get_all_vocabulary_items(db: Session) -> List[VocabularyItem]:
     """
     Retrieves all vocabulary items from the database.
@@ -220,6 +477,53 @@ def get_vocabulary_items_by_user(db: Session, user_id: int) -> List[VocabularyIt
     ).order_by(VocabularyItem.created_at.desc()).all()
 
 
+def get_vocabulary_page(
+    db: Session,
+    user_id: int,
+    limit: int,
+    before_id: Optional[int] = None,
+    query: Optional[str] = None,
+) -> Tuple[List[VocabularyItem], bool]:
+    """
+    Retrieves one page of a user's vocabulary, newest first, with keyset
+    pagination on the ``(user_id, id)`` index.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The ID of the user.
+        limit (int): Maximum number of items to return.
+        before_id (Optional[int]): Only return items older than this ID (the
+            last ID of the previous page).
+        query (Optional[str]): Only return items whose word or translation
+            contains this text. Uses the case-insensitive FTS5 trigram index for
+            3+ characters on SQLite, and ``ILIKE`` otherwise (which SQLite only
+            folds for ASCII letters).
+
+    Returns:
+        Tuple[List[VocabularyItem], bool]: The items and whether older items exist.
+    """
+    items_query = db.query(VocabularyItem).filter(VocabularyItem.user_id == user_id)
+    if before_id is not None:
+        items_query = items_query.filter(VocabularyItem.id < before_id)
+    query = (query or "").strip()
+    if query:
+        if len(query) >= 3 and db.get_bind().dialect.name == "sqlite":
+            matches = text(
+                f"SELECT rowid FROM {VOCABULARY_FTS_TABLE} "
+                f"WHERE {VOCABULARY_FTS_TABLE} MATCH :phrase"
+            ).bindparams(phrase=fts_phrase(query)).columns(column("rowid", Integer))
+            items_query = items_query.filter(VocabularyItem.id.in_(matches))
+        else:
+            escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            pattern = f"%{escaped}%"
+            items_query = items_query.filter(or_(
+                VocabularyItem.russian_word.ilike(pattern, escape="\\"),
+                VocabularyItem.translation.ilike(pattern, escape="\\"),
+            ))
+    rows = items_query.order_by(VocabularyItem.id.desc()).limit(limit + 1).all()
+    return rows[:limit], len(rows) > limit
+
+
 def delete_vocabulary_item(db: Session, item_id: int, user_id: int) -> bool:
     """
     Deletes a specific vocabulary item for a user.
@@ -242,3 +546,96 @@ def delete_vocabulary_item(db: Session, item_id: int, user_id: int) -> bool:
         db.commit()
         return True
     return False
+
+
+# --- Translation Memory CRUD Operations ---
+def get_translation_memories(
+    db: Session, russian_words: Iterable[str], target_language: str, model_name: str
+) -> Dict[str, str]:
+    """
+    Retrieves stored translations for several normalized words in one query.
+
+    Args:
+        db (Session): The database session.
+        russian_words (Iterable[str]): Normalized Russian words.
+        target_language (str): The target language code.
+        model_name (str): Only translations produced by this model are returned.
+
+    Returns:
+        Dict[str, str]: The translation of every word that has one.
+    """
+    rows = db.query(TranslationMemory.russian_word, TranslationMemory.translation).filter(
+        TranslationMemory.russian_word.in_(list(russian_words)),
+        TranslationMemory.target_language == target_language,
+        TranslationMemory.model_name == model_name,
+    ).all()
+    return dict(rows)
+
+
+def save_translation_memories(
+    db: Session, translations: Dict[str, str], target_language: str, model_name: str
+) -> None:
+    """
+    Stores translations of normalized words, replacing older entries for the same
+    word and language (e.g. produced by a previous model).
+
+    One ``INSERT ... ON CONFLICT DO UPDATE`` against the unique (russian_word,
+    target_language) constraint, so workers storing the same new word at the
+    same time update each other's entry instead of failing.
+
+    Args:
+        db (Session): The database session.
+        translations (Dict[str, str]): Translation per normalized Russian word.
+        target_language (str): The target language code.
+        model_name (str): The model that produced the translations.
+    """
+    if not translations:
+        return
+    statement = insert(TranslationMemory)
+    statement = statement.on_conflict_do_update(
+        index_elements=[TranslationMemory.russian_word, TranslationMemory.target_language],
+        set_={
+            "translation": statement.excluded.translation,
+            "model_name": statement.excluded.model_name,
+        },
+    )
+    db.execute(statement, [
+        {
+            "russian_word": russian_word,
+            "target_language": target_language,
+            "translation": translation,
+            "model_name": model_name,
+        }
+        for russian_word, translation in translations.items()
+    ])
+    db.commit()
+
+
+def delete_translation_memories(
+    db: Session,
+    target_language: Optional[str] = None,
+    russian_word: Optional[str] = None,
+    model_name: Optional[str] = None,
+) -> int:
+    """
+    Deletes translation memory entries matching every given filter.
+
+    Args:
+        db (Session): The database session.
+        target_language (Optional[str]): Only entries for this language.
+        russian_word (Optional[str]): Only entries for this normalized word.
+        model_name (Optional[str]): Only entries produced by this model.
+
+    Returns:
+        int: The number of deleted entries.
+    """
+    query = db.query(TranslationMemory)
+    if target_language is not None:
+        query = query.filter(TranslationMemory.target_language == target_language)
+    if russian_word is not None:
+        query = query.filter(TranslationMemory.russian_word == russian_word)
+    if model_name is not None:
+        query = query.filter(TranslationMemory.model_name == model_name)
+    deleted = query.delete(synchronize_session=False)
+    db.commit()
+    return deleted
@@ -0,0 +1,123 @@
+"""
+SQLite FTS5 indexes used for searching.
+
+Each index is an external-content FTS5 table over an ordinary table, kept in sync
+by triggers. The statements are shared by the Alembic migrations and by
+``create_all`` (through ``after_create`` listeners on the SQLite dialect), so
+databases created either way get the same indexes.
+"""
+# Group 1: Standard libraries
+import html
+import re
+from typing import List
+
+# Group 2: Third-party libraries
+from sqlalchemy import DDL, Table, event
+
+# Substring search over words and translations; trigram matches any 3+ character
+# fragment, case-insensitively (Unicode-aware).
+VOCABULARY_FTS_TABLE = "vocabulary_items_fts"
+VOCABULARY_FTS_DDL: List[str] = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {VOCABULARY_FTS_TABLE} USING fts5(
+        russian_word, translation,
+        content='vocabulary_items', content_rowid='id', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS vocabulary_items_fts_insert
+        AFTER INSERT ON vocabulary_items BEGIN
+            INSERT INTO {VOCABULARY_FTS_TABLE}(rowid, russian_word, translation)
+            VALUES (new.id, new.russian_word, new.translation);
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS vocabulary_items_fts_delete
+        AFTER DELETE ON vocabulary_items BEGIN
+            INSERT INTO {VOCABULARY_FTS_TABLE}({VOCABULARY_FTS_TABLE}, rowid, russian_word, translation)
+            VALUES ('delete', old.id, old.russian_word, old.translation);
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS vocabulary_items_fts_update
+        AFTER UPDATE OF russian_word, translation ON vocabulary_items BEGIN
+            INSERT INTO {VOCABULARY_FTS_TABLE}({VOCABULARY_FTS_TABLE}, rowid, russian_word, translation)
+            VALUES ('delete', old.id, old.russian_word, old.translation);
+            INSERT INTO {VOCABULARY_FTS_TABLE}(rowid, russian_word, translation)
+            VALUES (new.id, new.russian_word, new.translation);
+        END""",
+]
+VOCABULARY_FTS_DROP: List[str] = [
+    "DROP TRIGGER IF EXISTS vocabulary_items_fts_update",
+    "DROP TRIGGER IF EXISTS vocabulary_items_fts_delete",
+    "DROP TRIGGER IF EXISTS vocabulary_items_fts_insert",
+    f"DROP TABLE IF EXISTS {VOCABULARY_FTS_TABLE}",
+]
+
+# Word search over transcripts, ranked with bm25; diacritics are ignored.
+AUDIO_FTS_TABLE = "audio_submissions_fts"
+AUDIO_FTS_DDL: List[str] = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {AUDIO_FTS_TABLE} USING fts5(
+        original_transcript,
+        content='audio_submissions', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS audio_submissions_fts_insert
+        AFTER INSERT ON audio_submissions BEGIN
+            INSERT INTO {AUDIO_FTS_TABLE}(rowid, original_transcript)
+            VALUES (new.id, new.original_transcript);
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS audio_submissions_fts_delete
+        AFTER DELETE ON audio_submissions BEGIN
+            INSERT INTO {AUDIO_FTS_TABLE}({AUDIO_FTS_TABLE}, rowid, original_transcript)
+            VALUES ('delete', old.id, old.original_transcript);
+        END""",
+    f"""CREATE TRIGGER IF NOT EXISTS audio_submissions_fts_update
+        AFTER UPDATE OF original_transcript ON audio_submissions BEGIN
+            INSERT INTO {AUDIO_FTS_TABLE}({AUDIO_FTS_TABLE}, rowid, original_transcript)
+            VALUES ('delete', old.id, old.original_transcript);
+            INSERT INTO {AUDIO_FTS_TABLE}(rowid, original_transcript)
+            VALUES (new.id, new.original_transcript);
+        END""",
+]
+AUDIO_FTS_DROP: List[str] = [
+    "DROP TRIGGER IF EXISTS audio_submissions_fts_update",
+    "DROP TRIGGER IF EXISTS audio_submissions_fts_delete",
+    "DROP TRIGGER IF EXISTS audio_submissions_fts_insert",
+    f"DROP TABLE IF EXISTS {AUDIO_FTS_TABLE}",
+]
+
+# Snippets mark matches with these control characters; ``render_snippet`` turns
+# them into markup after escaping the transcript text.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+_QUERY_TOKEN = re.compile(r"\w+")
+
+
+def fts_phrase(text: str) -> str:
+    """Quotes ``text`` as one FTS5 phrase, so its characters are never query syntax."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def fts_prefix_query(text: str) -> str:
+    """
+    Turns free text into an FTS5 query matching every word as a prefix, so
+    'книг' also finds 'книга' and 'книгу'. Returns '' if there are no words.
+    """
+    return " ".join(fts_phrase(token) + "*" for token in _QUERY_TOKEN.findall(text))
+
+
+def render_snippet(snippet: str, start: str, end: str) -> str:
+    """HTML-escapes a snippet and replaces its match markers with ``start``/``end``."""
+    escaped = html.escape(snippet or "", quote=False)
+    return escaped.replace(HIGHLIGHT_START, start).replace(HIGHLIGHT_END, end)
+
+
+def rebuild_statement(fts_table: str) -> str:
+    """Returns the statement that repopulates ``fts_table`` from its content table."""
+    return f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')"
+
+
+def install_fts_listeners(table: Table, create: List[str], drop: List[str]) -> None:
+    """
+    Runs ``create`` after ``table`` is created by ``create_all`` and ``drop``
+    before it is dropped by ``drop_all``, on SQLite only.
+    """
+    for statement in create:
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in drop:
+        event.listen(table, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
@@ -20,6 +20,9 @@ from routers.auth import router as auth_router
 from routers.audio import router as audio_router
 from routers.vocabulary import router as vocabulary_router
 from routers.grammar import router as grammar_router
+from services.grammar_service import GrammarService
+from services.morphology import load_analyzer
+from services.vocabulary_nlp_service import VocabularyNLPService
 
 load_dotenv()  # Load environment variables from .env file
 
@@ -41,8 +44,13 @@ async def lifespan(_fastapi_app: FastAPI):
         "Database initialized. "
         "Whisper model will be loaded on first use (if not already)."
     )
+    GrammarService().start_health_checks()
+    load_analyzer()  # pymorphy3 dictionaries, used by vocabulary lookups
+    await VocabularyNLPService().preload_models_async()
     yield  # Application remains running during this yield
     logger.info("Shutting down FastAPI application...")
+    await GrammarService().aclose()
+    VocabularyNLPService().shutdown()
 
 app = FastAPI(
     title="Language Simulator MVP",
@@ -63,6 +71,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Cursor of the next page of paginated lists.
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
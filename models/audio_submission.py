@@ -7,12 +7,13 @@ requests and their results, linked to a specific user.
 # Group 1: Standard libraries
 # None for now, as types like Optional are handled by typing.
 # Group 2: Third-party libraries
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func # Corrected import order (C0411)
 
 # Group 3: First-party modules
 from database.base_class import Base
+from database.fts import AUDIO_FTS_DDL, AUDIO_FTS_DROP, install_fts_listeners
 
 # pylint: disable=R0903 # Too few public methods (common for SQLAlchemy models)
 class AudioSubmission(Base):
@@ -26,6 +27,9 @@ class AudioSubmission(Base):
         original_transcript (str): The transcribed text from the audio.
         language (str): The detected language of the audio/transcript.
         created_at (datetime): Timestamp when the submission was created.
+        grammar_status (str): State of the automatic grammar check of the transcript:
+            'pending', 'completed' or 'failed' (None if it was not requested).
+        grammar_result (dict): The grammar check response, once completed.
         owner (User): Relationship to the User model.
     """
     __tablename__ = "audio_submissions"
@@ -38,5 +42,11 @@ class AudioSubmission(Base):
     # E1102: func.now is not callable (not-callable) - This is a common Pylint false positive
     # with SQLAlchemy's func.now() in server_default. The usage here is typically correct.
     created_at = Column(DateTime(timezone=True), server_default=func.now()) # pylint: disable=E1102
+    grammar_status = Column(String, nullable=True)
+    grammar_result = Column(JSON, nullable=True)
 
     owner = relationship("User", back_populates="audio_submissions")
+
+
+# Full-text search index over transcripts (see database.fts).
+install_fts_listeners(AudioSubmission.__table__, AUDIO_FTS_DDL, AUDIO_FTS_DROP)
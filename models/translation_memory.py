@@ -0,0 +1,43 @@
+"""
+SQLAlchemy model for the shared translation memory.
+
+This module defines the database schema for caching machine translations of
+Russian words, shared by all users and keyed by the word as entered and target language.
+"""
+# Group 1: Standard libraries
+# None for now.
+
+# Group 2: Third-party libraries
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+
+# Group 3: First-party modules
+from database.base_class import Base
+
+# pylint: disable=R0903 # Too few public methods (common for SQLAlchemy models)
+class TranslationMemory(Base):
+    """
+    Represents a stored machine translation of a Russian word.
+
+    Attributes:
+        id (int): Primary key for the entry.
+        russian_word (str): The Russian word as entered (NFC and trimmed, case kept).
+        target_language (str): The target language code (e.g., 'en').
+        translation (str): The translation produced by the model.
+        model_name (str): The model that produced the translation; entries from
+            other models are ignored on lookup.
+        created_at (datetime): Timestamp when the entry was stored.
+    """
+    __tablename__ = "translation_memory"
+    __table_args__ = (
+        UniqueConstraint("russian_word", "target_language", name="uq_translation_memory_word"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    russian_word = Column(String, nullable=False)
+    target_language = Column(String, nullable=False)
+    translation = Column(String, nullable=False)
+    model_name = Column(String, nullable=False)
+    # E1102: func.now is not callable (not-callable) - This is a common Pylint false positive
+    # with SQLAlchemy's func.now() in server_default. The usage here is typically correct.
+    created_at = Column(DateTime(timezone=True), server_default=func.now()) # pylint: disable=E1102
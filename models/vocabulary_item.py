@@ -9,12 +9,13 @@ and a link to the user who owns them.
 # None for now.
 
 # Group 2: Third-party libraries
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 # Group 3: First-party modules
 from database.base_class import Base # Ensure Base import is correct
+from database.fts import VOCABULARY_FTS_DDL, VOCABULARY_FTS_DROP, install_fts_listeners
 
 # pylint: disable=R0903 # Too few public methods (common for SQLAlchemy models)
 class VocabularyItem(Base):
@@ -24,6 +25,8 @@ class VocabularyItem(Base):
     Attributes:
         id (int): Primary key for the vocabulary item.
         russian_word (str): The Russian word.
+        lemma_key (str): The word's lemma key (see ``services.morphology``), used to
+            detect inflected duplicates.
         translation (str): The translation of the Russian word.
         example_sentence (str, optional): An example sentence using the word.
         user_id (int): Foreign key linking to the User who owns this item.
@@ -31,9 +34,16 @@ class VocabularyItem(Base):
         owner (User): Relationship to the User model.
     """
     __tablename__ = "vocabulary_items"
+    __table_args__ = (
+        Index("ix_vocabulary_items_user_lemma", "user_id", "lemma_key"),
+        Index("ix_vocabulary_items_user_id_id", "user_id", "id"),
+        # One item per word and user; creation upserts against it.
+        Index("uq_vocabulary_items_user_word", "user_id", "russian_word", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     russian_word = Column(String, index=True)
+    lemma_key = Column(String, nullable=True)
     translation = Column(String)
     example_sentence = Column(String, nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -42,3 +52,7 @@ class VocabularyItem(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=True) # pylint: disable=E1102
 
     owner = relationship("User", back_populates="vocabulary_items")
+
+
+# Full-text search index over words and translations (see database.fts).
+install_fts_listeners(VocabularyItem.__table__, VOCABULARY_FTS_DDL, VOCABULARY_FTS_DROP)
@@ -9,18 +9,40 @@ from pathlib import Path
 from typing import Optional, List
 
 # Group 2: Third-party libraries
-from fastapi import APIRouter, UploadFile, File, HTTPException, status, Depends, Query
+from fastapi import (
+    APIRouter, BackgroundTasks, UploadFile, File, HTTPException, status, Depends, Query
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 # Group 3: First-party modules
 from database.config import get_db
 from database import crud
+from database.fts import render_snippet
 from schemas.user import UserInDB
-from schemas.audio_submission import AudioSubmissionCreate, AudioSubmissionResponse
+from schemas.audio_submission import (
+    AudioSubmissionCreate,
+    AudioSubmissionResponse,
+    TranscriptionGrammarResponse,
+    TranscriptionSearchResult,
+)
 from services.auth_service import get_current_user
+from services.exports import TRANSCRIPT_EXPORT_FORMATS, export_transcripts
+from services.rate_limiter import (
+    api_key,
+    enforce_request_rate_limit,
+    raise_if_limited,
+    rate_limiter,
+)
+from services.transcript_grammar import (
+    GRAMMAR_PENDING,
+    run_transcript_grammar_check,
+    should_check_grammar,
+)
+from utils.audio_utils import get_audio_duration_seconds
 from utils.whisper_transcriber import transcribe_audio_with_whisper
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(enforce_request_rate_limit)])
 TEMP_AUDIO_DIR = "temp_audio"
 os.makedirs(TEMP_AUDIO_DIR, exist_ok=True)
 
@@ -28,11 +50,14 @@ os.makedirs(TEMP_AUDIO_DIR, exist_ok=True)
 async def _process_audio_for_transcription(
     audio_file: UploadFile,
     db: Session,
-    current_user: UserInDB
+    current_user: UserInDB,
+    background_tasks: BackgroundTasks,
+    grammar_check: Optional[bool] = None,
 ) -> AudioSubmissionResponse:
     """
     Handles the common logic for processing an uploaded audio file,
     transcribing it, saving the submission to the DB, and cleaning up.
+    If requested, the transcript's grammar check is scheduled to run after the response.
     """
     # C0301: Line too long - Corrected by splitting the list
     allowed_audio_types = [
@@ -56,6 +81,16 @@ async def _process_audio_for_transcription(
         with open(temp_file_path, "wb") as file_object:
             file_object.write(await audio_file.read())
 
+        # Charge the audio length before any transcription work is done.
+        raise_if_limited(
+            rate_limiter.acquire(
+                api_key(current_user.username),
+                requests=0,
+                audio_seconds=get_audio_duration_seconds(temp_file_path),
+            ),
+            "Audio transcription quota exceeded. Please try again later.",
+        )
+
         transcription_result = transcribe_audio_with_whisper(temp_file_path)
         transcribed_text = transcription_result.get("text", "Transcription not available.")
         detected_language = transcription_result.get("language", "unknown")
@@ -66,19 +101,30 @@ async def _process_audio_for_transcription(
                 detail=f"Transcription failed: {transcribed_text}"
             )
 
+        check_grammar = should_check_grammar(grammar_check)
         audio_submission_create = AudioSubmissionCreate(
             audio_path=temp_file_path,
             original_transcript=transcribed_text,
-            language=detected_language
+            language=detected_language,
+            grammar_status=GRAMMAR_PENDING if check_grammar else None,
         )
         # C0301: Line too long - Corrected by splitting the function call
         db_submission = crud.create_audio_submission(
             db=db, submission=audio_submission_create, user_id=current_user.id
         )
+        if check_grammar:
+            background_tasks.add_task(
+                run_transcript_grammar_check,
+                db_submission.id,
+                transcribed_text,
+                detected_language,
+            )
 
         response_data = AudioSubmissionResponse.model_validate(db_submission)
         return response_data
 
+    except HTTPException:
+        raise
     # W0707: Consider explicitly re-raising - Corrected (already addressed in prior versions)
     except Exception as exc:
         if os.path.exists(temp_file_path):
@@ -99,9 +145,14 @@ async def _process_audio_for_transcription(
     summary="Transcribe recorded audio and save as submission"
 )
 async def transcribe_recorded_audio_endpoint(
+    background_tasks: BackgroundTasks,
     audio_file: UploadFile = File(...),
     db: Session = Depends(get_db),
-    current_user: UserInDB = Depends(get_current_user)
+    current_user: UserInDB = Depends(get_current_user),
+    grammar_check: Optional[bool] = Query(
+        None, description="Check the transcript's grammar in the background "
+        "(defaults to the AUTO_GRAMMAR_CHECK setting)."
+    ),
 ):
     """
     Handles the transcription of a recorded audio file.
@@ -110,7 +161,9 @@ async def transcribe_recorded_audio_endpoint(
     Transcribes the audio, saves the submission to the database,
     and returns the transcription details.
     """
-    return await _process_audio_for_transcription(audio_file, db, current_user)
+    return await _process_audio_for_transcription(
+        audio_file, db, current_user, background_tasks, grammar_check
+    )
 
 
 @router.post(
@@ -120,9 +173,14 @@ async def transcribe_recorded_audio_endpoint(
     summary="Upload an audio file and transcribe it"
 )
 async def upload_and_transcribe_audio_endpoint(
+    background_tasks: BackgroundTasks,
     audio_file: UploadFile = File(...),
     db: Session = Depends(get_db),
-    current_user: UserInDB = Depends(get_current_user)
+    current_user: UserInDB = Depends(get_current_user),
+    grammar_check: Optional[bool] = Query(
+        None, description="Check the transcript's grammar in the background "
+        "(defaults to the AUTO_GRAMMAR_CHECK setting)."
+    ),
 ):
     """
     Handles the upload and transcription of an audio file.
@@ -130,7 +188,9 @@ async def upload_and_transcribe_audio_endpoint(
     This endpoint is largely similar to /transcribe-audio but
     can be used for direct file uploads.
     """
-    return await _process_audio_for_transcription(audio_file, db, current_user)
+    return await _process_audio_for_transcription(
+        audio_file, db, current_user, background_tasks, grammar_check
+    )
 
 
 @router.get(
@@ -168,6 +228,118 @@ def get_user_transcriptions(
     return [AudioSubmissionResponse.model_validate(s) for s in submissions]
 
 
+@router.get(
+    "/search",
+    response_model=List[TranscriptionSearchResult],
+    summary="Search the current user's transcriptions",
+    description=(
+        "Full-text search over the user's transcripts, best matches first. Every word "
+        "must occur (also as the start of a longer word); matches are highlighted in "
+        "the snippets with <mark> tags."
+    ),
+)
+def search_user_transcriptions(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to search for."),
+    language: Optional[str] = Query(None, description="Only transcriptions in this language."),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results."),
+    db: Session = Depends(get_db),
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Searches the transcriptions of the current user.
+
+    Args:
+        q (str): The words to search for.
+        language (Optional[str]): Language filter (e.g. 'ru').
+        limit (int): Maximum number of results.
+        db (Session): Database session dependency.
+        current_user (UserInDB): Authenticated user dependency.
+
+    Returns:
+        list[TranscriptionSearchResult]: Matching transcriptions with snippets.
+    """
+    rows = crud.search_audio_submissions(
+        db, current_user.id, q, language=language, limit=limit
+    )
+    return [
+        TranscriptionSearchResult(
+            id=row.id,
+            created_at=row.created_at,
+            language=row.language,
+            snippet=render_snippet(row.snippet, "<mark>", "</mark>"),
+            score=-row.rank,
+        )
+        for row in rows
+    ]
+
+
+@router.get(
+    "/export",
+    summary="Export all audio transcriptions of the current user",
+    response_class=StreamingResponse,
+)
+def export_user_transcriptions(
+    export_format: str = Query(
+        "ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson or csv."
+    ),
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Streams every transcription of the current user as NDJSON or CSV.
+
+    Args:
+        export_format (str): 'ndjson' or 'csv'.
+        current_user (UserInDB): Authenticated user dependency.
+
+    Returns:
+        StreamingResponse: The export file, sent in chunks.
+    """
+    media_type, extension = TRANSCRIPT_EXPORT_FORMATS[export_format]
+    return StreamingResponse(
+        export_transcripts(current_user.id, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="transcriptions.{extension}"'},
+    )
+
+
+@router.get(
+    "/transcriptions/{transcription_id}/grammar",
+    response_model=TranscriptionGrammarResponse,
+    summary="Get the automatic grammar check of a transcription"
+)
+def get_transcription_grammar(
+    transcription_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Returns the status and, once completed, the result of the grammar check
+    that ran on a transcription after it was created.
+
+    Args:
+        transcription_id (int): The ID of the transcription.
+        db (Session): Database session dependency.
+        current_user (UserInDB): Authenticated user dependency.
+
+    Returns:
+        TranscriptionGrammarResponse: The grammar check status and result.
+
+    Raises:
+        HTTPException: If the transcription is not found for the current user.
+    """
+    submission = crud.get_audio_submission(db, audio_id=transcription_id, user_id=current_user.id)
+    if not submission:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcription not found."
+        )
+    return TranscriptionGrammarResponse(
+        audio_id=submission.id,
+        grammar_status=submission.grammar_status,
+        grammar_result=submission.grammar_result,
+    )
+
+
 @router.delete(
     "/transcriptions/{transcription_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -5,20 +5,41 @@ This module defines the endpoint for submitting text for grammar correction,
 leveraging a dedicated grammar service and requiring user authentication.
 """
 # Group 1: Standard libraries
+import asyncio
 import logging
+import os
+from typing import Any, AsyncGenerator, Dict, List
 
 # Group 2: Third-party libraries
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 # Group 3: First-party modules
-from schemas.grammar import GrammarCheckRequest, GrammarCheckResponse
+from schemas.grammar import (
+    GrammarBatchRequest,
+    GrammarBatchResponse,
+    GrammarBackendStatus,
+    GrammarBatchStreamItem,
+    GrammarCacheStats,
+    GrammarCheckRequest,
+    GrammarCheckResponse,
+)
 from schemas.user import UserInDB
 from services.auth_service import get_current_user
+from services.rate_limiter import (
+    api_key,
+    charges_per_item,
+    enforce_request_rate_limit,
+    raise_if_limited,
+    rate_limiter,
+)
 from services.grammar_service import GrammarService
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+GRAMMAR_BATCH_CONCURRENCY = int(os.getenv("GRAMMAR_BATCH_CONCURRENCY", "8"))
+
+router = APIRouter(dependencies=[Depends(enforce_request_rate_limit)])
 
 grammar_service = GrammarService()
 
@@ -57,7 +78,7 @@ async def check_grammar(
 
     try:
         # Call the grammar service to process the text
-        correction_result = grammar_service.check_grammar(
+        correction_result = await grammar_service.check_grammar_async(
             text=request.text,
             language=request.language
         )
@@ -74,3 +95,120 @@ async def check_grammar(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred during grammar check."
         ) from exc
+
+
+@router.post(
+    "/check-batch",
+    response_model=GrammarBatchResponse,
+    summary="Check grammar of many texts at once",
+    description=(
+        "Checks a list of texts concurrently (with a bounded fan-out) and returns "
+        "the results in request order. With `stream=true` the results are sent as "
+        "NDJSON lines, in request order, as soon as each one is ready."
+    ),
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+@charges_per_item
+async def check_grammar_batch(
+    request: GrammarBatchRequest,
+    stream: bool = Query(False, description="Stream results as NDJSON lines."),
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Performs grammar checks for a batch of texts.
+    Requires authentication; every item counts against the request budget.
+
+    Args:
+        request (GrammarBatchRequest): The items to check.
+        stream (bool): Whether to stream the results as NDJSON.
+        current_user (UserInDB): The authenticated user.
+
+    Returns:
+        GrammarBatchResponse | StreamingResponse: The results in request order.
+    """
+    # One charge for the whole batch (capped at the bucket capacity, see charges_per_item).
+    raise_if_limited(
+        rate_limiter.acquire(api_key(current_user.username), requests=len(request.items))
+    )
+    logger.info(
+        "Received batch grammar check of %d items from user %s",
+        len(request.items), current_user.username
+    )
+
+    semaphore = asyncio.Semaphore(GRAMMAR_BATCH_CONCURRENCY)
+
+    async def check_item(item: GrammarCheckRequest) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return await grammar_service.check_grammar_async(
+                    text=item.text, language=item.language
+                )
+            except ValueError as exc:
+                # One rejected item (e.g. an unknown language) must not fail the batch.
+                return {
+                    "original_text": item.text,
+                    "corrected_text": item.text,
+                    "explanation": str(exc),
+                    "errors": [],
+                    "language": item.language,
+                }
+
+    tasks: List[asyncio.Task] = [
+        asyncio.create_task(check_item(item)) for item in request.items
+    ]
+
+    if stream:
+        async def ndjson_lines() -> AsyncGenerator[str, None]:
+            try:
+                for index, task in enumerate(tasks):
+                    line = GrammarBatchStreamItem(index=index, **await task)
+                    yield line.model_dump_json() + "\n"
+            finally:
+                # Client went away: stop the checks that are still pending.
+                for task in tasks:
+                    task.cancel()
+
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+    results = await asyncio.gather(*tasks)
+    return GrammarBatchResponse(results=[GrammarCheckResponse(**result) for result in results])
+
+
+@router.get(
+    "/cache/stats",
+    response_model=GrammarCacheStats,
+    summary="Get grammar result cache statistics",
+)
+async def get_grammar_cache_stats(
+    _current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Returns size, limits and hit statistics of the grammar result cache.
+
+    Args:
+        _current_user (UserInDB): The authenticated user.
+
+    Returns:
+        GrammarCacheStats: The cache statistics.
+    """
+    return GrammarCacheStats(**grammar_service.cache_stats())
+
+
+@router.get(
+    "/backends",
+    response_model=List[GrammarBackendStatus],
+    summary="Get LanguageTool backend status",
+)
+async def get_grammar_backends(
+    _current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Returns health, circuit breaker state and load of each LanguageTool backend.
+
+    Args:
+        _current_user (UserInDB): The authenticated user.
+
+    Returns:
+        List[GrammarBackendStatus]: One entry per configured backend.
+    """
+    return [GrammarBackendStatus(**backend) for backend in grammar_service.backend_stats()]
@@ -6,28 +6,48 @@ creating, retrieving, and deleting vocabulary items for authenticated users.
 """
 # Group 1: Standard libraries
 import logging
-from typing import List
+from typing import List, Optional
 
 # Group 2: Third-party libraries
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 # Group 3: First-party modules
 from schemas.vocabulary_item import (
+    TranslationMemoryInvalidationResponse,
+    TranslationMemoryStats,
+    TranslationModelStats,
+    VocabularyBatchSuggestionRequest,
+    VocabularyBatchSuggestionResponse,
+    VocabularyImportSummary,
     VocabularyItemCreate,
     VocabularyItemResponse,
     VocabularySuggestionRequest,
     VocabularySuggestionResponse
 )
 from schemas.user import UserInDB
-from services.auth_service import get_current_user
+from services.auth_service import get_current_admin_user, get_current_user
+from services.exports import VOCABULARY_EXPORT_FORMATS, export_vocabulary
+from services.rate_limiter import (
+    api_key,
+    charges_per_item,
+    enforce_request_rate_limit,
+    raise_if_limited,
+    rate_limiter,
+)
+from services.translation_memory import translation_memory
+from services.vocabulary_import import IMPORT_FORMATS, detect_format, import_vocabulary
 from services.vocabulary_nlp_service import VocabularyNLPService
 from database import crud
 from database.config import get_db
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(enforce_request_rate_limit)])
 
 nlp_service = VocabularyNLPService()
 
@@ -59,13 +79,51 @@ async def suggest_translation(
         "User %s requesting suggestion for '%s'", current_user.username, request.russian_word
         )
 
-    suggestion = nlp_service.suggest_translation_and_comment(
+    suggestion = await nlp_service.suggest_translation_and_comment_async(
         russian_word=request.russian_word,
         target_language=request.target_language
     )
 
     return suggestion
 
+@router.post(
+    "/suggest-translations",
+    response_model=VocabularyBatchSuggestionResponse,
+    summary="Suggest translations for many Russian words at once",
+    description=(
+        "Translates a list of words, grouped by target language and run through "
+        "the model in padded batches. Results are returned in request order."
+    ),
+)
+@charges_per_item
+async def suggest_translations(
+    request: VocabularyBatchSuggestionRequest,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Suggests translations and example sentences for a batch of Russian words.
+    Every item counts against the request budget.
+
+    Args:
+        request (VocabularyBatchSuggestionRequest): The words and their target languages.
+        current_user (UserInDB): The authenticated user.
+
+    Returns:
+        VocabularyBatchSuggestionResponse: One suggestion per word, in request order.
+    """
+    # One charge for the whole batch (capped at the bucket capacity, see charges_per_item).
+    raise_if_limited(
+        rate_limiter.acquire(api_key(current_user.username), requests=len(request.items))
+    )
+    logger.info(
+        "User %s requesting suggestions for %d words", current_user.username, len(request.items)
+    )
+
+    results = await nlp_service.suggest_translations_batch_async(
+        [(item.russian_word, item.target_language) for item in request.items]
+    )
+    return VocabularyBatchSuggestionResponse(results=results)
+
 @router.post(
     "/",
     response_model=VocabularyItemResponse,
@@ -82,7 +140,8 @@ async def create_vocabulary_item(
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
-    Create a new vocabulary item for the authenticated user.
+    Create a new vocabulary item for the authenticated user, or update the
+    translation and example of the user's item with exactly the same word.
 
     Args:
         item (VocabularyItemCreate): The data for the new vocabulary item.
@@ -90,31 +149,226 @@ async def create_vocabulary_item(
         current_user (UserInDB): Authenticated user dependency.
 
     Returns:
-        VocabularyItemResponse: The newly created vocabulary item details.
+        VocabularyItemResponse: The created or updated vocabulary item details.
+
+    Raises:
+        HTTPException: 409 if the user already has another inflected form of the word.
+    """
+    db_item = crud.create_vocabulary_item(db=db, item=item, user_id=current_user.id)
+    if db_item is None:
+        # Only rejected creations look the other form up, for the message.
+        existing = crud.get_vocabulary_item_by_lemma(db, current_user.id, item.russian_word)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                f"'{existing.russian_word}' is already in your vocabulary (item {existing.id})."
+                if existing else "Another form of this word is already in your vocabulary."
+            )
+        )
+    return db_item
+
+@router.post(
+    "/import",
+    response_model=VocabularyImportSummary,
+    summary="Import a vocabulary list",
+    description=(
+        "Imports vocabulary items from a CSV, TSV (e.g. an Anki plain-text export) or "
+        "JSON lines file. Columns are russian_word, translation and example_sentence, "
+        "named in a header row or in that order. Words the user already has are skipped."
+    ),
+)
+async def import_vocabulary_items(
+    file: UploadFile = File(...),
+    import_format: Optional[str] = Query(
+        None, alias="format", description="csv, tsv or jsonl (default: from the file name)."
+    ),
+    db: Session = Depends(get_db),
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Bulk-import vocabulary items for the authenticated user.
+
+    Args:
+        file (UploadFile): The vocabulary file.
+        import_format (Optional[str]): The file format, if not given by its extension.
+        db (Session): Database session dependency.
+        current_user (UserInDB): Authenticated user dependency.
+
+    Returns:
+        VocabularyImportSummary: Counts of imported, duplicate and rejected rows.
+
+    Raises:
+        HTTPException: 400 if the format is unknown.
+    """
+    resolved_format = detect_format(file.filename, import_format)
+    if resolved_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported import format; use one of: {', '.join(IMPORT_FORMATS)}."
+        )
+    logger.info(
+        "User %s importing vocabulary from '%s' (%s)",
+        current_user.username, file.filename, resolved_format
+    )
+    # Parsing and inserts are blocking; the upload is already spooled to disk.
+    summary = await run_in_threadpool(
+        import_vocabulary, db, current_user.id, file.file, resolved_format
+    )
+    return VocabularyImportSummary(**summary)
+
+@router.get(
+    "/export",
+    summary="Export the vocabulary",
+    description=(
+        "Streams the user's vocabulary as NDJSON, CSV or an Anki-compatible "
+        "tab-separated text file."
+    ),
+    response_class=StreamingResponse,
+)
+async def export_vocabulary_items(
+    export_format: str = Query(
+        "ndjson", alias="format", pattern="^(ndjson|csv|anki)$", description="ndjson, csv or anki."
+    ),
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Export the authenticated user's vocabulary as a streamed file.
+
+    Args:
+        export_format (str): 'ndjson', 'csv' or 'anki'.
+        current_user (UserInDB): Authenticated user dependency.
+
+    Returns:
+        StreamingResponse: The export file, sent in chunks.
     """
-    return crud.create_vocabulary_item(db=db, item=item, user_id=current_user.id)
+    media_type, extension = VOCABULARY_EXPORT_FORMATS[export_format]
+    return StreamingResponse(
+        export_vocabulary(current_user.id, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="vocabulary.{extension}"'},
+    )
 
 @router.get(
     "/",
     response_model=List[VocabularyItemResponse],
-    summary="Get all vocabulary items for the current user",
-    description="Retrieves all vocabulary items associated with the authenticated user.",
+    summary="Get the vocabulary items of the current user",
+    description=(
+        "Retrieves the authenticated user's vocabulary items, newest first, one page "
+        "at a time. Pass the X-Next-Cursor response header as `cursor` to get the next "
+        "page; `q` filters by a fragment of the word or its translation."
+    ),
 )
 async def get_user_vocabulary_items(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of items to return."),
+    cursor: Optional[int] = Query(
+        None, ge=1, description="Cursor from the previous page's X-Next-Cursor header."
+    ),
+    q: Optional[str] = Query(
+        None, max_length=100, description="Only items whose word or translation contains this."
+    ),
     db: Session = Depends(get_db),
     current_user: UserInDB = Depends(get_current_user)
 ):
     """
-    Retrieve all vocabulary items belonging to the current user.
+    Retrieve one page of the vocabulary items belonging to the current user.
 
     Args:
+        response (Response): The response, to set the X-Next-Cursor header on.
+        limit (int): Maximum number of items to return.
+        cursor (Optional[int]): Cursor of the page to return (None for the first page).
+        q (Optional[str]): Search text.
         db (Session): Database session dependency.
         current_user (UserInDB): Authenticated user dependency.
 
     Returns:
-        list[VocabularyItemResponse]: A list of vocabulary items for the user.
+        list[VocabularyItemResponse]: A page of vocabulary items for the user.
+    """
+    items, has_more = crud.get_vocabulary_page(
+        db, user_id=current_user.id, limit=limit, before_id=cursor, query=q
+    )
+    if has_more:
+        response.headers["X-Next-Cursor"] = str(items[-1].id)
+    return items
+
+@router.get(
+    "/translation-memory/stats",
+    response_model=TranslationMemoryStats,
+    summary="Get translation memory hit statistics",
+)
+async def get_translation_memory_stats(
+    _admin: UserInDB = Depends(get_current_admin_user)
+):
+    """
+    Returns how many translation lookups were answered without model inference.
+    Requires an administrator.
+
+    Args:
+        _admin (UserInDB): The authenticated administrator.
+
+    Returns:
+        TranslationMemoryStats: The hit statistics.
     """
-    return crud.get_vocabulary_items_by_user(db=db, user_id=current_user.id)
+    return TranslationMemoryStats(**translation_memory.stats())
+
+@router.get(
+    "/translation-models",
+    response_model=TranslationModelStats,
+    summary="Get resident translation models",
+)
+async def get_translation_models(
+    _admin: UserInDB = Depends(get_current_admin_user)
+):
+    """
+    Returns the translation models currently in memory, their load times and
+    the memory budget. Requires an administrator.
+
+    Args:
+        _admin (UserInDB): The authenticated administrator.
+
+    Returns:
+        TranslationModelStats: The model manager state.
+    """
+    return TranslationModelStats(**nlp_service.model_stats())
+
+@router.delete(
+    "/translation-memory",
+    response_model=TranslationMemoryInvalidationResponse,
+    summary="Invalidate stored translations",
+    description=(
+        "Deletes shared translations matching all given filters (all of them if none "
+        "is given), e.g. after a translation model has been replaced."
+    ),
+)
+async def invalidate_translation_memory(
+    target_language: Optional[str] = Query(None, description="Only this target language."),
+    russian_word: Optional[str] = Query(None, description="Only this Russian word."),
+    model_name: Optional[str] = Query(None, description="Only translations by this model."),
+    admin: UserInDB = Depends(get_current_admin_user)
+):
+    """
+    Invalidates translation memory entries. Requires an administrator.
+
+    Args:
+        target_language (Optional[str]): Only entries for this language.
+        russian_word (Optional[str]): Only entries for this word.
+        model_name (Optional[str]): Only entries produced by this model.
+        admin (UserInDB): The authenticated administrator.
+
+    Returns:
+        TranslationMemoryInvalidationResponse: The number of deleted entries.
+    """
+    logger.info(
+        "Admin %s invalidating translation memory (language=%s, word=%s, model=%s)",
+        admin.username, target_language, russian_word, model_name
+    )
+    deleted = await run_in_threadpool(
+        translation_memory.invalidate,
+        target_language=target_language,
+        russian_word=russian_word,
+        model_name=model_name,
+    )
+    return TranslationMemoryInvalidationResponse(deleted=deleted)
 
 @router.delete(
     "/{item_id}",
@@ -11,6 +11,9 @@ from typing import Optional # Corrected import order (C0411)
 # Group 2: Third-party libraries
 from pydantic import BaseModel, ConfigDict # Removed unused 'Field' import (W0611)
 
+# Group 3: First-party modules
+from schemas.grammar import GrammarCheckResponse
+
 class AudioSubmissionCreate(BaseModel):
     """
     Schema for creating a new audio submission.
@@ -19,10 +22,13 @@ class AudioSubmissionCreate(BaseModel):
         audio_path (str): The file path where the audio is stored.
         original_transcript (str): The transcribed text from the audio.
         language (Optional[str]): The detected language of the audio/transcript.
+        grammar_status (Optional[str]): 'pending' if an automatic grammar check
+            of the transcript has been scheduled.
     """
     audio_path: str
     original_transcript: str
     language: Optional[str] = None # No trailing whitespace here (C0303)
+    grammar_status: Optional[str] = None
 
     # Pydantic v2+ configuration for ORM mode
     model_config = ConfigDict(from_attributes=True)
@@ -39,6 +45,8 @@ class AudioSubmissionResponse(BaseModel):
         original_transcript (str): The transcribed text from the audio.
         created_at (Optional[datetime]): Timestamp when the submission was created.
         language (Optional[str]): The detected language of the audio/transcript.
+        grammar_status (Optional[str]): State of the automatic grammar check
+            ('pending', 'completed' or 'failed'), or None if it was not requested.
     """
     id: int
     user_id: int
@@ -46,6 +54,40 @@ class AudioSubmissionResponse(BaseModel):
     original_transcript: str
     created_at: Optional[datetime] = None
     language: Optional[str] = None # No trailing whitespace here (C0303)
+    grammar_status: Optional[str] = None
 
     # Pydantic v2+ configuration for ORM mode
     model_config = ConfigDict(from_attributes=True)
+
+
+class TranscriptionGrammarResponse(BaseModel):
+    """
+    Schema for the automatic grammar check of a transcription.
+
+    Attributes:
+        audio_id (int): The ID of the audio submission.
+        grammar_status (Optional[str]): 'pending', 'completed' or 'failed',
+            or None if no check was requested.
+        grammar_result (Optional[GrammarCheckResponse]): The check result, once completed.
+    """
+    audio_id: int
+    grammar_status: Optional[str] = None
+    grammar_result: Optional[GrammarCheckResponse] = None
+
+
+class TranscriptionSearchResult(BaseModel):
+    """
+    Schema for one transcription found by full-text search.
+
+    Attributes:
+        id (int): The ID of the audio submission.
+        created_at (Optional[datetime]): When the transcription was created.
+        language (Optional[str]): The detected language.
+        snippet (str): HTML-escaped excerpt with matches wrapped in <mark> tags.
+        score (float): Relevance (bm25, higher is better).
+    """
+    id: int
+    created_at: Optional[datetime] = None
+    language: Optional[str] = None
+    snippet: str
+    score: float
@@ -76,3 +76,89 @@ class GrammarCheckResponse(BaseModel):
         description="A list of detailed grammar errors found."
     )
     language: str = Field(..., description="The language of the processed text.")
+
+
+class GrammarBatchRequest(BaseModel):
+    """
+    Schema for a batch grammar check request.
+
+    Attributes:
+        items (List[GrammarCheckRequest]): The texts to check, each with its language.
+    """
+    items: List[GrammarCheckRequest] = Field(
+        ..., min_length=1, max_length=1000,
+        description="The texts to check, each with its language (at most 1000).",
+    )
+
+
+class GrammarBatchResponse(BaseModel):
+    """
+    Schema for a batch grammar check response.
+
+    Attributes:
+        results (List[GrammarCheckResponse]): One result per request item, in request order.
+    """
+    results: List[GrammarCheckResponse] = Field(
+        default_factory=list,
+        description="One result per request item, in request order.",
+    )
+
+
+class GrammarBatchStreamItem(GrammarCheckResponse):
+    """
+    Schema for one line of a streamed (NDJSON) batch grammar check response.
+
+    Attributes:
+        index (int): Position of the corresponding item in the request.
+    """
+    index: int = Field(..., description="Position of the corresponding item in the request.")
+
+
+class GrammarCacheStats(BaseModel):
+    """
+    Schema for the grammar result cache statistics.
+
+    Attributes:
+        size (int): Number of cached results.
+        max_entries (int): Maximum number of cached results.
+        ttl_seconds (Optional[float]): Lifetime of a cached result.
+        max_text_length (int): Longest text whose result is cached.
+        sentence_cache_size (int): Number of sentences with cached LanguageTool matches.
+        sentence_cache_hit_rate (float): Fraction of sentences served from the sentence cache.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that went to LanguageTool.
+        hit_rate (float): Fraction of lookups answered from the cache.
+        evictions (int): Entries dropped to respect ``max_entries``.
+        expirations (int): Entries dropped because their TTL elapsed.
+        server_version (Optional[str]): LanguageTool version the cached results come from.
+    """
+    size: int
+    max_entries: int
+    ttl_seconds: Optional[float] = None
+    max_text_length: int
+    sentence_cache_size: int
+    sentence_cache_hit_rate: float
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    expirations: int
+    server_version: Optional[str] = None
+
+
+class GrammarBackendStatus(BaseModel):
+    """
+    Schema for the routing state of one LanguageTool backend.
+
+    Attributes:
+        url (str): The backend server URL.
+        healthy (bool): Result of the latest health check.
+        circuit (str): Circuit breaker state: 'closed', 'open' or 'half_open'.
+        outstanding (int): Requests currently in flight to this backend.
+        p95_latency_ms (Optional[float]): 95th percentile of recent request latency.
+    """
+    url: str
+    healthy: bool
+    circuit: str
+    outstanding: int
+    p95_latency_ms: Optional[float] = None
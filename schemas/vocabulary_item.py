@@ -6,10 +6,10 @@ and suggesting vocabulary items, including words, translations,
 and example sentences.
 """
 # Group 1: Standard libraries
-from typing import Optional # Corrected import order (C0411)
+from typing import List, Optional # Corrected import order (C0411)
 
 # Group 2: Third-party libraries
-from pydantic import BaseModel, ConfigDict # Corrected import order (C0411)
+from pydantic import BaseModel, ConfigDict, Field # Corrected import order (C0411)
 
 class VocabularyItemBase(BaseModel):
     """
@@ -78,3 +78,130 @@ class VocabularySuggestionResponse(BaseModel):
     russian_word: str
     suggested_translation: str
     suggested_example_sentence: Optional[str] = None
+
+
+class VocabularyBatchSuggestionRequest(BaseModel):
+    """
+    Schema for a batch vocabulary suggestion request.
+
+    Attributes:
+        items (List[VocabularySuggestionRequest]): The words, each with its target language.
+    """
+    items: List[VocabularySuggestionRequest] = Field(
+        ..., min_length=1, max_length=500,
+        description="The words to translate, each with its target language (at most 500).",
+    )
+
+
+class VocabularyBatchSuggestionResponse(BaseModel):
+    """
+    Schema for a batch vocabulary suggestion response.
+
+    Attributes:
+        results (List[VocabularySuggestionResponse]): One suggestion per item, in request order.
+    """
+    results: List[VocabularySuggestionResponse]
+
+
+class TranslationMemoryStats(BaseModel):
+    """
+    Schema for translation memory hit statistics.
+
+    Attributes:
+        lookups (int): Words looked up since startup.
+        cache_hits (int): Lookups answered by the in-process LRU.
+        db_hits (int): Lookups answered by the database table.
+        misses (int): Lookups that needed model inference.
+        hit_rate (float): Fraction of lookups answered without inference.
+        cache_size (int): Entries currently held by the LRU.
+        cache_max_entries (int): Capacity of the LRU.
+    """
+    lookups: int
+    cache_hits: int
+    db_hits: int
+    misses: int
+    hit_rate: float
+    cache_size: int
+    cache_max_entries: int
+
+
+class TranslationMemoryInvalidationResponse(BaseModel):
+    """
+    Schema for the result of a translation memory invalidation.
+
+    Attributes:
+        deleted (int): Number of stored translations removed.
+    """
+    deleted: int
+
+
+class TranslationModelStatus(BaseModel):
+    """
+    Schema for a resident translation model.
+
+    Attributes:
+        target_language (str): The target language served by the model.
+        model_name (str): The Hugging Face model name.
+        size_mb (float): Estimated size of the model weights.
+        load_seconds (float): Time it took to load the model.
+        loaded_at (float): Unix timestamp of the load.
+        last_used (float): Unix timestamp of the last use.
+    """
+    target_language: str
+    model_name: str
+    size_mb: float
+    load_seconds: float
+    loaded_at: float
+    last_used: float
+
+
+class TranslationModelStats(BaseModel):
+    """
+    Schema for the translation model manager state.
+
+    Attributes:
+        engine (str): The inference engine ('pytorch' or 'onnx').
+        memory_budget_mb (float): Budget for resident model weights.
+        resident_mb (float): Estimated size of the resident models.
+        loads (int): Models loaded since startup.
+        evictions (int): Models evicted to respect the budget.
+        models (List[TranslationModelStatus]): Resident models, least recently used first.
+    """
+    engine: str
+    memory_budget_mb: float
+    resident_mb: float
+    loads: int
+    evictions: int
+    models: List[TranslationModelStatus]
+
+
+class VocabularyImportError(BaseModel):
+    """
+    Schema for a row that could not be imported.
+
+    Attributes:
+        row (int): The row (or line) number in the file, starting at 1.
+        error (str): Why the row was rejected.
+    """
+    row: int
+    error: str
+
+
+class VocabularyImportSummary(BaseModel):
+    """
+    Schema for the result of a bulk vocabulary import.
+
+    Attributes:
+        total_rows (int): Non-empty rows read from the file.
+        imported (int): Items created.
+        duplicates (int): Rows skipped because the word already exists.
+        failed (int): Rows rejected by validation.
+        errors (List[VocabularyImportError]): The first rejected rows.
+        errors_truncated (bool): Whether more rows failed than are listed.
+    """
+    total_rows: int
+    imported: int
+    duplicates: int
+    failed: int
+    errors: List[VocabularyImportError]
+    errors_truncated: bool
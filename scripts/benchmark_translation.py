@@ -0,0 +1,103 @@
+"""
+Compares the PyTorch and ONNX Runtime translation engines.
+
+Translates the same Russian words with each engine, in single-word calls and in
+batches, and reports load time, p50/p95 latency, throughput, process memory growth
+and how many translations differ from the PyTorch output.
+
+Usage:
+    python scripts/benchmark_translation.py [--language en] [--batch-size 32] [--rounds 3]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+import psutil
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from services.translation_models import LOADERS, TRANSLATION_MODELS
+
+WORDS = [
+    "дом", "кошка", "собака", "книга", "вода", "город", "улица", "машина", "школа",
+    "учитель", "работа", "время", "друг", "семья", "море", "солнце", "дерево", "хлеб",
+    "молоко", "окно", "дверь", "стол", "язык", "слово", "вопрос", "ответ", "жизнь",
+    "погода", "утро", "вечер", "ночь", "зима",
+]
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))]
+
+
+def benchmark_engine(engine: str, model_name: str, batch_size: int, rounds: int) -> Dict:
+    """Loads ``model_name`` with ``engine`` and measures single and batched translation."""
+    process = psutil.Process()
+    rss_before = process.memory_info().rss
+    started = time.perf_counter()
+    translation_pipeline = LOADERS[engine](model_name, True)
+    load_seconds = time.perf_counter() - started
+    translation_pipeline(WORDS[0])  # warm-up
+
+    latencies = []
+    for _ in range(rounds):
+        for word in WORDS:
+            started = time.perf_counter()
+            translation_pipeline(word)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        outputs = translation_pipeline(WORDS, batch_size=batch_size, truncation=True)
+    batch_seconds = time.perf_counter() - started
+
+    return {
+        "load_s": load_seconds,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "words_per_s": rounds * len(WORDS) / batch_seconds,
+        "rss_mb": (process.memory_info().rss - rss_before) / 1024 / 1024,
+        "translations": [output["translation_text"] for output in outputs],
+    }
+
+
+def main() -> None:
+    """Runs the benchmark for both engines and prints a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--language", default="en", choices=sorted(TRANSLATION_MODELS))
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    model_name = TRANSLATION_MODELS[args.language]
+    results = {
+        engine: benchmark_engine(engine, model_name, args.batch_size, args.rounds)
+        for engine in ("pytorch", "onnx")
+    }
+    print(f"{model_name}, {len(WORDS)} words x {args.rounds} rounds")
+    print(f"{'engine':<8} {'load s':>7} {'p50 ms':>7} {'p95 ms':>7} {'words/s':>8} {'+RSS MB':>8}")
+    for engine, result in results.items():
+        print(
+            f"{engine:<8} {result['load_s']:>7.2f} {result['p50_ms']:>7.1f} "
+            f"{result['p95_ms']:>7.1f} {result['words_per_s']:>8.1f} {result['rss_mb']:>8.0f}"
+        )
+    differing = [
+        (word, reference, candidate)
+        for word, reference, candidate in zip(
+            WORDS, results["pytorch"]["translations"], results["onnx"]["translations"]
+        )
+        if reference != candidate
+    ]
+    print(f"Translations differing from PyTorch: {len(differing)}/{len(WORDS)}")
+    for word, reference, candidate in differing:
+        print(f"  {word}: {reference!r} != {candidate!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Builds the example sentence index used by ``services.example_sentences``.
+
+Input is a UTF-8 corpus with one Russian sentence per line, such as the bundled
+``data/corpus/ru_sentences.txt``. Every word is reduced to its lemma key, so build
+the index with the same morphology setup (pymorphy3 installed or not) as the API.
+
+Usage:
+    python scripts/build_example_index.py data/corpus/ru_sentences.txt data/ru_examples.idx
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from services.example_sentences import write_example_index
+
+
+def main() -> None:
+    """Reads the corpus and writes the inverted index."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("source", help="corpus (one sentence per line)")
+    parser.add_argument("output", help="index file to write")
+    args = parser.parse_args()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.source, encoding="utf-8") as source:
+        count = write_example_index(args.output, source)
+    print(f"Indexed {count} sentences in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
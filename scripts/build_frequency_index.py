@@ -0,0 +1,102 @@
+"""
+Builds the precomputed translation index used by ``services.frequency_index``.
+
+Input is a UTF-8 Russian frequency list, most frequent word first, with one word per
+line (anything after the first tab or space, such as a count, is ignored). The top
+words are batch-translated into every supported language (or the given ones) with
+the Marian models and written to one memory-mapped index file. The index records the
+model id (model and engine), so it is only served by an app running the same engine.
+
+Usage:
+    python scripts/build_frequency_index.py frequency.txt data/translation_freq.idx \\
+        [--top 20000] [--batch-size 64] [--languages en es] [--engine pytorch]
+"""
+
+import argparse
+import os
+import sys
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from services.frequency_index import write_frequency_index
+from services.morphology import source_text
+from services.translation_models import (
+    LOADERS,
+    TRANSLATION_ENGINE,
+    TRANSLATION_LOCAL_FILES_ONLY,
+    TRANSLATION_MODELS,
+    translation_model_id,
+)
+
+
+def read_frequency_list(path: str, top: int) -> List[str]:
+    """Returns the first ``top`` distinct words of the list, cleaned with ``source_text``."""
+    words: Dict[str, None] = {}
+    with open(path, encoding="utf-8") as source:
+        for line in source:
+            fields = line.split()
+            if not fields:
+                continue
+            word = source_text(fields[0])
+            if word and "\x00" not in word:
+                words[word] = None
+                if len(words) >= top:
+                    break
+    return list(words)
+
+
+def translate_words(
+    model_name: str, words: List[str], batch_size: int, engine: str
+) -> Dict[str, str]:
+    """Translates ``words`` with ``model_name`` on ``engine`` in length-sorted batches."""
+    translation_pipeline = LOADERS[engine](model_name, TRANSLATION_LOCAL_FILES_ONLY)
+    ordered = sorted(words, key=len)
+    translations: Dict[str, str] = {}
+    for start in range(0, len(ordered), batch_size):
+        chunk = ordered[start:start + batch_size]
+        results = translation_pipeline(chunk, batch_size=len(chunk), truncation=True)
+        translations.update(
+            (word, result["translation_text"]) for word, result in zip(chunk, results)
+        )
+        print(f"  {min(start + batch_size, len(ordered))}/{len(ordered)}", end="\r", flush=True)
+    print()
+    return translations
+
+
+def main() -> None:
+    """Reads the frequency list, translates it and writes the index."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("source", help="frequency list (one word per line, most frequent first)")
+    parser.add_argument("output", help="index file to write")
+    parser.add_argument("--top", type=int, default=20000, help="number of words to translate")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument(
+        "--languages", nargs="*", default=sorted(TRANSLATION_MODELS),
+        help="target languages (default: all)",
+    )
+    parser.add_argument(
+        "--engine", choices=sorted(LOADERS), default=TRANSLATION_ENGINE,
+        help="translation engine (default: TRANSLATION_ENGINE)",
+    )
+    args = parser.parse_args()
+
+    words = read_frequency_list(args.source, args.top)
+    translations = {}
+    models = {}
+    for language in args.languages:
+        model_name = TRANSLATION_MODELS[language]
+        models[language] = translation_model_id(model_name, args.engine)
+        print(f"{language}: translating {len(words)} words with {models[language]}")
+        translations[language] = translate_words(
+            model_name, words, args.batch_size, args.engine
+        )
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    count = write_frequency_index(args.output, translations, models)
+    print(f"Wrote {count} records to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Builds the Russian spelling dictionary used by ``services.spellchecker``.
+
+Input is a UTF-8 word-form list with one form per line, optionally followed by a tab
+and a corpus frequency (for example an expanded Hunspell dictionary or the word
+forms of the OpenCorpora dictionary). Forms are lower-cased; frequencies of forms
+that collapse together are added up.
+
+Usage:
+    python scripts/build_spell_index.py wordforms.txt data/ru_spell.idx
+"""
+
+import argparse
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.sorted_index import write_sorted_index  # pylint: disable=wrong-import-position
+
+
+def main() -> None:
+    """Reads the word list and writes the sorted index."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("source", help="word-form list (word[<TAB>frequency] per line)")
+    parser.add_argument("output", help="index file to write")
+    args = parser.parse_args()
+
+    frequencies: Counter = Counter()
+    with open(args.source, encoding="utf-8") as source:
+        for line in source:
+            word, _, frequency = line.rstrip("\n").partition("\t")
+            word = word.strip().lower()
+            if word and "\x00" not in word:
+                frequencies[word] += int(frequency) if frequency.strip().isdigit() else 1
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    count = write_sorted_index(
+        args.output, ((word, str(frequency)) for word, frequency in frequencies.items())
+    )
+    print(f"Wrote {count} word forms to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Downloads the translation models into the local Hugging Face cache.
+
+The API loads translation models with ``local_files_only`` (see
+``TRANSLATION_LOCAL_FILES_ONLY``), so run this once per environment, e.g. while
+building the image or before the first start.
+
+Usage:
+    python scripts/download_translation_models.py [language ...]
+"""
+
+import argparse
+import os
+import sys
+
+from huggingface_hub import snapshot_download
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.translation_models import TRANSLATION_MODELS  # pylint: disable=wrong-import-position
+
+
+def main() -> None:
+    """Downloads the models of the given (or all) target languages."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "languages", nargs="*", default=sorted(TRANSLATION_MODELS),
+        help="target languages to download (default: all)",
+    )
+    args = parser.parse_args()
+
+    for language in args.languages:
+        model_name = TRANSLATION_MODELS[language]
+        path = snapshot_download(model_name)
+        print(f"{language}: {model_name} -> {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Exports the translation models to ONNX and quantizes them to int8.
+
+Each model is exported with its encoder, decoder and cached-decoder
+(``decoder_with_past``) graphs, the graphs are dynamically quantized to int8 for
+CPU inference, and the tokenizer is saved alongside, into
+``TRANSLATION_ONNX_DIR/<model>`` where ``TRANSLATION_ENGINE=onnx`` loads them.
+Requires the optional ``optimum`` and ``onnxruntime`` packages.
+
+Usage:
+    python scripts/export_onnx_models.py [--avx512] [language ...]
+"""
+
+import argparse
+import glob
+import os
+import shutil
+import sys
+import tempfile
+
+from optimum.onnxruntime import ORTModelForSeq2SeqLM, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from transformers import AutoTokenizer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from services.translation_models import TRANSLATION_MODELS, onnx_model_dir
+
+
+def export_model(model_name: str, output_dir: str, avx512: bool) -> None:
+    """Exports ``model_name`` to ONNX and writes its int8-quantized graphs to ``output_dir``."""
+    with tempfile.TemporaryDirectory() as export_dir:
+        model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True, use_cache=True)
+        model.save_pretrained(export_dir)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+        config = (
+            AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            if avx512 else AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+        )
+        os.makedirs(output_dir, exist_ok=True)
+        for onnx_path in sorted(glob.glob(os.path.join(export_dir, "*.onnx"))):
+            quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=os.path.basename(onnx_path))
+            quantizer.quantize(save_dir=output_dir, quantization_config=config)
+
+        # Quantized graphs are saved as '<name>_quantized.onnx'; keep the names the loader expects.
+        for quantized_path in glob.glob(os.path.join(output_dir, "*_quantized.onnx")):
+            os.replace(quantized_path, quantized_path.replace("_quantized.onnx", ".onnx"))
+        for config_file in ("config.json", "generation_config.json"):
+            if os.path.exists(os.path.join(export_dir, config_file)):
+                shutil.copy(os.path.join(export_dir, config_file), output_dir)
+        tokenizer.save_pretrained(output_dir)
+
+
+def main() -> None:
+    """Exports the models of the given (or all) target languages."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "languages", nargs="*", default=sorted(TRANSLATION_MODELS),
+        help="target languages to export (default: all)",
+    )
+    parser.add_argument(
+        "--avx512", action="store_true",
+        help="quantize for AVX-512 VNNI CPUs instead of AVX2",
+    )
+    args = parser.parse_args()
+
+    for language in args.languages:
+        model_name = TRANSLATION_MODELS[language]
+        output_dir = onnx_model_dir(model_name)
+        export_model(model_name, output_dir, args.avx512)
+        print(f"{language}: {model_name} -> {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,6 +31,10 @@ SECRET_KEY = os.getenv("SECRET_KEY", "your_super_secret_key_change_me")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 # Ensure conversion to int for ACCESS_TOKEN_EXPIRE_MINUTES
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+# Comma-separated usernames allowed to use administrative endpoints.
+ADMIN_USERNAMES = {
+    name.strip() for name in os.getenv("ADMIN_USERNAMES", "").split(",") if name.strip()
+}
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/token")
 
@@ -121,3 +125,26 @@ async def get_current_user(
     if user is None:
         raise credentials_exception
     return UserInDB.model_validate(user)
+
+
+async def get_current_admin_user(
+    current_user: UserInDB = Depends(get_current_user)
+) -> UserInDB:
+    """
+    Dependency that only lets users listed in ``ADMIN_USERNAMES`` through.
+
+    Args:
+        current_user (UserInDB): The authenticated user.
+
+    Returns:
+        UserInDB: The authenticated administrator.
+
+    Raises:
+        HTTPException: 403 if the user is not an administrator.
+    """
+    if current_user.username not in ADMIN_USERNAMES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator privileges required.",
+        )
+    return current_user
@@ -0,0 +1,138 @@
+"""
+Example sentences from a local Russian corpus.
+
+``scripts/build_example_index.py`` turns the bundled corpus
+(``data/corpus/ru_sentences.txt``) into an inverted index in one
+``utils.sorted_index`` file: each lemma key maps to the ids of the sentences
+containing it, best first, and each id maps to its sentence. The file is
+memory-mapped on first use, so a lookup is two binary searches in shared pages.
+
+Sentences are ranked by length: those closest to ``EXAMPLE_IDEAL_WORDS`` words
+come first (long enough to give context, short enough for a learner), then the
+shorter ones.
+"""
+
+import logging
+import os
+import re
+import struct
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from services.morphology import lemma_key
+from utils.sorted_index import SortedIndex, write_sorted_index
+
+logger = logging.getLogger(__name__)
+
+EXAMPLE_INDEX_PATH = os.getenv("EXAMPLE_INDEX_PATH", "data/ru_examples.idx")
+EXAMPLE_IDEAL_WORDS = 6
+# Sentences kept per lemma; the index only needs the best few.
+EXAMPLE_MAX_POSTINGS = 50
+
+_WORD = re.compile(r"[А-Яа-яЁё]+(?:-[А-Яа-яЁё]+)*")
+_SENTENCE_PREFIX = "\tsentence\t"
+
+
+def _sentence_key(sentence_id: int) -> str:
+    return f"{_SENTENCE_PREFIX}{sentence_id:08d}"
+
+
+def write_example_index(path: str, sentences: Iterable[str]) -> int:
+    """
+    Builds the inverted index of ``sentences`` and writes it to ``path``.
+
+    Args:
+        path (str): The index file to write.
+        sentences (Iterable[str]): Corpus sentences; blank lines are skipped.
+
+    Returns:
+        int: The number of indexed sentences.
+    """
+    texts: List[str] = []
+    postings: Dict[str, List[int]] = {}
+    for sentence in sentences:
+        sentence = sentence.strip()
+        words = _WORD.findall(sentence)
+        if not words:
+            continue
+        sentence_id = len(texts)
+        texts.append(sentence)
+        for key in dict.fromkeys(lemma_key(word) for word in words):
+            postings.setdefault(key, []).append(sentence_id)
+
+    def rank(sentence_id: int):
+        word_count = len(_WORD.findall(texts[sentence_id]))
+        return abs(word_count - EXAMPLE_IDEAL_WORDS), word_count, len(texts[sentence_id])
+
+    def records():
+        for sentence_id, text in enumerate(texts):
+            yield _sentence_key(sentence_id), text
+        for key, ids in postings.items():
+            best = sorted(ids, key=rank)[:EXAMPLE_MAX_POSTINGS]
+            yield key, struct.pack(f"<{len(best)}I", *best)
+
+    write_sorted_index(path, records())
+    return len(texts)
+
+
+class ExampleSentenceIndex:
+    """Read-only lookups in an example sentence index."""
+
+    def __init__(self, index: SortedIndex):
+        self._index = index
+
+    @classmethod
+    def from_path(cls, path: str = EXAMPLE_INDEX_PATH) -> Optional["ExampleSentenceIndex"]:
+        """Opens the index at ``path``; returns None if it is missing or invalid."""
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(SortedIndex(path))
+        except (OSError, ValueError) as load_error:
+            logger.warning("Could not load example sentence index %s: %s", path, load_error)
+            return None
+
+    def _postings(self, key: str) -> List[int]:
+        value = self._index.get(key)
+        if not value:
+            return []
+        return list(struct.unpack(f"<{len(value) // 4}I", value))
+
+    def find(self, russian_word: str, limit: int = 1) -> List[str]:
+        """
+        Returns up to ``limit`` sentences containing ``russian_word`` in any
+        inflected form (every word of a phrase), best ranked first.
+        """
+        keys = [lemma_key(word) for word in _WORD.findall(russian_word)]
+        if not keys:
+            return []
+        candidates = self._postings(keys[0])
+        for key in keys[1:]:
+            others = set(self._postings(key))
+            candidates = [sentence_id for sentence_id in candidates if sentence_id in others]
+        sentences = []
+        for sentence_id in candidates[:limit]:
+            text = self._index.get(_sentence_key(sentence_id))
+            if text is not None:
+                sentences.append(text.decode("utf-8"))
+        return sentences
+
+    def close(self) -> None:
+        """Unmaps the index."""
+        self._index.close()
+
+
+_example_index: Optional[ExampleSentenceIndex] = None
+_example_index_loaded = False
+_example_index_lock = threading.Lock()
+
+
+def get_example_index() -> Optional[ExampleSentenceIndex]:
+    """Returns the shared example index, opening it on first use (None if not built)."""
+    global _example_index, _example_index_loaded  # pylint: disable=global-statement
+    if not _example_index_loaded:
+        with _example_index_lock:
+            if not _example_index_loaded:
+                _example_index = ExampleSentenceIndex.from_path()
+                _example_index_loaded = True
+    return _example_index
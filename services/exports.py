@@ -0,0 +1,143 @@
+"""
+Streaming exports of a user's vocabulary and transcripts.
+
+Rows are read with ``yield_per`` (batches of ``EXPORT_BATCH_SIZE`` rows, as plain
+column tuples instead of ORM objects) and serialized into chunks of about
+``EXPORT_CHUNK_BYTES`` for a ``StreamingResponse``, so memory stays flat however
+large the history is.
+"""
+
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from database.config import SESSION_LOCAL_FACTORY
+from models.audio_submission import AudioSubmission
+from models.vocabulary_item import VocabularyItem
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "500"))
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+# Format -> (media type, file extension).
+VOCABULARY_EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv", "csv"),
+    "anki": ("text/tab-separated-values", "txt"),
+}
+TRANSCRIPT_EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv", "csv"),
+}
+
+_VOCABULARY_COLUMNS = ("id", "russian_word", "translation", "example_sentence", "created_at")
+_TRANSCRIPT_COLUMNS = ("id", "original_transcript", "language", "grammar_status", "created_at")
+
+# Streamed bodies outlive the request's session, so they open their own.
+session_factory: Callable[[], Session] = SESSION_LOCAL_FACTORY
+
+
+def _value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _iter_rows(statement) -> Iterator[Sequence[Any]]:
+    """Yields the rows of ``statement`` in batches fetched with ``yield_per``."""
+    with session_factory() as db:
+        yield from db.execute(statement.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+
+def _chunked(lines: Iterable[str]) -> Iterator[bytes]:
+    """Joins serialized lines into UTF-8 chunks of about ``EXPORT_CHUNK_BYTES``."""
+    buffer = []
+    size = 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_BYTES:
+            yield "".join(buffer).encode("utf-8")
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+def _ndjson_lines(rows: Iterable[Sequence[Any]], columns: Sequence[str]) -> Iterator[str]:
+    for row in rows:
+        record = {column: _value(value) for column, value in zip(columns, row)}
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def _delimited_lines(
+    rows: Iterable[Sequence[Any]], header: Sequence[str], delimiter: str = ","
+) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter, lineterminator="\n")
+    if header:
+        writer.writerow(header)
+    for row in rows:
+        writer.writerow(["" if value is None else _value(value) for value in row])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # The header alone when there are no rows.
+    if buffer.getvalue():
+        yield buffer.getvalue()
+
+
+def _anki_lines(rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    """Anki "Notes in Plain Text" import: front, back and example, tab-separated."""
+    yield "#separator:tab\n#html:false\n#columns:Front\tBack\tExample\n"
+    for russian_word, translation, example_sentence in rows:
+        fields = (russian_word, translation, example_sentence or "")
+        yield "\t".join(" ".join((field or "").split()) for field in fields) + "\n"
+
+
+def export_vocabulary(user_id: int, export_format: str) -> Iterator[bytes]:
+    """
+    Streams a user's vocabulary in ``export_format`` (see ``VOCABULARY_EXPORT_FORMATS``).
+
+    Args:
+        user_id (int): The ID of the user.
+        export_format (str): 'ndjson', 'csv' or 'anki'.
+
+    Yields:
+        bytes: Chunks of the export file.
+    """
+    if export_format == "anki":
+        statement = select(
+            VocabularyItem.russian_word, VocabularyItem.translation, VocabularyItem.example_sentence
+        ).where(VocabularyItem.user_id == user_id).order_by(VocabularyItem.id)
+        return _chunked(_anki_lines(_iter_rows(statement)))
+
+    statement = select(
+        *(getattr(VocabularyItem, column) for column in _VOCABULARY_COLUMNS)
+    ).where(VocabularyItem.user_id == user_id).order_by(VocabularyItem.id)
+    rows = _iter_rows(statement)
+    if export_format == "csv":
+        return _chunked(_delimited_lines(rows, _VOCABULARY_COLUMNS))
+    return _chunked(_ndjson_lines(rows, _VOCABULARY_COLUMNS))
+
+
+def export_transcripts(user_id: int, export_format: str) -> Iterator[bytes]:
+    """
+    Streams a user's transcripts in ``export_format`` (see ``TRANSCRIPT_EXPORT_FORMATS``).
+
+    Args:
+        user_id (int): The ID of the user.
+        export_format (str): 'ndjson' or 'csv'.
+
+    Yields:
+        bytes: Chunks of the export file.
+    """
+    statement = select(
+        *(getattr(AudioSubmission, column) for column in _TRANSCRIPT_COLUMNS)
+    ).where(AudioSubmission.user_id == user_id).order_by(AudioSubmission.id)
+    rows = _iter_rows(statement)
+    if export_format == "csv":
+        return _chunked(_delimited_lines(rows, _TRANSCRIPT_COLUMNS))
+    return _chunked(_ndjson_lines(rows, _TRANSCRIPT_COLUMNS))
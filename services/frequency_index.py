@@ -0,0 +1,126 @@
+"""
+Precomputed translations of frequent Russian words.
+
+Most learner lookups are among the most frequent few thousand Russian words, so
+``scripts/build_frequency_index.py`` translates a frequency list offline with the
+Marian models and stores the results in a memory-mapped ``utils.sorted_index`` file.
+Lookups are a binary search in pages shared by every worker process; the model (and
+the translation memory) are only needed for words the index does not contain.
+
+Keys are ``<language>\\t<word>``, the word as entered (``morphology.source_text``,
+as in the translation memory); ``\\tmodel\\t<language>`` records the model id
+(``translation_models.translation_model_id``: the model plus its engine) that
+produced a language's translations, so an index built with another model or engine
+is ignored for that language. ``\\tformat`` records the key scheme; indexes with
+another scheme (such as the earlier lemma keys) are not loaded.
+"""
+
+import logging
+import os
+from typing import Dict, Iterable, Optional
+
+from services.morphology import source_text
+from utils.sorted_index import SortedIndex, write_sorted_index
+
+logger = logging.getLogger(__name__)
+
+TRANSLATION_FREQUENCY_INDEX_PATH = os.getenv(
+    "TRANSLATION_FREQUENCY_INDEX_PATH", "data/translation_freq.idx"
+)
+
+# Bumped whenever the key scheme changes, so stale indexes are rebuilt.
+FREQUENCY_INDEX_FORMAT = "source-text"
+_FORMAT_KEY = "\tformat"
+
+
+def _word_key(target_language: str, word: str) -> str:
+    return f"{target_language}\t{word}"
+
+
+def _model_key(target_language: str) -> str:
+    return f"\tmodel\t{target_language}"
+
+
+def write_frequency_index(
+    path: str,
+    translations: Dict[str, Dict[str, str]],
+    models: Dict[str, str],
+) -> int:
+    """
+    Writes precomputed translations as a frequency index.
+
+    Args:
+        path (str): The index file to write.
+        translations (Dict[str, Dict[str, str]]): Translation per word, per target language.
+        models (Dict[str, str]): The model id (see ``translation_model_id``) that
+            produced each language's translations.
+
+    Returns:
+        int: The number of records written.
+    """
+    def records():
+        yield _FORMAT_KEY, FREQUENCY_INDEX_FORMAT
+        for target_language, model_name in models.items():
+            yield _model_key(target_language), model_name
+        for target_language, words in translations.items():
+            for word, translation in words.items():
+                yield _word_key(target_language, source_text(word)), translation
+
+    return write_sorted_index(path, records())
+
+
+class FrequencyIndex:
+    """Read-only lookups in a frequency index file."""
+
+    def __init__(self, index: SortedIndex):
+        self._index = index
+
+    @classmethod
+    def from_path(
+        cls, path: str = TRANSLATION_FREQUENCY_INDEX_PATH
+    ) -> Optional["FrequencyIndex"]:
+        """Opens the index at ``path``; returns None if it is missing, invalid or stale."""
+        if not os.path.exists(path):
+            return None
+        try:
+            index = SortedIndex(path)
+        except (OSError, ValueError) as load_error:
+            logger.warning("Could not load translation frequency index %s: %s", path, load_error)
+            return None
+        key_format = index.get(_FORMAT_KEY)
+        if key_format is None or key_format.decode("utf-8") != FREQUENCY_INDEX_FORMAT:
+            logger.warning(
+                "Ignoring translation frequency index %s: it was built with another "
+                "key format; rebuild it with scripts/build_frequency_index.py.", path,
+            )
+            index.close()
+            return None
+        return cls(index)
+
+    def model_name(self, target_language: str) -> Optional[str]:
+        """Returns the model the language's translations were built with, if any."""
+        value = self._index.get(_model_key(target_language))
+        return value.decode("utf-8") if value is not None else None
+
+    def get_many(
+        self, russian_words: Iterable[str], target_language: str, model_name: str
+    ) -> Dict[str, str]:
+        """
+        Looks up words as entered (cleaned with ``source_text`` by the caller).
+
+        Returns:
+            Dict[str, str]: Translation per word, for the words found;
+            empty if the language was built with a model id other than ``model_name``.
+        """
+        if self.model_name(target_language) != model_name:
+            return {}
+        found = {}
+        for word in russian_words:
+            value = self._index.get(_word_key(target_language, word))
+            if value is not None:
+                found[word] = value.decode("utf-8")
+        return found
+
+    def close(self) -> None:
+        """Unmaps the index."""
+        self._index.close()
@@ -2,16 +2,75 @@
 
 This module provides a singleton service for checking and correcting grammar in text
 using the LanguageTool API. It supports multiple languages and provides detailed
-error explanations.
+error explanations. The asynchronous entry point, used by the API and the bot, talks
+to the LanguageTool HTTP API directly and never blocks the event loop. The synchronous
+``check_grammar`` keeps one warm ``language_tool_python`` client per language and runs
+one check at a time: ``Match`` keeps per-text state in class attributes, so concurrent
+checks would corrupt each other's offsets.
+Final responses are cached by language and exact text, and LanguageTool matches
+are cached per sentence, so editing a long text only re-checks the changed sentences.
+Long inputs are split at paragraph and sentence boundaries into bounded chunks, which
+the asynchronous path checks in parallel. Short Russian inputs can be answered by an in-process
+spellchecker, which also serves as a spelling-only fallback while LanguageTool is down.
 """
 
+import asyncio
+import copy
+import hashlib
+import itertools
 import logging
-from typing import Dict, Any, List, Optional
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional
 
 import language_tool_python
+from language_tool_python.match import Match
+
+from services.languagetool_client import (
+    LANGUAGE_TOOL_URLS,
+    AsyncLanguageToolClient,
+    LanguageToolUnavailableError,
+    normalize_server_url,
+)
+from services.spellchecker import RussianSpellchecker
+from services.text_segmentation import (
+    TextSegment,
+    group_segments,
+    limit_segment_length,
+    merge_segments,
+    split_into_chunks,
+    split_sentences,
+    utf16_length,
+)
+from utils.lru_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+GRAMMAR_CACHE_MAX_ENTRIES = int(os.getenv("GRAMMAR_CACHE_MAX_ENTRIES", "10000"))
+GRAMMAR_CACHE_TTL_SECONDS = float(os.getenv("GRAMMAR_CACHE_TTL_SECONDS", "86400"))
+GRAMMAR_CACHE_MAX_TEXT_LENGTH = int(os.getenv("GRAMMAR_CACHE_MAX_TEXT_LENGTH", "20000"))
+GRAMMAR_SENTENCE_CACHE_MAX_ENTRIES = int(os.getenv("GRAMMAR_SENTENCE_CACHE_MAX_ENTRIES", "100000"))
+GRAMMAR_CHUNK_MAX_CHARS = int(os.getenv("GRAMMAR_CHUNK_MAX_CHARS", "1500"))
+# Russian inputs of at most this many words are checked by the in-process
+# spellchecker only (0 disables the fast path).
+GRAMMAR_FAST_PATH_MAX_WORDS = int(os.getenv("GRAMMAR_FAST_PATH_MAX_WORDS", "0"))
+DEGRADED_MODE_NOTE = "LanguageTool is unavailable; only spelling was checked."
+
+
+def grammar_cache_key(lt_language: str, text: str) -> str:
+    """
+    Builds the result cache key for a text: the LanguageTool language plus a hash
+    of the exact text. Cached offsets and corrections refer to that exact string,
+    so canonically equivalent spellings (NFC/NFD) must not share an entry.
+    """
+    return f"{lt_language}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+
+
+def _sentence_cache_key(lt_language: str, sentence: str) -> str:
+    # Sentence matches carry offsets into the exact sentence text, so no normalization here.
+    return f"{lt_language}:{hashlib.sha256(sentence.encode('utf-8')).hexdigest()}"
+
 
 class GrammarService:
     """
@@ -19,8 +78,7 @@ class GrammarService:
     """
 
     _instance: Optional["GrammarService"] = None
-    _tool: Optional[language_tool_python.LanguageTool] = None
-    _current_lt_language: Optional[str] = None
+    _tools: Dict[str, language_tool_python.LanguageTool]
 
     def __new__(cls) -> "GrammarService":
         if cls._instance is None:
@@ -30,44 +88,162 @@ class GrammarService:
 
     def _initialize(self) -> None:
         logger.info("GrammarService initialized.")
-        self._tool = None
-        self._current_lt_language = None
+        self._tools = {}
+        # Held for every synchronous check (see the module docstring).
+        self._tools_lock = threading.Lock()
+        self._http_client = AsyncLanguageToolClient()
+        # Synchronous clients are spread round-robin over the configured servers.
+        self._server_urls = itertools.cycle(
+            [normalize_server_url(url) for url in LANGUAGE_TOOL_URLS]
+        )
+        self._result_cache = LRUCache(GRAMMAR_CACHE_MAX_ENTRIES, GRAMMAR_CACHE_TTL_SECONDS)
+        self._sentence_cache = LRUCache(
+            GRAMMAR_SENTENCE_CACHE_MAX_ENTRIES, GRAMMAR_CACHE_TTL_SECONDS
+        )
+        self._server_version: Optional[str] = None
+        self._chunk_max_chars = GRAMMAR_CHUNK_MAX_CHARS
+        self._spellchecker: Optional[RussianSpellchecker] = RussianSpellchecker.from_path()
+        self._fast_path_max_words = GRAMMAR_FAST_PATH_MAX_WORDS
 
     def _create_tool(self, lang_code: str) -> language_tool_python.LanguageTool:
-        return language_tool_python.LanguageTool(
-            lang_code, remote_server="http://languagetool:8010"
-        )
+        return language_tool_python.LanguageTool(lang_code, remote_server=next(self._server_urls))
 
-    def _init_tool_if_needed(self, language: str) -> Optional[str]:
-        """
-        Initializes or reinitializes the LanguageTool instance if the language has changed.
-        Returns an error message if initialization fails, otherwise None.
-        """
+    @staticmethod
+    def _resolve_language(language: str) -> str:
+        """Maps a short language code (e.g. 'ru') to its LanguageTool variant."""
         lt_language_map = {
             "en": "en-US",
             "es": "es-ES",
             "ru": "ru-RU",
         }
-        target_lt_language = lt_language_map.get(language.lower(), language)
+        return lt_language_map.get(language.lower(), language)
+
+    @contextmanager
+    def _checkout_tool(self, lt_language: str) -> Iterator[language_tool_python.LanguageTool]:
+        """
+        Lends the warm client for ``lt_language`` for the duration of the ``with``
+        block, holding the check lock; the client is created on first use.
 
-        if self._tool is None or self._current_lt_language != target_lt_language:
-            logger.info("LanguageTool (re)initialization for language: %s", target_lt_language)
+        Raises:
+            LanguageToolUnavailableError: If the client cannot be created.
+        """
+        with self._tools_lock:
+            tool = self._tools.get(lt_language)
+            if tool is None:
+                logger.info("Creating LanguageTool client for %s.", lt_language)
+                try:
+                    tool = self._create_tool(lt_language)
+                except Exception as init_error:  # pylint: disable=broad-except
+                    raise LanguageToolUnavailableError(str(init_error)) from init_error
+                self._tools[lt_language] = tool
+            yield tool
+
+    def close(self) -> None:
+        """Closes the synchronous LanguageTool clients (the service stays usable)."""
+        with self._tools_lock:
+            tools, self._tools = self._tools, {}
+        for tool in tools.values():
             try:
-                if self._tool:
-                    try:
-                        self._tool.close()
-                    except Exception as close_error:  # pylint: disable=broad-except
-                        logger.warning("Error closing LanguageTool: %s", close_error)
-                    self._tool = None
-
-                self._tool = self._create_tool(target_lt_language)
-                self._current_lt_language = target_lt_language
-                logger.info("LanguageTool initialized for %s.", target_lt_language)
-            except Exception as init_error:  # pylint: disable=broad-except
-                logger.error("Failed to initialize LanguageTool for %s: %s",
-                           target_lt_language, init_error)
-                return f"Failed to load grammar service for '{language}'. Error: {init_error}"
-        return None
+                tool.close()
+            except Exception as close_error:  # pylint: disable=broad-except
+                logger.warning("Error closing LanguageTool: %s", close_error)
+
+    async def aclose(self) -> None:
+        """Closes the LanguageTool clients and the async HTTP connections."""
+        self.close()
+        await self._http_client.aclose()
+
+    def _get_cached(self, lt_language: str, text: str) -> Optional[Dict[str, Any]]:
+        if len(text) > GRAMMAR_CACHE_MAX_TEXT_LENGTH:
+            return None
+        cached = self._result_cache.get(grammar_cache_key(lt_language, text))
+        if cached is None:
+            return None
+        result = copy.deepcopy(cached)
+        result["original_text"] = text
+        return result
+
+    def _store_cached(self, lt_language: str, text: str, result: Dict[str, Any]) -> None:
+        if len(text) <= GRAMMAR_CACHE_MAX_TEXT_LENGTH:
+            self._result_cache.set(grammar_cache_key(lt_language, text), copy.deepcopy(result))
+
+    def _note_server_version(self, version: Optional[str]) -> None:
+        """Drops cached results when the LanguageTool server reports a new version."""
+        if not version or version == self._server_version:
+            return
+        if self._server_version is not None:
+            logger.info(
+                "LanguageTool version changed from %s to %s; clearing grammar caches.",
+                self._server_version, version,
+            )
+            self.clear_cache()
+        self._server_version = version
+
+    def clear_cache(self) -> None:
+        """Removes every cached grammar result and sentence match list."""
+        self._result_cache.clear()
+        self._sentence_cache.clear()
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Returns statistics of the grammar result cache.
+
+        Returns:
+            dict: The LRU cache statistics plus the text size limit and the
+            LanguageTool server version the cached results belong to.
+        """
+        sentence_stats = self._sentence_cache.stats()
+        return {
+            **self._result_cache.stats(),
+            "max_text_length": GRAMMAR_CACHE_MAX_TEXT_LENGTH,
+            "sentence_cache_size": sentence_stats["size"],
+            "sentence_cache_hit_rate": sentence_stats["hit_rate"],
+            "server_version": self._server_version,
+        }
+
+    def backend_stats(self) -> List[Dict[str, Any]]:
+        """Returns health, circuit state and load of each LanguageTool backend."""
+        return self._http_client.backend_stats()
+
+    def start_health_checks(self) -> None:
+        """Starts periodic LanguageTool backend health checks on the running loop."""
+        self._http_client.start_health_checks()
+
+    def _use_fast_path(self, text: str, lt_language: str) -> bool:
+        """Whether ``text`` is short enough to be answered by the spellchecker alone."""
+        return (
+            self._spellchecker is not None
+            and lt_language == "ru-RU"
+            and 0 < len(text.split()) <= self._fast_path_max_words
+        )
+
+    def _spelling_response(
+        self, text: str, language: str, lt_language: str, note: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Checks ``text`` with the in-process spellchecker.
+
+        Returns:
+            Optional[dict]: The grammar check response, with ``note`` prepended to the
+            explanation, or None if no spellchecker is available for the language.
+        """
+        if self._spellchecker is None or lt_language != "ru-RU":
+            return None
+        matches = [Match(match, text) for match in self._spellchecker.check(text)]
+        result = self._build_response(text, language, matches)
+        if note:
+            result["explanation"] = f"{note}\n{result['explanation']}"
+        return result
+
+    @staticmethod
+    def _error_response(text: str, language: str, explanation: str) -> Dict[str, Any]:
+        return {
+            "original_text": text,
+            "corrected_text": text,
+            "explanation": explanation,
+            "errors": [],
+            "language": language,
+        }
 
     def _generate_explanation(self,
                              text: str,
@@ -116,35 +292,218 @@ class GrammarService:
     def check_grammar(self, text: str, language: str) -> Dict[str, Any]:
         """
         Checks and corrects grammar in the given text for the specified language.
+
+        Cached results are served, but LanguageTool results are not stored: the
+        synchronous client does not report the server version, so they could not
+        be invalidated when LanguageTool is upgraded.
         """
         logger.info("Checking grammar for text in '%s': %.50s...", language, text)
 
-        error_msg = self._init_tool_if_needed(language)
-        if error_msg:
-            return {
-                "original_text": text,
-                "corrected_text": text,
-                "explanation": error_msg,
-                "errors": [],
-                "language": language,
-            }
+        lt_language = self._resolve_language(language)
+        cached = self._get_cached(lt_language, text)
+        if cached is not None:
+            cached["language"] = language
+            return cached
+
+        if self._use_fast_path(text, lt_language):
+            result = self._spelling_response(text, language, lt_language)
+            self._store_cached(lt_language, text, result)
+            return result
 
         try:
-            matches = self._tool.check(text)
+            matches = self._check_chunks(text, lt_language)
             logger.debug("LanguageTool matches found: %d", len(matches))
+        except LanguageToolUnavailableError as init_error:
+            logger.error("Failed to obtain LanguageTool for %s: %s", lt_language, init_error)
+            fallback = self._spelling_response(text, language, lt_language, DEGRADED_MODE_NOTE)
+            if fallback is not None:
+                return fallback
+            return self._error_response(
+                text,
+                language,
+                f"Failed to load grammar service for '{language}'. Error: {init_error}",
+            )
         except Exception as check_error:  # pylint: disable=broad-except
             logger.error("Error during grammar check for language '%s': %s", language, check_error)
-            return {
-                "original_text": text,
-                "corrected_text": text,
-                "explanation": (
-                    f"Error during grammar check for '{language}': {check_error}. "
-                    "Please try again later."
-                ),
-                "errors": [],
-                "language": language,
-            }
+            return self._error_response(
+                text,
+                language,
+                f"Error during grammar check for '{language}': {check_error}. "
+                "Please try again later.",
+            )
+
+        return self._build_response(text, language, matches)
+
+    async def check_grammar_async(
+        self, text: str, language: str, degraded: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Checks and corrects grammar without blocking the event loop.
+
+        Sends the text to the LanguageTool ``/v2/check`` HTTP endpoint through the
+        pooled async client and builds the same response as ``check_grammar``.
+        Only sentences missing from the sentence cache are sent to LanguageTool.
+
+        With ``degraded`` (the default), a LanguageTool outage is answered with the
+        spelling-only fallback or an error message; otherwise the error is raised,
+        so callers that store results never mistake an outage for a finished check.
+
+        Raises:
+            LanguageToolUnavailableError: If ``degraded`` is False and LanguageTool
+                could not check the text.
+            LanguageToolRequestError: If LanguageTool rejects the request, e.g. for an
+                unknown language (a ``ValueError``).
+        """
+        logger.info("Checking grammar (async) for text in '%s': %.50s...", language, text)
 
+        lt_language = self._resolve_language(language)
+        cached = self._get_cached(lt_language, text)
+        if cached is not None:
+            cached["language"] = language
+            return cached
+
+        if self._use_fast_path(text, lt_language):
+            result = self._spelling_response(text, language, lt_language)
+            self._store_cached(lt_language, text, result)
+            return result
+
+        try:
+            raw_matches = await self._check_sentences(text, lt_language)
+            matches = [Match(match, text) for match in raw_matches]
+            logger.debug("LanguageTool matches found: %d", len(matches))
+        except LanguageToolUnavailableError as check_error:
+            if not degraded:
+                raise
+            fallback = self._spelling_response(text, language, lt_language, DEGRADED_MODE_NOTE)
+            if fallback is not None:
+                return fallback
+            return self._error_response(
+                text,
+                language,
+                f"Error during grammar check for '{language}': {check_error}. "
+                "Please try again later.",
+            )
+        except (KeyError, TypeError) as parse_error:
+            logger.error("Unexpected LanguageTool response for '%s': %s", language, parse_error)
+            if not degraded:
+                raise LanguageToolUnavailableError(
+                    f"unexpected LanguageTool response: {parse_error}"
+                ) from parse_error
+            return self._error_response(
+                text,
+                language,
+                f"Error during grammar check for '{language}': unexpected response.",
+            )
+
+        result = self._build_response(text, language, matches)
+        self._store_cached(lt_language, text, result)
+        return result
+
+    def _check_chunks(self, text: str, lt_language: str) -> List[Match]:
+        """
+        Checks ``text`` with the language's client, splitting long inputs into bounded
+        chunks checked one after another (``Match`` construction is not thread-safe);
+        returned match offsets refer to ``text``.
+        """
+        chunks = (
+            [TextSegment(0, text)] if len(text) <= self._chunk_max_chars
+            else split_into_chunks(text, self._chunk_max_chars)
+        )
+        logger.debug("Checking %d chunks for %s", len(chunks), lt_language)
+        matches: List[Match] = []
+        with self._checkout_tool(lt_language) as tool:
+            for chunk in chunks:
+                chunk_matches = tool.check(chunk.text)
+                # Match() has already mapped offsets onto the chunk's Python indices.
+                for match in chunk_matches:
+                    match.offset += chunk.start
+                matches.extend(chunk_matches)
+        return matches
+
+    async def _check_sentences(self, text: str, lt_language: str) -> List[Dict[str, Any]]:
+        """
+        Returns raw LanguageTool matches for ``text`` with offsets in whole-document
+        coordinates. Only sentences that are not cached yet are sent, grouped into
+        bounded chunks that are checked in parallel.
+
+        Raises:
+            LanguageToolRequestError: If LanguageTool rejects a chunk.
+            LanguageToolUnavailableError: If LanguageTool cannot check a sentence.
+        """
+        segments = limit_segment_length(split_sentences(text), self._chunk_max_chars)
+        keys = [_sentence_cache_key(lt_language, segment.text) for segment in segments]
+        per_segment: List[Optional[List[Dict[str, Any]]]] = [
+            self._sentence_cache.get(key) for key in keys
+        ]
+        missing = [index for index, cached in enumerate(per_segment) if cached is None]
+        logger.debug("Sentences to check: %d of %d", len(missing), len(segments))
+
+        if missing:
+            # Consecutive uncached sentences travel together in bounded chunks.
+            runs: List[List[int]] = []
+            for index in missing:
+                if runs and runs[-1][-1] == index - 1:
+                    runs[-1].append(index)
+                else:
+                    runs.append([index])
+            chunk_groups = [
+                group
+                for run in runs
+                for group in group_segments([segments[i] for i in run], self._chunk_max_chars)
+            ]
+            pending = iter(missing)
+            chunk_indices = [[next(pending) for _ in group] for group in chunk_groups]
+            payloads = await asyncio.gather(*(
+                self._http_client.check(merge_segments(group).text, lt_language)
+                for group in chunk_groups
+            ))
+            for indices, payload in zip(chunk_indices, payloads):
+                self._note_server_version(payload.get("software", {}).get("version"))
+                self._split_chunk_matches(payload["matches"], indices, segments, per_segment)
+                for index in indices:
+                    self._sentence_cache.set(keys[index], per_segment[index])
+
+        # LanguageTool offsets count UTF-16 code units; shift them by the UTF-16
+        # length of the preceding text so Match() can map them onto ``text``.
+        matches: List[Dict[str, Any]] = []
+        base_offset = 0
+        for segment, segment_matches in zip(segments, per_segment):
+            for match in segment_matches:
+                # Match() consumes the dictionary it is given, so build it from a copy.
+                shifted = copy.deepcopy(match)
+                shifted["offset"] += base_offset
+                matches.append(shifted)
+            base_offset += utf16_length(segment.text)
+        return matches
+
+    @staticmethod
+    def _split_chunk_matches(
+        chunk_matches: List[Dict[str, Any]],
+        indices: List[int],
+        segments: List[TextSegment],
+        per_segment: List[Optional[List[Dict[str, Any]]]],
+    ) -> None:
+        """
+        Distributes the matches of a chunk to the sentences it was built from,
+        rebasing each match offset onto the sentence that contains its start.
+        """
+        starts: List[int] = []
+        position = 0
+        for index in indices:
+            starts.append(position)
+            per_segment[index] = []
+            position += utf16_length(segments[index].text)
+        for match in chunk_matches:
+            owner = 0
+            while owner + 1 < len(starts) and starts[owner + 1] <= match["offset"]:
+                owner += 1
+            match["offset"] -= starts[owner]
+            per_segment[indices[owner]].append(match)
+
+    def _build_response(self, text: str, language: str, matches: List[Any]) -> Dict[str, Any]:
+        """
+        Applies the matches to the text and assembles the grammar check response.
+        """
         try:
             corrected_text = language_tool_python.utils.correct(text, matches)
         except Exception as correct_error:  # pylint: disable=broad-except
@@ -0,0 +1,411 @@
+"""
+Asynchronous client for the LanguageTool HTTP API.
+
+Talks to the ``/v2/check`` endpoint of one or more LanguageTool servers directly with
+pooled keep-alive ``httpx.AsyncClient`` instances, so grammar checks never block the
+event loop. Each request has its own timeout and the number of in-flight requests is
+bounded by a semaphore.
+
+With several servers configured (``LANGUAGE_TOOL_URLS``), requests go to the backend
+with the fewest outstanding requests, every backend has a circuit breaker and a
+periodic health check, and a request can optionally be hedged: if the first backend
+is slower than a latency percentile, a second copy is sent to another backend and the
+first answer wins.
+"""
+# Group 1: Standard libraries
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Union
+
+# Group 2: Third-party libraries
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+LANGUAGE_TOOL_URL = os.getenv("LANGUAGE_TOOL_URL", "http://languagetool:8010")
+LANGUAGE_TOOL_URLS = [
+    url for url in (os.getenv("LANGUAGE_TOOL_URLS") or LANGUAGE_TOOL_URL).split(",") if url.strip()
+]
+LANGUAGE_TOOL_TIMEOUT = float(os.getenv("LANGUAGE_TOOL_TIMEOUT", "10"))
+LANGUAGE_TOOL_MAX_CONCURRENCY = int(os.getenv("LANGUAGE_TOOL_MAX_CONCURRENCY", "32"))
+LANGUAGE_TOOL_MAX_KEEPALIVE = int(os.getenv("LANGUAGE_TOOL_MAX_KEEPALIVE", "16"))
+LANGUAGE_TOOL_BREAKER_FAILURES = int(os.getenv("LANGUAGE_TOOL_BREAKER_FAILURES", "5"))
+LANGUAGE_TOOL_BREAKER_RESET_SECONDS = float(os.getenv("LANGUAGE_TOOL_BREAKER_RESET_SECONDS", "30"))
+LANGUAGE_TOOL_HEALTH_INTERVAL = float(os.getenv("LANGUAGE_TOOL_HEALTH_INTERVAL", "15"))
+# Percentile (e.g. 0.95) of a backend's recent latency after which a hedged request
+# is sent to a second backend; empty disables hedging.
+LANGUAGE_TOOL_HEDGE_PERCENTILE = (
+    float(os.getenv("LANGUAGE_TOOL_HEDGE_PERCENTILE"))
+    if os.getenv("LANGUAGE_TOOL_HEDGE_PERCENTILE") else None
+)
+
+# Latency samples kept per backend, and samples needed before hedging kicks in.
+_LATENCY_WINDOW = 200
+_MIN_HEDGE_SAMPLES = 20
+
+
+class LanguageToolUnavailableError(RuntimeError):
+    """Raised when LanguageTool cannot be reached or returns an unusable response."""
+
+
+class LanguageToolRequestError(ValueError):
+    """Raised when LanguageTool rejects a request itself, e.g. for an unknown language."""
+
+
+# Statuses that blame the request (bad parameters, text too large); any other error
+# status, including 429 (overloaded), counts against the backend and fails over.
+_REQUEST_ERROR_STATUSES = frozenset({400, 413, 422})
+
+
+def normalize_server_url(url: str) -> str:
+    """
+    Reduces a configured LanguageTool URL to its server root.
+
+    Accepts ``http://host:8010``, ``http://host:8010/v2/`` or
+    ``http://host:8010/v2/check`` and returns ``http://host:8010``.
+    """
+    url = url.strip().rstrip("/")
+    for suffix in ("/check", "/v2"):
+        if url.endswith(suffix):
+            url = url[: -len(suffix)]
+    return url
+
+
+class CircuitBreaker:
+    """
+    Per-backend circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and the backend
+    receives no traffic for ``reset_timeout`` seconds; then a single trial request is
+    let through (half-open) and its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allows_request(self) -> bool:
+        """Returns True if a request may be sent now (without reserving the trial slot)."""
+        if self.state == self.OPEN:
+            return self._clock() - self._opened_at >= self.reset_timeout
+        if self.state == self.HALF_OPEN:
+            return not self._trial_in_flight
+        return True
+
+    def on_request(self) -> None:
+        """Records that a request is being sent; reserves the half-open trial slot."""
+        if self.state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            self._trial_in_flight = True
+
+    def on_cancel(self) -> None:
+        """Releases the half-open trial slot of a request that was abandoned."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        """Closes the circuit."""
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Counts a failure, opening the circuit when the threshold is reached."""
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning("Circuit opened after %d failures.", self.failures)
+            self.state = self.OPEN
+            self._opened_at = self._clock()
+
+
+class _Backend:
+    """One LanguageTool server with its HTTP client, load and health state."""
+
+    def __init__(self, url: str, breaker: CircuitBreaker):
+        self.url = url
+        self.breaker = breaker
+        self.client: Optional[httpx.AsyncClient] = None
+        self.outstanding = 0
+        self.healthy = True
+        self.latencies: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    @property
+    def available(self) -> bool:
+        """Whether the balancer may route a request here."""
+        return self.healthy and self.breaker.allows_request()
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Returns the given percentile of recent latencies, or None without enough samples."""
+        if len(self.latencies) < _MIN_HEDGE_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(percentile * len(ordered)))]
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the backend's routing state."""
+        p95 = self.latency_percentile(0.95)
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "circuit": self.breaker.state,
+            "outstanding": self.outstanding,
+            "p95_latency_ms": round(p95 * 1000, 1) if p95 is not None else None,
+        }
+
+
+class AsyncLanguageToolClient:
+    """
+    Non-blocking LanguageTool client with keep-alive, bounded concurrency and
+    least-outstanding-requests balancing over one or more backends.
+
+    The underlying ``httpx.AsyncClient`` instances are created lazily inside the
+    running event loop (and recreated if the loop changes), so the client can be
+    instantiated at import time.
+    """
+
+    def __init__(
+        self,
+        base_urls: Union[str, Sequence[str]] = tuple(LANGUAGE_TOOL_URLS),
+        timeout: float = LANGUAGE_TOOL_TIMEOUT,
+        max_concurrency: int = LANGUAGE_TOOL_MAX_CONCURRENCY,
+        max_keepalive: int = LANGUAGE_TOOL_MAX_KEEPALIVE,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        hedge_percentile: Optional[float] = LANGUAGE_TOOL_HEDGE_PERCENTILE,
+        breaker_failures: int = LANGUAGE_TOOL_BREAKER_FAILURES,
+        breaker_reset_seconds: float = LANGUAGE_TOOL_BREAKER_RESET_SECONDS,
+    ):
+        if isinstance(base_urls, str):
+            base_urls = base_urls.split(",")
+        self._backends: List[_Backend] = [
+            _Backend(
+                normalize_server_url(url),
+                CircuitBreaker(breaker_failures, breaker_reset_seconds),
+            )
+            for url in base_urls if url.strip()
+        ]
+        if not self._backends:
+            raise ValueError("At least one LanguageTool URL is required.")
+        self._timeout = timeout
+        self._max_concurrency = max_concurrency
+        self._max_keepalive = max_keepalive
+        self._transport = transport
+        self._hedge_percentile = hedge_percentile
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._health_task: Optional[asyncio.Task] = None
+        self._next_index = 0
+
+    @property
+    def base_urls(self) -> List[str]:
+        """The configured backend URLs."""
+        return [backend.url for backend in self._backends]
+
+    async def _ensure_clients(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        stale = [backend.client for backend in self._backends if backend.client is not None]
+        for backend in self._backends:
+            backend.client = httpx.AsyncClient(
+                base_url=backend.url,
+                timeout=httpx.Timeout(self._timeout),
+                limits=httpx.Limits(
+                    max_connections=self._max_concurrency,
+                    max_keepalive_connections=self._max_keepalive,
+                    keepalive_expiry=30.0,
+                ),
+                transport=self._transport,
+            )
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        self._loop = loop
+        # Clients of a previous loop would otherwise leak their connections; they are
+        # closed after the swap, so concurrent callers already use the new ones.
+        for client in stale:
+            try:
+                await client.aclose()
+            except Exception as close_error:  # pylint: disable=broad-except
+                logger.debug("Could not close a LanguageTool client: %s", close_error)
+
+    def _pick_backend(self, exclude: Sequence[_Backend] = ()) -> Optional[_Backend]:
+        """Returns the available backend with the fewest outstanding requests."""
+        candidates = [
+            backend for backend in self._backends
+            if backend.available and backend not in exclude
+        ]
+        if not candidates:
+            return None
+        # Rotate the starting point so ties are spread across backends.
+        self._next_index = (self._next_index + 1) % len(self._backends)
+        rotation = {
+            id(backend): (position - self._next_index) % len(self._backends)
+            for position, backend in enumerate(self._backends)
+        }
+        return min(candidates, key=lambda backend: (backend.outstanding, rotation[id(backend)]))
+
+    async def _send(
+        self, backend: _Backend, text: str, lt_language: str, timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        backend.breaker.on_request()
+        backend.outstanding += 1
+        started = time.monotonic()
+        try:
+            response = await backend.client.post(
+                "/v2/check",
+                data={"text": text, "language": lt_language},
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+            if response.status_code in _REQUEST_ERROR_STATUSES:
+                # The request is at fault, not the backend: no failover, no breaker failure.
+                backend.breaker.record_success()
+                raise LanguageToolRequestError(
+                    f"LanguageTool rejected the request: {response.text.strip()[:200]}"
+                )
+            response.raise_for_status()
+            payload = response.json()
+        except asyncio.CancelledError:
+            # A hedged request that lost the race says nothing about backend health.
+            backend.breaker.on_cancel()
+            raise
+        except LanguageToolRequestError:
+            raise
+        except (httpx.HTTPError, ValueError) as exc:
+            backend.breaker.record_failure()
+            logger.error("LanguageTool request to %s failed: %s", backend.url, exc)
+            raise LanguageToolUnavailableError(f"LanguageTool request failed: {exc}") from exc
+        finally:
+            backend.outstanding -= 1
+        backend.latencies.append(time.monotonic() - started)
+        backend.breaker.record_success()
+        return payload
+
+    async def _send_hedged(
+        self, primary: _Backend, text: str, lt_language: str, timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        """Sends to ``primary`` and, if it is slower than usual, also to a second backend."""
+        threshold = (
+            primary.latency_percentile(self._hedge_percentile)
+            if self._hedge_percentile is not None else None
+        )
+        first = asyncio.ensure_future(self._send(primary, text, lt_language, timeout))
+        if threshold is None:
+            return await first
+
+        done, _ = await asyncio.wait({first}, timeout=threshold)
+        secondary = None if done else self._pick_backend(exclude=[primary])
+        if secondary is None:
+            return await first
+
+        logger.debug("Hedging LanguageTool request from %s to %s", primary.url, secondary.url)
+        second = asyncio.ensure_future(self._send(secondary, text, lt_language, timeout))
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    return task.result()
+                error = task.exception()
+        raise error
+
+    async def check(
+        self, text: str, lt_language: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Checks ``text`` with LanguageTool.
+
+        The request goes to the least loaded available backend; if that backend fails
+        (5xx, 429, timeout or transport error), it is retried once on each other
+        available backend. Requests LanguageTool rejects (400, 413, 422) are not retried.
+
+        Args:
+            text (str): The text to check.
+            lt_language (str): LanguageTool language code (e.g. 'ru-RU').
+            timeout (Optional[float]): Per-request timeout override in seconds.
+
+        Returns:
+            dict: The decoded ``/v2/check`` response (``matches``, ``software``, ...).
+
+        Raises:
+            LanguageToolRequestError: If LanguageTool rejected the request.
+            LanguageToolUnavailableError: If no backend could answer.
+        """
+        await self._ensure_clients()
+        async with self._semaphore:
+            tried: List[_Backend] = []
+            last_error: Optional[LanguageToolUnavailableError] = None
+            while True:
+                backend = self._pick_backend(exclude=tried)
+                if backend is None:
+                    raise last_error or LanguageToolUnavailableError(
+                        "No LanguageTool backend is available."
+                    )
+                tried.append(backend)
+                try:
+                    return await self._send_hedged(backend, text, lt_language, timeout)
+                except LanguageToolUnavailableError as exc:
+                    last_error = exc
+
+    async def health_check(self) -> None:
+        """Probes every backend's ``/v2/languages`` endpoint and updates its health."""
+        await self._ensure_clients()
+
+        async def probe(backend: _Backend) -> None:
+            try:
+                response = await backend.client.get("/v2/languages", timeout=2.0)
+                response.raise_for_status()
+            except httpx.HTTPError as exc:
+                if backend.healthy:
+                    logger.warning("LanguageTool backend %s is unhealthy: %s", backend.url, exc)
+                backend.healthy = False
+                return
+            if not backend.healthy:
+                logger.info("LanguageTool backend %s is healthy again.", backend.url)
+            backend.healthy = True
+
+        await asyncio.gather(*(probe(backend) for backend in self._backends))
+
+    def start_health_checks(self, interval: float = LANGUAGE_TOOL_HEALTH_INTERVAL) -> None:
+        """Runs ``health_check`` every ``interval`` seconds in the background."""
+        if len(self._backends) < 2 or self._health_task is not None:
+            return
+
+        async def loop() -> None:
+            while True:
+                await self.health_check()
+                await asyncio.sleep(interval)
+
+        self._health_task = asyncio.create_task(loop())
+
+    def backend_stats(self) -> List[Dict[str, Any]]:
+        """Returns the routing state of every backend."""
+        return [backend.stats() for backend in self._backends]
+
+    async def aclose(self) -> None:
+        """Stops health checks and closes the pooled HTTP connections."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        for backend in self._backends:
+            if backend.client is not None:
+                await backend.client.aclose()
+                backend.client = None
+        self._loop = None
@@ -0,0 +1,81 @@
+"""
+Russian morphological normalization for lookup keys.
+
+Inflected forms ("книга", "книги", "книгу") share one lemma key, their dictionary
+form, so vocabulary lookups and duplicate detection treat them as one word. Keys
+are only for lookups: translations are keyed and made from the text as entered
+(``source_text``), since forms of one lemma can translate differently.
+Lemmas come from pymorphy3's OpenCorpora dictionary, loaded once per process
+(its DAWG files are read into compact automata, not Python objects) and cached
+per word form. Without pymorphy3 installed, keys fall back to the normalized word.
+"""
+
+import logging
+import re
+import threading
+import unicodedata
+from functools import lru_cache
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+_CYRILLIC_WORD = re.compile(r"[а-яё]+(?:-[а-яё]+)*")
+
+_analyzer: Any = None
+_analyzer_loaded = False
+_analyzer_lock = threading.Lock()
+
+
+def _get_analyzer() -> Optional[Any]:
+    """Returns the shared pymorphy3 analyzer, or None if pymorphy3 is unavailable."""
+    global _analyzer, _analyzer_loaded  # pylint: disable=global-statement
+    if not _analyzer_loaded:
+        with _analyzer_lock:
+            if not _analyzer_loaded:
+                try:
+                    import pymorphy3  # pylint: disable=import-outside-toplevel
+                    _analyzer = pymorphy3.MorphAnalyzer(lang="ru")
+                except ImportError:
+                    logger.warning("pymorphy3 is not installed; lemma keys are normalized words.")
+                _analyzer_loaded = True
+    return _analyzer
+
+
+def load_analyzer() -> None:
+    """
+    Loads the analyzer now instead of on the first lookup. Loading takes seconds,
+    so servers call this at startup rather than on the event loop mid-request.
+    """
+    _get_analyzer()
+
+
+def source_text(russian_word: str) -> str:
+    """Cleans a word or phrase for translation: NFC and trimmed, case and inflection kept."""
+    return unicodedata.normalize("NFC", russian_word).strip()
+
+
+def normalize_word(russian_word: str) -> str:
+    """Normalizes a word for lookup keys: NFC, trimmed and lower-cased."""
+    return source_text(russian_word).lower()
+
+
+@lru_cache(maxsize=100_000)
+def _lemma(word: str) -> str:
+    analyzer = _get_analyzer()
+    # The most probable parse's normal form, with 'ё' folded into 'е' (often not typed).
+    lemma = analyzer.parse(word)[0].normal_form if analyzer is not None else word
+    return lemma.replace("ё", "е")
+
+
+def lemma_key(text: str) -> str:
+    """
+    Returns the lookup key of a Russian word or phrase: the normalized text with
+    every Cyrillic word replaced by its lemma.
+
+    Args:
+        text (str): The word or phrase as entered.
+
+    Returns:
+        str: The lemma key (e.g. 'книга' for 'Книгу').
+    """
+    return _CYRILLIC_WORD.sub(lambda match: _lemma(match.group()), normalize_word(text))
@@ -0,0 +1,326 @@
+"""
+Token-bucket rate limiting shared by the HTTP API and the Telegram bot.
+
+Every caller is identified by a key (``tg:<telegram_id>`` for bot users,
+``api:<jwt subject>`` for API users) and owns one bucket per budget:
+a request-count budget and an audio-seconds budget. Buckets live in process
+memory by default; setting ``RATE_LIMIT_BACKEND=sqlite`` stores them in a
+small SQLite file so several worker processes share the same state.
+"""
+# Group 1: Standard libraries
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set, Tuple
+
+# Group 2: Third-party libraries
+from dotenv import load_dotenv
+from fastapi import Depends, HTTPException, Request, status
+
+# Group 3: First-party modules
+from schemas.user import UserInDB
+from services.auth_service import get_current_user
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_SQLITE_PATH = os.getenv(
+    "RATE_LIMIT_SQLITE_PATH", "./database_volume_data/rate_limits.db"
+)
+RATE_LIMIT_REQUESTS_PER_MINUTE = float(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "60"))
+RATE_LIMIT_REQUESTS_BURST = float(os.getenv("RATE_LIMIT_REQUESTS_BURST", "30"))
+RATE_LIMIT_AUDIO_SECONDS_PER_HOUR = float(os.getenv("RATE_LIMIT_AUDIO_SECONDS_PER_HOUR", "1800"))
+RATE_LIMIT_AUDIO_SECONDS_BURST = float(os.getenv("RATE_LIMIT_AUDIO_SECONDS_BURST", "600"))
+
+REQUESTS_BUDGET = "requests"
+AUDIO_SECONDS_BUDGET = "audio_seconds"
+
+
+@dataclass(frozen=True)
+class BucketConfig:
+    """
+    Configuration of a single token bucket.
+
+    Attributes:
+        capacity (float): Maximum number of tokens the bucket can hold (the burst size).
+        refill_rate (float): Tokens added back per second.
+    """
+    capacity: float
+    refill_rate: float
+
+
+def _refill(tokens: float, updated_at: float, config: BucketConfig, now: float) -> float:
+    """Returns the token count after refilling a bucket up to ``now``."""
+    elapsed = max(0.0, now - updated_at)
+    return min(config.capacity, tokens + elapsed * config.refill_rate)
+
+
+def _plan(
+    buckets: Dict[str, Tuple[float, float]],
+    costs: Dict[str, float],
+    configs: Dict[str, BucketConfig],
+    now: float,
+) -> Tuple[float, Dict[str, float]]:
+    """
+    Computes the outcome of charging ``costs`` against the given bucket states.
+
+    Args:
+        buckets: Current ``(tokens, updated_at)`` per budget; missing budgets start full.
+        costs: Tokens to take per budget.
+        configs: Bucket configuration per budget.
+        now: Current wall-clock time.
+
+    Returns:
+        tuple: ``(retry_after, new_tokens)``. ``retry_after`` is 0 when every
+        budget can pay; otherwise it is the number of seconds until they all can
+        and ``new_tokens`` holds the refilled (but uncharged) levels.
+    """
+    retry_after = 0.0
+    refilled: Dict[str, float] = {}
+    for budget, cost in costs.items():
+        config = configs[budget]
+        tokens, updated_at = buckets.get(budget, (config.capacity, now))
+        refilled[budget] = _refill(tokens, updated_at, config, now)
+        # A single charge larger than the bucket (e.g. a very long voice note) drains
+        # it completely instead of being rejected forever.
+        needed = min(cost, config.capacity)
+        if refilled[budget] < needed:
+            retry_after = max(retry_after, (needed - refilled[budget]) / config.refill_rate)
+
+    if retry_after > 0:
+        return retry_after, refilled
+    return 0.0, {
+        budget: refilled[budget] - min(cost, configs[budget].capacity)
+        for budget, cost in costs.items()
+    }
+
+
+class InMemoryBucketStore:
+    """Keeps bucket states in a dictionary guarded by a lock (single process)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], Tuple[float, float]] = {}
+
+    def acquire(
+        self, key: str, costs: Dict[str, float], configs: Dict[str, BucketConfig], now: float
+    ) -> float:
+        """Charges all ``costs`` atomically for ``key``; returns the retry delay (0 on success)."""
+        with self._lock:
+            current = {
+                budget: self._buckets[(key, budget)]
+                for budget in costs if (key, budget) in self._buckets
+            }
+            retry_after, new_tokens = _plan(current, costs, configs, now)
+            for budget, tokens in new_tokens.items():
+                self._buckets[(key, budget)] = (tokens, now)
+            return retry_after
+
+    def reset(self) -> None:
+        """Forgets every bucket."""
+        with self._lock:
+            self._buckets.clear()
+
+
+class SQLiteBucketStore:
+    """
+    Keeps bucket states in a SQLite file so several processes share them.
+
+    Each acquisition runs inside a ``BEGIN IMMEDIATE`` transaction, which takes the
+    database write lock up front and makes the read-modify-write atomic across processes.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                "bucket_key TEXT NOT NULL, budget TEXT NOT NULL, "
+                "tokens REAL NOT NULL, updated_at REAL NOT NULL, "
+                "PRIMARY KEY (bucket_key, budget))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def acquire(
+        self, key: str, costs: Dict[str, float], configs: Dict[str, BucketConfig], now: float
+    ) -> float:
+        """Charges all ``costs`` atomically for ``key``; returns the retry delay (0 on success)."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT budget, tokens, updated_at FROM rate_limit_buckets WHERE bucket_key = ?",
+                (key,),
+            ).fetchall()
+            current = {budget: (tokens, updated_at) for budget, tokens, updated_at in rows}
+            retry_after, new_tokens = _plan(current, costs, configs, now)
+            conn.executemany(
+                "INSERT INTO rate_limit_buckets (bucket_key, budget, tokens, updated_at) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT (bucket_key, budget) "
+                "DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at",
+                [(key, budget, tokens, now) for budget, tokens in new_tokens.items()],
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        return retry_after
+
+    def reset(self) -> None:
+        """Forgets every bucket."""
+        self._connect().execute("DELETE FROM rate_limit_buckets")
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter with one bucket per (key, budget) pair.
+    """
+
+    def __init__(
+        self,
+        store,
+        configs: Dict[str, BucketConfig],
+        clock: Callable[[], float] = time.time,
+    ):
+        self._store = store
+        self._configs = configs
+        self._clock = clock
+
+    def acquire(self, key: str, requests: float = 1.0, audio_seconds: float = 0.0) -> float:
+        """
+        Tries to charge a request and, optionally, some audio seconds to ``key``.
+
+        Both budgets are charged together or not at all.
+
+        Args:
+            key (str): The caller's bucket key (see ``telegram_key``/``api_key``).
+            requests (float): Request tokens to take.
+            audio_seconds (float): Audio-second tokens to take.
+
+        Returns:
+            float: 0 if the call is allowed, otherwise the seconds to wait before retrying.
+        """
+        costs = {REQUESTS_BUDGET: requests}
+        if audio_seconds > 0:
+            costs[AUDIO_SECONDS_BUDGET] = audio_seconds
+        try:
+            retry_after = self._store.acquire(key, costs, self._configs, self._clock())
+        except sqlite3.Error as exc:
+            # Never take the service down because the limiter's storage is unavailable.
+            logger.error("Rate limiter storage error for %s: %s", key, exc)
+            return 0.0
+        if retry_after > 0:
+            logger.info("Rate limit hit for %s (%s); retry in %.1fs", key, costs, retry_after)
+        return retry_after
+
+    def reset(self) -> None:
+        """Forgets every bucket (useful for tests and maintenance)."""
+        self._store.reset()
+
+
+def telegram_key(telegram_id: int) -> str:
+    """Bucket key for a Telegram user."""
+    return f"tg:{telegram_id}"
+
+
+def api_key(subject: str) -> str:
+    """Bucket key for an API user, identified by the JWT subject (the username)."""
+    return f"api:{subject}"
+
+
+def _build_rate_limiter() -> RateLimiter:
+    configs = {
+        REQUESTS_BUDGET: BucketConfig(
+            capacity=RATE_LIMIT_REQUESTS_BURST,
+            refill_rate=RATE_LIMIT_REQUESTS_PER_MINUTE / 60.0,
+        ),
+        AUDIO_SECONDS_BUDGET: BucketConfig(
+            capacity=RATE_LIMIT_AUDIO_SECONDS_BURST,
+            refill_rate=RATE_LIMIT_AUDIO_SECONDS_PER_HOUR / 3600.0,
+        ),
+    }
+    if RATE_LIMIT_BACKEND == "sqlite":
+        logger.info("Using SQLite rate limiter storage at %s", RATE_LIMIT_SQLITE_PATH)
+        return RateLimiter(SQLiteBucketStore(RATE_LIMIT_SQLITE_PATH), configs)
+    return RateLimiter(InMemoryBucketStore(), configs)
+
+
+# Global singleton instance
+rate_limiter = _build_rate_limiter()
+
+
+def raise_if_limited(retry_after: float, detail: Optional[str] = None) -> None:
+    """
+    Raises HTTP 429 with a ``Retry-After`` header when ``retry_after`` is positive.
+
+    Args:
+        retry_after (float): Value returned by ``RateLimiter.acquire``.
+        detail (Optional[str]): Custom error message.
+
+    Raises:
+        HTTPException: If the caller has exhausted one of its budgets.
+    """
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail or "Rate limit exceeded. Please slow down.",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+# Route handlers that charge their whole batch themselves (see ``charges_per_item``).
+_PER_ITEM_ENDPOINTS: Set[Callable] = set()
+
+
+def charges_per_item(endpoint: Callable) -> Callable:
+    """
+    Marks a route handler that charges one request token per batch item itself,
+    so ``enforce_request_rate_limit`` does not charge it a separate request.
+
+    The handler charges the batch with a single ``acquire(requests=len(items))``:
+    the cost is capped at the bucket capacity, so any batch the schema allows can
+    pass once the bucket is full, and a rejected batch takes no tokens.
+    """
+    _PER_ITEM_ENDPOINTS.add(endpoint)
+    return endpoint
+
+
+async def enforce_request_rate_limit(
+    request: Request,
+    current_user: UserInDB = Depends(get_current_user)
+) -> UserInDB:
+    """
+    Dependency charging one request token to the authenticated user
+    (nothing for handlers marked with ``charges_per_item``).
+
+    Args:
+        request (Request): The incoming request, used to find its route handler.
+        current_user (UserInDB): The authenticated user.
+
+    Returns:
+        UserInDB: The same user, so the dependency can replace ``get_current_user``.
+
+    Raises:
+        HTTPException: 429 if the user's request budget is exhausted.
+    """
+    if request.scope.get("endpoint") in _PER_ITEM_ENDPOINTS:
+        return current_user
+    raise_if_limited(rate_limiter.acquire(api_key(current_user.username)))
+    return current_user
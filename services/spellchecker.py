@@ -0,0 +1,133 @@
+"""
+In-process Russian spellchecker backed by a memory-mapped word-form dictionary.
+
+The dictionary is a ``utils.sorted_index`` file mapping every known lower-case word
+form to its corpus frequency (built with ``scripts/build_spell_index.py``). Unknown
+words get suggestions at edit distance one, ranked by frequency. Results are returned
+as LanguageTool ``/v2/check`` match dictionaries, so they go through the same
+response building as real LanguageTool matches.
+"""
+
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional, Set
+
+from services.text_segmentation import utf16_length
+from utils.sorted_index import SortedIndex
+
+logger = logging.getLogger(__name__)
+
+RU_SPELL_DICT_PATH = os.getenv("RU_SPELL_DICT_PATH", "data/ru_spell.idx")
+
+SPELL_RULE_ID = "RU_SPELL_FAST_PATH"
+_ALPHABET = "абвгдеёжзийклмнопрстуфхцчшщъыьэюя"
+_WORD = re.compile(r"[А-Яа-яЁё]+(?:-[А-Яа-яЁё]+)*")
+_SENTENCE_START = re.compile(r"(?:^|[.!?…]\s+)$")
+
+
+def _edits1(word: str) -> Set[str]:
+    """All strings one deletion, transposition, substitution or insertion away."""
+    splits = [(word[:index], word[index:]) for index in range(len(word) + 1)]
+    deletes = {left + right[1:] for left, right in splits if right}
+    transposes = {
+        left + right[1] + right[0] + right[2:] for left, right in splits if len(right) > 1
+    }
+    replaces = {left + char + right[1:] for left, right in splits if right for char in _ALPHABET}
+    inserts = {left + char + right for left, right in splits for char in _ALPHABET}
+    return deletes | transposes | replaces | inserts
+
+
+class RussianSpellchecker:
+    """
+    Spellchecker over a sorted word-form index.
+
+    Attributes:
+        max_suggestions (int): Number of replacements offered per misspelling.
+    """
+
+    def __init__(self, index: SortedIndex, max_suggestions: int = 5):
+        self._index = index
+        self.max_suggestions = max_suggestions
+
+    @classmethod
+    def from_path(cls, path: str = RU_SPELL_DICT_PATH) -> Optional["RussianSpellchecker"]:
+        """Opens the dictionary at ``path``; returns None if it is missing or invalid."""
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(SortedIndex(path))
+        except (OSError, ValueError) as load_error:
+            logger.warning("Could not load spelling dictionary %s: %s", path, load_error)
+            return None
+
+    def _frequency(self, word: str) -> Optional[int]:
+        value = self._index.get(word)
+        return int(value or 0) if value is not None else None
+
+    def is_known(self, word: str) -> bool:
+        """Returns True if ``word`` (in any case, with 'е' for 'ё') is a known word form."""
+        lowered = word.lower()
+        return lowered in self._index or lowered.replace("ё", "е") in self._index
+
+    def suggest(self, word: str) -> List[str]:
+        """
+        Returns known words one edit away from ``word``, most frequent first,
+        keeping the capitalization of the first letter.
+        """
+        lowered = word.lower()
+        scored = []
+        for candidate in _edits1(lowered):
+            frequency = self._frequency(candidate)
+            if frequency is not None:
+                scored.append((-frequency, candidate))
+        suggestions = [candidate for _, candidate in sorted(scored)[: self.max_suggestions]]
+        if word[:1].isupper():
+            suggestions = [candidate[:1].upper() + candidate[1:] for candidate in suggestions]
+        return suggestions
+
+    def check(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Finds unknown words in ``text``.
+
+        Capitalized words in the middle of a sentence are treated as proper names
+        and skipped.
+
+        Returns:
+            List[dict]: LanguageTool-format matches with UTF-16 offsets.
+        """
+        matches: List[Dict[str, Any]] = []
+        for word_match in _WORD.finditer(text):
+            word = word_match.group()
+            if self.is_known(word):
+                continue
+            if word[:1].isupper() and not _SENTENCE_START.search(text[:word_match.start()]):
+                continue
+            matches.append(self._make_match(text, word_match.start(), word))
+        return matches
+
+    def _make_match(self, text: str, start: int, word: str) -> Dict[str, Any]:
+        offset = utf16_length(text[:start])
+        length = utf16_length(word)
+        return {
+            "message": "Возможно, найдена орфографическая ошибка.",
+            "shortMessage": "Орфографическая ошибка",
+            "replacements": [{"value": value} for value in self.suggest(word)],
+            "offset": offset,
+            "length": length,
+            "context": {"text": text, "offset": offset, "length": length},
+            "sentence": text,
+            "type": {"typeName": "Other"},
+            "rule": {
+                "id": SPELL_RULE_ID,
+                "description": "Possible spelling mistake",
+                "issueType": "misspelling",
+                "category": {"id": "TYPOS", "name": "Possible Typo"},
+            },
+            "ignoreForIncompleteSentence": False,
+            "contextForSureMatch": 0,
+        }
+
+    def close(self) -> None:
+        """Unmaps the dictionary."""
+        self._index.close()
@@ -0,0 +1,147 @@
+"""
+Text segmentation helpers for grammar checking.
+
+Splits text into contiguous sentence segments whose concatenation is the original
+text, so results computed per segment can be mapped back to document offsets, and
+groups segments into size-bounded chunks that break at paragraph ends where possible.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List
+
+# A sentence ends after terminal punctuation (plus closing quotes/brackets) followed by
+# whitespace, or at a line break. The trailing whitespace stays with the sentence.
+_SENTENCE_BOUNDARY = re.compile(r"[.!?…]+[\"'»”)\]]*\s+|\n\s*")
+# A segment that ends with a blank line closes a paragraph.
+_PARAGRAPH_END = re.compile(r"\n[^\S\n]*\n\s*$")
+
+
+@dataclass(frozen=True)
+class TextSegment:
+    """
+    A contiguous slice of a document.
+
+    Attributes:
+        start (int): Offset of the segment in the document (Python string index).
+        text (str): The segment text, including trailing whitespace.
+    """
+    start: int
+    text: str
+
+    @property
+    def end(self) -> int:
+        """Offset just past the end of the segment."""
+        return self.start + len(self.text)
+
+
+def split_sentences(text: str) -> List[TextSegment]:
+    """
+    Splits text into sentence segments that together cover the whole text.
+
+    Args:
+        text (str): The document.
+
+    Returns:
+        List[TextSegment]: The segments in document order.
+    """
+    segments: List[TextSegment] = []
+    start = 0
+    for boundary in _SENTENCE_BOUNDARY.finditer(text):
+        segments.append(TextSegment(start, text[start:boundary.end()]))
+        start = boundary.end()
+    if start < len(text):
+        segments.append(TextSegment(start, text[start:]))
+    return segments
+
+
+def limit_segment_length(segments: List[TextSegment], max_chars: int) -> List[TextSegment]:
+    """
+    Splits segments longer than ``max_chars`` at the last space that fits
+    (or hard at ``max_chars`` if there is none).
+
+    Args:
+        segments (List[TextSegment]): Contiguous segments.
+        max_chars (int): Maximum segment length.
+
+    Returns:
+        List[TextSegment]: Contiguous segments, none longer than ``max_chars``.
+    """
+    limited: List[TextSegment] = []
+    for segment in segments:
+        start, text = segment.start, segment.text
+        while len(text) > max_chars:
+            cut = text.rfind(" ", 0, max_chars) + 1
+            if cut <= 0:
+                cut = max_chars
+            limited.append(TextSegment(start, text[:cut]))
+            start, text = start + cut, text[cut:]
+        if text:
+            limited.append(TextSegment(start, text))
+    return limited
+
+
+def group_segments(segments: List[TextSegment], max_chars: int) -> List[List[TextSegment]]:
+    """
+    Groups consecutive segments into runs of at most ``max_chars`` characters.
+
+    When a run is full it is closed after its last paragraph-ending segment, if it
+    has one, so chunks break at paragraph boundaries before sentence boundaries.
+
+    Args:
+        segments (List[TextSegment]): Contiguous segments, each at most ``max_chars`` long.
+        max_chars (int): Maximum total length of a group.
+
+    Returns:
+        List[List[TextSegment]]: The groups in document order.
+    """
+    groups: List[List[TextSegment]] = []
+    current: List[TextSegment] = []
+    size = 0
+    for segment in segments:
+        if current and size + len(segment.text) > max_chars:
+            cut = len(current)
+            for index in range(len(current) - 1, 0, -1):
+                if _PARAGRAPH_END.search(current[index - 1].text):
+                    cut = index
+                    break
+            groups.append(current[:cut])
+            current = current[cut:]
+            size = sum(len(part.text) for part in current)
+            if current and size + len(segment.text) > max_chars:
+                groups.append(current)
+                current, size = [], 0
+        current.append(segment)
+        size += len(segment.text)
+    if current:
+        groups.append(current)
+    return groups
+
+
+def merge_segments(group: List[TextSegment]) -> TextSegment:
+    """Joins consecutive segments into a single segment."""
+    return TextSegment(group[0].start, "".join(segment.text for segment in group))
+
+
+def split_into_chunks(text: str, max_chars: int) -> List[TextSegment]:
+    """
+    Splits text into contiguous chunks of at most ``max_chars`` characters,
+    breaking at paragraph ends, then sentence ends, then spaces.
+
+    Args:
+        text (str): The document.
+        max_chars (int): Maximum chunk length.
+
+    Returns:
+        List[TextSegment]: The chunks in document order.
+    """
+    segments = limit_segment_length(split_sentences(text), max_chars)
+    return [merge_segments(group) for group in group_segments(segments, max_chars)]
+
+
+def utf16_length(text: str) -> int:
+    """
+    Returns the length of ``text`` in UTF-16 code units, the unit LanguageTool
+    (a Java server) uses for match offsets.
+    """
+    return len(text.encode("utf-16-le")) // 2
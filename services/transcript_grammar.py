@@ -0,0 +1,69 @@
+"""
+Automatic grammar-check stage for new transcriptions.
+
+After Whisper has produced a transcript, the grammar check runs in the background
+(a FastAPI background task or an asyncio task in the bot) and its result is stored
+on the ``AudioSubmission``, so learners get both from a single upload without the
+grammar work delaying the transcription response.
+"""
+
+import logging
+import os
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from database import crud
+from database.config import SESSION_LOCAL_FACTORY
+from services.grammar_service import GrammarService
+
+logger = logging.getLogger(__name__)
+
+AUTO_GRAMMAR_CHECK = os.getenv("AUTO_GRAMMAR_CHECK", "false").lower() in ("1", "true", "yes")
+
+GRAMMAR_PENDING = "pending"
+GRAMMAR_COMPLETED = "completed"
+GRAMMAR_FAILED = "failed"
+
+# Background tasks outlive the request's session, so they open their own.
+session_factory: Callable[[], Session] = SESSION_LOCAL_FACTORY
+
+
+def should_check_grammar(requested: Optional[bool]) -> bool:
+    """Resolves a per-request override against the ``AUTO_GRAMMAR_CHECK`` default."""
+    return AUTO_GRAMMAR_CHECK if requested is None else requested
+
+
+async def run_transcript_grammar_check(
+    audio_id: int, transcript: str, language: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Checks the grammar of a stored transcript and saves the result on its submission.
+
+    Never raises: failures, including a LanguageTool outage (no degraded result is
+    stored), are logged and recorded as the 'failed' status with no result.
+
+    Args:
+        audio_id (int): The ID of the audio submission.
+        transcript (str): The transcript text.
+        language (str): The language detected by Whisper (e.g. 'ru').
+
+    Returns:
+        Optional[dict]: The grammar check response, or None if the check failed.
+    """
+    try:
+        result = await GrammarService().check_grammar_async(transcript, language, degraded=False)
+        status, payload = GRAMMAR_COMPLETED, result
+    except Exception as check_error:  # pylint: disable=broad-except
+        logger.error("Grammar check of transcription %s failed: %s", audio_id, check_error)
+        status, payload = GRAMMAR_FAILED, None
+
+    db = session_factory()
+    try:
+        crud.set_audio_grammar_result(db, audio_id, status, payload)
+        logger.info("Grammar check of transcription %s: %s", audio_id, status)
+    except Exception as db_error:  # pylint: disable=broad-except
+        logger.error("Could not store grammar result of transcription %s: %s", audio_id, db_error)
+    finally:
+        db.close()
+    return payload
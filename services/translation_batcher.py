@@ -0,0 +1,116 @@
+"""
+Micro-batching of concurrent single-word translation requests.
+
+Requests for the same target language that arrive within a short window
+(``TRANSLATION_BATCH_WINDOW_MS``) are coalesced into one batched translation, so
+concurrent ``/suggest-translation`` calls share a forward pass instead of queueing
+for one each. Identical words (after ``source_text`` cleanup) already waiting or
+in flight are deduplicated single-flight style: every caller awaits the same future.
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from services.morphology import source_text
+
+logger = logging.getLogger(__name__)
+
+# How long the first request of a batch waits for others to join it.
+TRANSLATION_BATCH_WINDOW_MS = float(os.getenv("TRANSLATION_BATCH_WINDOW_MS", "5"))
+# A batch is sent as soon as it holds this many distinct words.
+TRANSLATION_MICRO_BATCH_MAX = int(os.getenv("TRANSLATION_MICRO_BATCH_MAX", "32"))
+
+
+class TranslationBatcher:
+    """
+    Coalesces translation requests per target language.
+
+    A batcher belongs to the event loop it is first used on; the translate
+    function runs on ``executor`` and must return one translation per word,
+    in order.
+    """
+
+    def __init__(
+        self,
+        translate: Callable[[Sequence[str], str], List[str]],
+        executor: Callable[[], Executor],
+        window_ms: float = TRANSLATION_BATCH_WINDOW_MS,
+        max_batch_size: int = TRANSLATION_MICRO_BATCH_MAX,
+    ):
+        self._translate = translate
+        self._executor = executor
+        self._window = window_ms / 1000
+        self._max_batch_size = max(1, max_batch_size)
+        self.loop = asyncio.get_running_loop()
+        # Words waiting for the next batch, per language.
+        self._pending: Dict[str, List[str]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        # Futures of waiting and in-flight words, shared by identical requests.
+        self._futures: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._flushes = set()
+
+    async def translate(self, russian_word: str, target_language: str) -> str:
+        """
+        Returns the translation of ``russian_word``, batched with concurrent requests.
+
+        Raises:
+            Exception: Whatever the translate function raised for the batch.
+        """
+        key = (target_language, source_text(russian_word))
+        future = self._futures.get(key)
+        if future is None:
+            future = self.loop.create_future()
+            self._futures[key] = future
+            pending = self._pending.setdefault(target_language, [])
+            pending.append(key[1])
+            if len(pending) >= self._max_batch_size:
+                self._flush(target_language)
+            elif target_language not in self._timers:
+                self._timers[target_language] = self.loop.call_later(
+                    self._window, self._flush, target_language
+                )
+        # Shielded, so one cancelled caller does not cancel the word for the others.
+        return await asyncio.shield(future)
+
+    def _flush(self, target_language: str) -> None:
+        timer = self._timers.pop(target_language, None)
+        if timer is not None:
+            timer.cancel()
+        words = self._pending.pop(target_language, [])
+        if words:
+            task = self.loop.create_task(self._run_batch(words, target_language))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _run_batch(self, words: List[str], target_language: str) -> None:
+        keys = [(target_language, word) for word in words]
+        try:
+            translations = await self.loop.run_in_executor(
+                self._executor(), self._translate, words, target_language
+            )
+        except Exception as batch_error:  # pylint: disable=broad-exception-caught
+            logger.error("Translation batch of %d words to '%s' failed: %s",
+                         len(words), target_language, batch_error)
+            for key in keys:
+                self._resolve(key, error=batch_error)
+            return
+        logger.debug("Translated a batch of %d words to '%s'.", len(words), target_language)
+        for key, translation in zip(keys, translations):
+            self._resolve(key, result=translation)
+
+    def _resolve(
+        self,
+        key: Tuple[str, str],
+        result: Optional[str] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        future = self._futures.pop(key, None)
+        if future is None or future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
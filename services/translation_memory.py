@@ -0,0 +1,167 @@
+"""
+Shared translation memory for vocabulary suggestions.
+
+Machine translations of Russian words are stored in the ``translation_memory`` table,
+keyed by the text as entered (``services.morphology.source_text``: case and inflection
+kept, since "Вера" and "вера" or "был" and "быть" translate differently), shared by
+all users, and read through an in-process LRU cache, so a word that has been
+translated once is answered by a dictionary lookup instead of model inference.
+Entries remember the model that produced them and are ignored once the model changes;
+administrators can also invalidate them explicitly.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from database import crud
+from database.config import SESSION_LOCAL_FACTORY
+from services.morphology import source_text
+from utils.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+TRANSLATION_MEMORY_CACHE_MAX_ENTRIES = int(
+    os.getenv("TRANSLATION_MEMORY_CACHE_MAX_ENTRIES", "50000")
+)
+
+
+class TranslationMemoryStore:
+    """
+    Read-through translation memory: in-process LRU in front of the database table.
+
+    Database errors are logged and treated as misses, so suggestions keep working
+    (through the model) if the table is unavailable.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SESSION_LOCAL_FACTORY,
+        max_entries: int = TRANSLATION_MEMORY_CACHE_MAX_ENTRIES,
+    ):
+        self.session_factory = session_factory
+        self._cache = LRUCache(max_entries)
+        self._lock = threading.Lock()
+        self._lookups = 0
+        self._cache_hits = 0
+        self._db_hits = 0
+
+    def get_many(
+        self, russian_words: Iterable[str], target_language: str, model_name: str
+    ) -> Dict[str, str]:
+        """
+        Looks up translations, first in the LRU and then in one database query.
+
+        Args:
+            russian_words (Iterable[str]): The words (cleaned with ``source_text`` here).
+            target_language (str): The target language code.
+            model_name (str): The model whose translations are acceptable.
+
+        Returns:
+            Dict[str, str]: Translation per cleaned word, for the words found.
+        """
+        words = {source_text(word) for word in russian_words}
+        found: Dict[str, str] = {}
+        missing = []
+        for word in words:
+            translation = self._cache.get((target_language, model_name, word))
+            if translation is None:
+                missing.append(word)
+            else:
+                found[word] = translation
+        cache_hits = len(found)
+
+        if missing:
+            try:
+                with self.session_factory() as db:
+                    stored = crud.get_translation_memories(
+                        db, missing, target_language, model_name
+                    )
+            except SQLAlchemyError as db_error:
+                logger.warning("Translation memory lookup failed: %s", db_error)
+                stored = {}
+            for word, translation in stored.items():
+                self._cache.set((target_language, model_name, word), translation)
+            found.update(stored)
+
+        with self._lock:
+            self._lookups += len(words)
+            self._cache_hits += cache_hits
+            self._db_hits += len(found) - cache_hits
+        return found
+
+    def put_many(
+        self, translations: Dict[str, str], target_language: str, model_name: str
+    ) -> None:
+        """
+        Stores translations produced by ``model_name``.
+
+        Args:
+            translations (Dict[str, str]): Translation per word (cleaned with ``source_text`` here).
+            target_language (str): The target language code.
+            model_name (str): The model that produced the translations.
+        """
+        normalized = {source_text(word): text for word, text in translations.items()}
+        for word, translation in normalized.items():
+            self._cache.set((target_language, model_name, word), translation)
+        try:
+            with self.session_factory() as db:
+                crud.save_translation_memories(db, normalized, target_language, model_name)
+        except SQLAlchemyError as db_error:
+            logger.warning("Could not store translations in translation memory: %s", db_error)
+
+    def invalidate(
+        self,
+        target_language: Optional[str] = None,
+        russian_word: Optional[str] = None,
+        model_name: Optional[str] = None,
+    ) -> int:
+        """
+        Deletes stored translations matching every given filter and clears the LRU.
+
+        Returns:
+            int: The number of deleted database entries.
+        """
+        with self.session_factory() as db:
+            deleted = crud.delete_translation_memories(
+                db,
+                target_language=target_language,
+                russian_word=source_text(russian_word) if russian_word else None,
+                model_name=model_name,
+            )
+        self._cache.clear()
+        logger.info("Invalidated %d translation memory entries.", deleted)
+        return deleted
+
+    def clear_cache(self) -> None:
+        """Empties the in-process LRU (the database is untouched)."""
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns hit statistics.
+
+        Returns:
+            dict: ``lookups``, ``cache_hits``, ``db_hits``, ``misses``, ``hit_rate``
+            and the LRU's ``cache_size`` and ``cache_max_entries``.
+        """
+        cache_stats = self._cache.stats()
+        with self._lock:
+            hits = self._cache_hits + self._db_hits
+            return {
+                "lookups": self._lookups,
+                "cache_hits": self._cache_hits,
+                "db_hits": self._db_hits,
+                "misses": self._lookups - hits,
+                "hit_rate": hits / self._lookups if self._lookups else 0.0,
+                "cache_size": cache_stats["size"],
+                "cache_max_entries": cache_stats["max_entries"],
+            }
+
+
+# Global translation memory used by the vocabulary NLP service.
+translation_memory = TranslationMemoryStore()
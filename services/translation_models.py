@@ -0,0 +1,271 @@
+"""
+Memory-bounded manager for translation models.
+
+Keeps the Marian translation pipelines of recently used languages resident within a
+memory budget, evicting the least recently used pipeline when a new one would not fit.
+Models are loaded from local files only (by default), can be preloaded at startup, and
+load times and resident models are reported for monitoring.
+
+Two engines are available (``TRANSLATION_ENGINE``): ``pytorch`` runs the Hugging Face
+models as they are; ``onnx`` runs int8-quantized ONNX exports of the same models
+(built by ``scripts/export_onnx_models.py``) with ONNX Runtime and KV caching. The
+ONNX engine needs the optional ``optimum`` and ``onnxruntime`` packages.
+"""
+
+import glob
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, Pipeline, pipeline
+
+logger = logging.getLogger(__name__)
+
+# Marian model used for each supported target language (source language is Russian).
+TRANSLATION_MODELS: Dict[str, str] = {
+    'es': 'Helsinki-NLP/opus-mt-ru-es',
+    'en': 'Helsinki-NLP/opus-mt-ru-en',
+    'pt': 'Helsinki-NLP/opus-mt-ru-pt',
+    'fr': 'Helsinki-NLP/opus-mt-ru-fr',
+}
+# Total size of resident model weights; the least recently used models are
+# evicted to stay below it (one model is always kept, even if larger).
+TRANSLATION_MODEL_MEMORY_MB = float(os.getenv("TRANSLATION_MODEL_MEMORY_MB", "1024"))
+# Load models only from the local Hugging Face cache (see scripts/download_translation_models.py).
+TRANSLATION_LOCAL_FILES_ONLY = os.getenv(
+    "TRANSLATION_LOCAL_FILES_ONLY", "true"
+).lower() in ("1", "true", "yes")
+# 'pytorch' (fp32 Hugging Face models) or 'onnx' (int8 ONNX Runtime exports).
+TRANSLATION_ENGINE = os.getenv("TRANSLATION_ENGINE", "pytorch").lower()
+# Directory holding one ONNX export per model, named after the model (e.g. opus-mt-ru-en).
+TRANSLATION_ONNX_DIR = os.getenv("TRANSLATION_ONNX_DIR", "data/onnx")
+# Comma-separated target languages loaded during application startup.
+TRANSLATION_PRELOAD_LANGUAGES = [
+    language.strip()
+    for language in os.getenv("TRANSLATION_PRELOAD_LANGUAGES", "").split(",")
+    if language.strip()
+]
+
+
+def translation_model_id(model_name: str, engine: str = TRANSLATION_ENGINE) -> str:
+    """
+    Identifies the model that produced a translation, including the engine when
+    it is not plain PyTorch (outputs may differ). Stored translations (frequency
+    index, translation memory) are only served to the same model id.
+    """
+    return model_name if engine == "pytorch" else f"{model_name}@{engine}-int8"
+
+
+def load_translation_pipeline(model_name: str, local_files_only: bool) -> Pipeline:
+    """Loads a translation pipeline for ``model_name`` from the Hugging Face cache or hub."""
+    tokenizer = AutoTokenizer.from_pretrained(model_name, local_files_only=local_files_only)
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name, local_files_only=local_files_only)
+    return pipeline("translation", model=model, tokenizer=tokenizer)
+
+
+def onnx_model_dir(model_name: str, onnx_dir: str = TRANSLATION_ONNX_DIR) -> str:
+    """Returns the directory of the ONNX export of ``model_name``."""
+    return os.path.join(onnx_dir, model_name.rsplit("/", maxsplit=1)[-1])
+
+
+def load_onnx_translation_pipeline(model_name: str, _local_files_only: bool = True) -> Pipeline:
+    """
+    Loads the quantized ONNX export of ``model_name`` as a translation pipeline
+    running on ONNX Runtime, with the decoder's past key/values cached between steps.
+
+    Exports are always read from ``TRANSLATION_ONNX_DIR``, never downloaded.
+    """
+    # Optional dependencies: only needed when the ONNX engine is selected.
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM  # pylint: disable=import-outside-toplevel
+
+    model_dir = onnx_model_dir(model_name)
+    if not os.path.isdir(model_dir):
+        raise FileNotFoundError(
+            f"No ONNX export for {model_name} in {model_dir}; run scripts/export_onnx_models.py."
+        )
+    tokenizer = AutoTokenizer.from_pretrained(model_dir, local_files_only=True)
+    model = ORTModelForSeq2SeqLM.from_pretrained(
+        model_dir, use_cache=True, provider="CPUExecutionProvider", local_files_only=True
+    )
+    return pipeline("translation", model=model, tokenizer=tokenizer)
+
+
+LOADERS: Dict[str, Callable[[str, bool], Any]] = {
+    "pytorch": load_translation_pipeline,
+    "onnx": load_onnx_translation_pipeline,
+}
+
+
+def estimate_pipeline_bytes(translation_pipeline: Any) -> int:
+    """
+    Returns the size of a pipeline's model in bytes: its parameters and buffers for
+    PyTorch models, or the size of its ONNX files for ONNX Runtime models.
+    """
+    model = getattr(translation_pipeline, "model", None)
+    if model is None:
+        return 0
+    if hasattr(model, "parameters"):
+        tensors = list(model.parameters()) + list(model.buffers())
+        return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+    model_dir = getattr(model, "model_save_dir", None)
+    if model_dir is None:
+        return 0
+    return sum(os.path.getsize(path) for path in glob.glob(os.path.join(str(model_dir), "*.onnx")))
+
+
+@dataclass
+class _ResidentModel:
+    """A loaded pipeline with its bookkeeping."""
+    model_name: str
+    pipeline: Any
+    size_bytes: int
+    load_seconds: float
+    loaded_at: float
+    last_used: float
+
+
+class TranslationModelManager:
+    """
+    LRU cache of translation pipelines bounded by a memory budget.
+
+    Attributes:
+        memory_budget_bytes (int): Budget for the resident models' weights.
+    """
+
+    def __init__(
+        self,
+        models: Dict[str, str],
+        memory_budget_mb: float = TRANSLATION_MODEL_MEMORY_MB,
+        local_files_only: bool = TRANSLATION_LOCAL_FILES_ONLY,
+        engine: str = TRANSLATION_ENGINE,
+        loader: Optional[Callable[[str, bool], Any]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        if engine not in LOADERS:
+            raise ValueError(f"Unknown translation engine: {engine}")
+        self._models = models
+        self.engine = engine
+        loader = loader or LOADERS[engine]
+        self.memory_budget_bytes = int(memory_budget_mb * 1024 * 1024)
+        self._local_files_only = local_files_only
+        self._loader = loader
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {
+            language: threading.Lock() for language in models
+        }
+        self._resident: "OrderedDict[str, _ResidentModel]" = OrderedDict()
+        self._loads = 0
+        self._evictions = 0
+
+    def model_id(self, target_language: str) -> str:
+        """
+        Identifies the model that produces translations for ``target_language``
+        (see ``translation_model_id``).
+        """
+        return translation_model_id(self._models[target_language], self.engine)
+
+    def get(self, target_language: str) -> Any:
+        """
+        Returns the pipeline for ``target_language``, loading it if needed.
+
+        Raises:
+            ValueError: If the target language is unsupported.
+        """
+        if target_language not in self._models:
+            raise ValueError(f"Unsupported target language: {target_language}")
+        with self._lock:
+            resident = self._resident.get(target_language)
+            if resident is not None:
+                self._resident.move_to_end(target_language)
+                resident.last_used = self._clock()
+                return resident.pipeline
+
+        # Only one thread loads a given model; others wait for it.
+        with self._load_locks[target_language]:
+            with self._lock:
+                resident = self._resident.get(target_language)
+                if resident is not None:
+                    self._resident.move_to_end(target_language)
+                    resident.last_used = self._clock()
+                    return resident.pipeline
+            return self._load(target_language)
+
+    def _load(self, target_language: str) -> Any:
+        model_name = self._models[target_language]
+        logger.info("Loading model for language '%s': %s", target_language, model_name)
+        started = time.perf_counter()
+        translation_pipeline = self._loader(model_name, self._local_files_only)
+        load_seconds = time.perf_counter() - started
+        size_bytes = estimate_pipeline_bytes(translation_pipeline)
+        logger.info(
+            "Loaded %s in %.2fs (%.0f MB).", model_name, load_seconds, size_bytes / 1024 / 1024
+        )
+        now = self._clock()
+        with self._lock:
+            self._loads += 1
+            self._resident[target_language] = _ResidentModel(
+                model_name, translation_pipeline, size_bytes, load_seconds, now, now
+            )
+            self._evict_over_budget()
+        return translation_pipeline
+
+    def _evict_over_budget(self) -> None:
+        # Called with the lock held; the newest model (last in order) is never evicted.
+        while len(self._resident) > 1 and self.resident_bytes() > self.memory_budget_bytes:
+            language, evicted = self._resident.popitem(last=False)
+            self._evictions += 1
+            logger.info(
+                "Evicted translation model for '%s' (%s) to stay within the memory budget.",
+                language, evicted.model_name,
+            )
+
+    def resident_bytes(self) -> int:
+        """Returns the total estimated size of the resident models."""
+        return sum(resident.size_bytes for resident in self._resident.values())
+
+    def preload(self, languages: List[str]) -> None:
+        """Loads the given languages' models; failures are logged, not raised."""
+        for language in languages:
+            try:
+                self.get(language)
+            except Exception as load_error:  # pylint: disable=broad-exception-caught
+                logger.error("Could not preload translation model for '%s': %s",
+                             language, load_error)
+
+    def unload_all(self) -> None:
+        """Drops every resident model."""
+        with self._lock:
+            self._resident.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the memory budget, counters and the resident models, most recent last.
+
+        Returns:
+            dict: ``engine``, ``memory_budget_mb``, ``resident_mb``, ``loads``, ``evictions`` and
+            ``models`` (language, model name, size, load time and timestamps).
+        """
+        with self._lock:
+            return {
+                "engine": self.engine,
+                "memory_budget_mb": round(self.memory_budget_bytes / 1024 / 1024, 1),
+                "resident_mb": round(self.resident_bytes() / 1024 / 1024, 1),
+                "loads": self._loads,
+                "evictions": self._evictions,
+                "models": [
+                    {
+                        "target_language": language,
+                        "model_name": resident.model_name,
+                        "size_mb": round(resident.size_bytes / 1024 / 1024, 1),
+                        "load_seconds": round(resident.load_seconds, 3),
+                        "loaded_at": resident.loaded_at,
+                        "last_used": resident.last_used,
+                    }
+                    for language, resident in self._resident.items()
+                ],
+            }
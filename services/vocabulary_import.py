@@ -0,0 +1,218 @@
+"""
+Bulk import of vocabulary lists.
+
+Imports CSV, TSV (including Anki's "Notes in Plain Text" export) and JSON lines
+files. The file is parsed as a stream; rows are validated and de-duplicated in
+chunks of ``VOCABULARY_IMPORT_CHUNK_SIZE`` and every chunk is inserted with one
+executemany in its own transaction, so memory stays bounded by the chunk size
+and a failure only loses the current chunk.
+
+Rows whose word the user already has (by lemma key, like single creation) or
+that repeat an earlier row of the file are skipped as duplicates.
+"""
+
+import codecs
+import csv
+import json
+import logging
+import os
+from collections import deque
+from typing import Any, BinaryIO, Deque, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from database import crud
+from schemas.vocabulary_item import VocabularyItemCreate
+from services.morphology import lemma_key
+
+logger = logging.getLogger(__name__)
+
+VOCABULARY_IMPORT_CHUNK_SIZE = int(os.getenv("VOCABULARY_IMPORT_CHUNK_SIZE", "500"))
+# Row errors reported in the summary; further errors are only counted.
+VOCABULARY_IMPORT_MAX_ERRORS = int(os.getenv("VOCABULARY_IMPORT_MAX_ERRORS", "100"))
+
+IMPORT_FORMATS = ("csv", "tsv", "jsonl")
+_EXTENSIONS = {".csv": "csv", ".tsv": "tsv", ".txt": "tsv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+_COLUMNS = ("russian_word", "translation", "example_sentence")
+
+
+def detect_format(filename: Optional[str], requested: Optional[str] = None) -> Optional[str]:
+    """Returns the import format: ``requested`` if given, else guessed from the file name."""
+    if requested:
+        return requested.lower() if requested.lower() in IMPORT_FORMATS else None
+    extension = os.path.splitext(filename or "")[1].lower()
+    return _EXTENSIONS.get(extension)
+
+
+def _text_lines(stream: BinaryIO) -> Iterator[str]:
+    """Decodes ``stream`` as UTF-8 (with or without BOM) line by line."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    for chunk in iter(lambda: stream.read(64 * 1024), b""):
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        yield from (line + "\n" for line in lines)
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def _delimited_rows(stream: BinaryIO, delimiter: str) -> Iterator[Tuple[int, Any]]:
+    """
+    Yields ``(line number, fields)`` of a CSV/TSV file, numbered by the file line
+    the row starts on. A header row naming the columns is optional; without one,
+    columns are word, translation, example. Lines starting with '#' (Anki's
+    export headers) are skipped.
+    """
+    # File line numbers of the lines the reader has taken for the current row.
+    row_lines: Deque[int] = deque()
+
+    def lines() -> Iterator[str]:
+        for line_number, line in enumerate(_text_lines(stream), start=1):
+            if not line.startswith("#"):
+                row_lines.append(line_number)
+                yield line
+
+    header: Optional[List[str]] = None
+    for index, fields in enumerate(csv.reader(lines(), delimiter=delimiter)):
+        # The reader pulls lines only until the row is complete (quoted fields
+        # may span several), so the queue holds exactly this row's lines.
+        row_number = row_lines[0]
+        row_lines.clear()
+        if not any(field.strip() for field in fields):
+            continue
+        if index == 0 and "russian_word" in (field.strip().lower() for field in fields):
+            header = [field.strip().lower() for field in fields]
+            continue
+        names = header or _COLUMNS
+        yield row_number, {name: value for name, value in zip(names, fields) if name in _COLUMNS}
+
+
+def _jsonl_rows(stream: BinaryIO) -> Iterator[Tuple[int, Any]]:
+    """Yields ``(line number, object)`` of a JSON lines file; bad JSON yields the error."""
+    for row_number, line in enumerate(_text_lines(stream), start=1):
+        if not line.strip():
+            continue
+        try:
+            yield row_number, json.loads(line)
+        except json.JSONDecodeError as decode_error:
+            yield row_number, decode_error
+
+
+def iter_rows(stream: BinaryIO, import_format: str) -> Iterator[Tuple[int, Any]]:
+    """Yields the raw rows of a file in ``import_format``."""
+    if import_format == "jsonl":
+        return _jsonl_rows(stream)
+    return _delimited_rows(stream, "\t" if import_format == "tsv" else ",")
+
+
+def _validate(raw: Any) -> VocabularyItemCreate:
+    """Validates one raw row; raises ValueError with a readable message."""
+    if isinstance(raw, json.JSONDecodeError):
+        raise ValueError(f"Invalid JSON: {raw.msg}")
+    if not isinstance(raw, dict):
+        raise ValueError("Expected an object with russian_word and translation.")
+    cleaned = {key: value.strip() if isinstance(value, str) else value for key, value in raw.items()}
+    try:
+        item = VocabularyItemCreate.model_validate(cleaned)
+    except ValidationError as validation_error:
+        first = validation_error.errors()[0]
+        field = ".".join(str(part) for part in first["loc"])
+        raise ValueError(f"{field}: {first['msg']}") from validation_error
+    if not item.russian_word or not item.translation:
+        raise ValueError("russian_word and translation must not be empty.")
+    return item
+
+
+class _ImportSummary:
+    """Counters and (capped) row errors of one import."""
+
+    def __init__(self, max_errors: int):
+        self.total_rows = 0
+        self.imported = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.errors: List[Dict[str, Any]] = []
+        self._max_errors = max_errors
+
+    def add_error(self, row_number: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < self._max_errors:
+            self.errors.append({"row": row_number, "error": message})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total_rows": self.total_rows,
+            "imported": self.imported,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+def import_vocabulary(
+    db: Session,
+    user_id: int,
+    stream: BinaryIO,
+    import_format: str,
+    chunk_size: int = VOCABULARY_IMPORT_CHUNK_SIZE,
+    max_errors: int = VOCABULARY_IMPORT_MAX_ERRORS,
+) -> Dict[str, Any]:
+    """
+    Imports a vocabulary file for a user.
+
+    Args:
+        db (Session): The database session.
+        user_id (int): The ID of the importing user.
+        stream (BinaryIO): The file contents.
+        import_format (str): One of ``IMPORT_FORMATS``.
+        chunk_size (int): Rows validated and inserted per transaction.
+        max_errors (int): Row errors listed in the summary.
+
+    Returns:
+        dict: ``total_rows``, ``imported``, ``duplicates``, ``failed``, ``errors``
+        (row number and message) and ``errors_truncated``.
+    """
+    summary = _ImportSummary(max_errors)
+    chunk: List[Tuple[int, Any]] = []
+
+    def flush() -> None:
+        # Repeats within the chunk are caught here; repeats of earlier chunks are
+        # already committed and found by the lookup, so memory stays per chunk.
+        seen_keys = set()
+        valid = []
+        for row_number, raw in chunk:
+            try:
+                item = _validate(raw)
+            except ValueError as row_error:
+                summary.add_error(row_number, str(row_error))
+                continue
+            valid.append((item, lemma_key(item.russian_word)))
+        existing = crud.get_existing_lemma_keys(db, user_id, {key for _, key in valid})
+        new_items = []
+        for item, key in valid:
+            if key in existing or key in seen_keys:
+                summary.duplicates += 1
+                continue
+            seen_keys.add(key)
+            new_items.append({**item.model_dump(), "lemma_key": key})
+        # Words inserted concurrently since the lookup are skipped by the insert.
+        inserted = crud.bulk_create_vocabulary_items(db, user_id, new_items)
+        summary.imported += inserted
+        summary.duplicates += len(new_items) - inserted
+        chunk.clear()
+
+    for row in iter_rows(stream, import_format):
+        summary.total_rows += 1
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+
+    logger.info(
+        "User %s imported %d vocabulary items (%d duplicates, %d failed rows).",
+        user_id, summary.imported, summary.duplicates, summary.failed,
+    )
+    return summary.as_dict()
@@ -2,18 +2,48 @@
 NLP service for vocabulary-related tasks.
 
 Provides a singleton service for suggesting translations and example sentences
-for Russian words using pre-trained NLP models from Helsinki-NLP.
+for Russian words using pre-trained NLP models from Helsinki-NLP and, for
+examples, an index of a local Russian corpus.
+Model loading and inference run on a dedicated thread pool, so the asynchronous
+entry point never blocks the event loop. Translations are looked up in the precomputed
+frequency index and the shared translation memory first; only unknown words reach the
+model. Concurrent single-word requests are coalesced into batches by a
+``TranslationBatcher``.
 """
 
 # Group 1: Standard libraries
+import asyncio
 import logging
-from typing import Dict, Any
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 
 # Group 2: Third-party libraries
-from transformers import pipeline, Pipeline
+import torch
+from transformers import Pipeline
+
+# Group 3: First-party modules
+from services.example_sentences import get_example_index
+from services.frequency_index import FrequencyIndex
+from services.translation_models import (
+    TRANSLATION_MODELS,
+    TRANSLATION_PRELOAD_LANGUAGES,
+    TranslationModelManager,
+)
+from services.translation_batcher import TranslationBatcher
+from services.morphology import source_text
+from services.translation_memory import translation_memory
 
 logger = logging.getLogger(__name__)
 
+# Threads running translation inference (and model loading) in parallel.
+TRANSLATION_WORKERS = int(os.getenv("TRANSLATION_WORKERS", "1"))
+# Intra-op threads torch may use per inference; 0 keeps torch's default.
+TRANSLATION_TORCH_THREADS = int(os.getenv("TRANSLATION_TORCH_THREADS", "0"))
+# Words translated together in one padded forward pass by batch suggestions.
+TRANSLATION_BATCH_SIZE = int(os.getenv("TRANSLATION_BATCH_SIZE", "32"))
+
 
 class VocabularyNLPService:
     """
@@ -33,19 +63,24 @@ class VocabularyNLPService:
 
     def __init__(self):
         if not self._initialized:
-            self._models: Dict[str, str] = {
-                'es': 'Helsinki-NLP/opus-mt-ru-es',
-                'en': 'Helsinki-NLP/opus-mt-ru-en',
-                'pt': 'Helsinki-NLP/opus-mt-ru-pt',
-                'fr': 'Helsinki-NLP/opus-mt-ru-fr',
+            self._models: Dict[str, str] = dict(TRANSLATION_MODELS)
+            self._model_manager = TranslationModelManager(self._models)
+            # One lock per language: a model is loaded once, and a pipeline (whose
+            # tokenizer is not thread-safe) runs one inference at a time.
+            self._pipeline_locks: Dict[str, threading.Lock] = {
+                language: threading.Lock() for language in self._models
             }
-            self._pipelines: Dict[str, Pipeline] = {}
+            if TRANSLATION_TORCH_THREADS > 0:
+                torch.set_num_threads(TRANSLATION_TORCH_THREADS)
+            self._executor: Optional[ThreadPoolExecutor] = None
+            self._batcher: Optional[TranslationBatcher] = None
+            self._frequency_index: Optional[FrequencyIndex] = FrequencyIndex.from_path()
             self._initialized = True
 
     def _get_translation_pipeline(self, target_language: str) -> Pipeline:
         """
         Returns a translation pipeline for the given target language.
-        Loads the model if not already cached.
+        Loads the model if it is not resident in the model manager.
 
         Args:
             target_language (str): Target language code (e.g., 'es', 'en').
@@ -56,15 +91,85 @@ class VocabularyNLPService:
         Raises:
             ValueError: If the target language is unsupported.
         """
+        return self._model_manager.get(target_language)
+
+    def _translate(self, russian_word: str, target_language: str) -> str:
+        """Translates one word, from the translation memory if possible."""
+        return self._translate_with_memory([russian_word], target_language)[0]
+
+    def _translate_with_memory(
+        self, russian_words: Sequence[str], target_language: str
+    ) -> List[str]:
+        """
+        Translates words, answering known ones from the frequency index or the
+        translation memory; the model translates each remaining word once. Both
+        stores are keyed by the text as entered (``source_text``), not by lemma, so
+        inflections and capitalized names never share a translation.
+
+        Returns:
+            List[str]: One translation per word, in input order.
+        """
+        if target_language not in self._models:
+            raise ValueError(f"Unsupported target language: {target_language}")
+        sources = [source_text(word) for word in russian_words]
+        # Both stores only answer with translations of the model (and engine) in use.
+        model_name = self._model_manager.model_id(target_language)
+        known: Dict[str, str] = {}
+        if self._frequency_index is not None:
+            known = self._frequency_index.get_many(sources, target_language, model_name)
+        missing = [word for word in sources if word not in known]
+        if missing:
+            known.update(translation_memory.get_many(missing, target_language, model_name))
+        to_translate = list(dict.fromkeys(word for word in sources if word not in known))
+        if to_translate:
+            translated = dict(zip(
+                to_translate, self._translate_batch(to_translate, target_language)
+            ))
+            translation_memory.put_many(translated, target_language, model_name)
+            known.update(translated)
+        return [known[word] for word in sources]
+
+    def _translate_batch(self, russian_words: Sequence[str], target_language: str) -> List[str]:
+        """
+        Translates words into one language in padded batches of ``TRANSLATION_BATCH_SIZE``.
+
+        The pipeline pads every batch to its longest input; words are sorted by
+        length first so each batch pads to a similar length. Translations are
+        returned in input order.
+        """
         if target_language not in self._models:
             raise ValueError(f"Unsupported target language: {target_language}")
+        order = sorted(range(len(russian_words)), key=lambda index: len(russian_words[index]))
+        with self._pipeline_locks[target_language]:
+            pipeline_instance = self._get_translation_pipeline(target_language)
+            translated = pipeline_instance(
+                [russian_words[index] for index in order],
+                batch_size=min(TRANSLATION_BATCH_SIZE, len(order)),
+                truncation=True,
+            )
+        translations: List[str] = [""] * len(russian_words)
+        for index, result in zip(order, translated):
+            translations[index] = result["translation_text"]
+        return translations
 
-        if target_language not in self._pipelines:
-            model_name = self._models[target_language]
-            logger.info("Loading model for language '%s': %s", target_language, model_name)
-            self._pipelines[target_language] = pipeline("translation", model=model_name)
+    @staticmethod
+    def _suggestion(russian_word: str, translation: str) -> Dict[str, Any]:
+        # A real sentence from the local corpus if the example index has one.
+        example_index = get_example_index()
+        examples = example_index.find(russian_word) if example_index is not None else []
+        return {
+            "russian_word": russian_word,
+            "suggested_translation": translation,
+            "suggested_example_sentence": examples[0] if examples else f"Example: '{translation}'."
+        }
 
-        return self._pipelines[target_language]
+    @staticmethod
+    def _default_suggestion(russian_word: str, target_language: str) -> Dict[str, Any]:
+        return {
+            "russian_word": russian_word,
+            "suggested_translation": f"No translation available for '{target_language}'.",
+            "suggested_example_sentence": "Translation service currently unavailable."
+        }
 
     def suggest_translation_and_comment(
         self,
@@ -81,21 +186,8 @@ class VocabularyNLPService:
         Returns:
             dict: A dictionary with the original word, translated text, and example sentence.
         """
-        default_response = {
-            "russian_word": russian_word,
-            "suggested_translation": f"No translation available for '{target_language}'.",
-            "suggested_example_sentence": "Translation service currently unavailable."
-        }
-
         try:
-            pipeline_instance = self._get_translation_pipeline(target_language)
-            translated = pipeline_instance(russian_word)
-            translation = translated[0]["translation_text"]
-            return {
-                "russian_word": russian_word,
-                "suggested_translation": translation,
-                "suggested_example_sentence": f"Example: '{translation}'."
-            }
+            return self._suggestion(russian_word, self._translate(russian_word, target_language))
         except Exception as exc:  # pylint: disable=broad-exception-caught
             logger.error(
                 "Translation error for '%s' to '%s': %s",
@@ -104,7 +196,148 @@ class VocabularyNLPService:
                 exc,
                 exc_info=True
             )
-            return default_response
+            return self._default_suggestion(russian_word, target_language)
+
+    def suggest_translations_for_language(
+        self,
+        russian_words: Sequence[str],
+        target_language: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Suggests translations for many words into one language with batched inference.
+
+        Args:
+            russian_words (Sequence[str]): The Russian words to translate.
+            target_language (str): The target language code (e.g., 'en', 'es').
+
+        Returns:
+            list[dict]: One suggestion per word, in input order.
+        """
+        try:
+            translations = self._translate_with_memory(russian_words, target_language)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.error(
+                "Batch translation error for %d words to '%s': %s",
+                len(russian_words),
+                target_language,
+                exc,
+                exc_info=True
+            )
+            return [self._default_suggestion(word, target_language) for word in russian_words]
+        return [
+            self._suggestion(word, translation)
+            for word, translation in zip(russian_words, translations)
+        ]
+
+    @staticmethod
+    def _group_by_language(items: Sequence[Tuple[str, str]]) -> Dict[str, List[int]]:
+        """Maps each target language to the indices of its items, in input order."""
+        groups: Dict[str, List[int]] = {}
+        for index, (_, target_language) in enumerate(items):
+            groups.setdefault(target_language, []).append(index)
+        return groups
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Returns the translation thread pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=TRANSLATION_WORKERS, thread_name_prefix="translation"
+            )
+        return self._executor
+
+    def _get_batcher(self) -> TranslationBatcher:
+        """Returns the request batcher of the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._batcher is None or self._batcher.loop is not loop:
+            self._batcher = TranslationBatcher(self._translate_with_memory, self._get_executor)
+        return self._batcher
+
+    async def suggest_translation_and_comment_async(
+        self,
+        russian_word: str,
+        target_language: str
+    ) -> Dict[str, Any]:
+        """
+        Same as ``suggest_translation_and_comment``, but runs on the translation
+        thread pool so model loading and inference do not block the event loop.
+        Concurrent requests for the same language are translated in one batch.
+
+        Args:
+            russian_word (str): The word in Russian to be translated.
+            target_language (str): The target language code (e.g., 'en', 'es').
+
+        Returns:
+            dict: A dictionary with the original word, translated text, and example sentence.
+        """
+        if target_language not in self._models:
+            return self._default_suggestion(russian_word, target_language)
+        try:
+            translation = await self._get_batcher().translate(russian_word, target_language)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.error(
+                "Translation error for '%s' to '%s': %s",
+                russian_word,
+                target_language,
+                exc,
+            )
+            return self._default_suggestion(russian_word, target_language)
+        # The example lookup lemmatizes the word; keep it off the event loop.
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), self._suggestion, russian_word, translation
+        )
+
+    async def suggest_translations_batch_async(
+        self,
+        items: Sequence[Tuple[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Suggests translations for ``(russian_word, target_language)`` pairs.
+
+        Words are grouped by target language and each group is translated with
+        batched inference on the translation thread pool (groups run in parallel
+        up to ``TRANSLATION_WORKERS``).
+
+        Args:
+            items (Sequence[Tuple[str, str]]): The words and their target languages.
+
+        Returns:
+            list[dict]: One suggestion per item, in input order.
+        """
+        loop = asyncio.get_running_loop()
+        groups = self._group_by_language(items)
+        group_results = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._get_executor(),
+                self.suggest_translations_for_language,
+                [items[index][0] for index in indices],
+                target_language,
+            )
+            for target_language, indices in groups.items()
+        ))
+        results: List[Dict[str, Any]] = [{} for _ in items]
+        for indices, suggestions in zip(groups.values(), group_results):
+            for index, suggestion in zip(indices, suggestions):
+                results[index] = suggestion
+        return results
+
+    async def preload_models_async(self) -> None:
+        """Loads the models of ``TRANSLATION_PRELOAD_LANGUAGES`` on the translation thread pool."""
+        if not TRANSLATION_PRELOAD_LANGUAGES:
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._get_executor(), self._model_manager.preload, TRANSLATION_PRELOAD_LANGUAGES
+        )
+
+    def model_stats(self) -> Dict[str, Any]:
+        """Returns the translation model manager's memory budget and resident models."""
+        return self._model_manager.stats()
+
+    def shutdown(self) -> None:
+        """Stops the translation thread pool, dropping queued work (it restarts on next use)."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
 
 
 # Global singleton instance
@@ -15,13 +15,21 @@ import sys
 # Group 2: Third-party libraries
 from dotenv import load_dotenv
 from telegram import Update
-from telegram.ext import Application, CommandHandler, MessageHandler, filters
+from telegram.ext import (
+    Application,
+    CallbackQueryHandler,
+    CommandHandler,
+    MessageHandler,
+    filters,
+)
 
 # Group 3: First-party modules
 from telegram_bot.handlers.commands import (
     start,
     help_command,
     my_transcriptions_command,
+    my_transcriptions_callback,
+    search_audio_command,
     delete_audio_command,
 )
 from telegram_bot.handlers.audio_handler import (
@@ -59,7 +67,11 @@ async def main():
     application.add_handler(CommandHandler("start", start))
     application.add_handler(CommandHandler("help", help_command))
     application.add_handler(CommandHandler("my_audios", my_transcriptions_command))
+    application.add_handler(CommandHandler("search_audio", search_audio_command))
     application.add_handler(CommandHandler("delete_audio", delete_audio_command))
+    application.add_handler(
+        CallbackQueryHandler(my_transcriptions_callback, pattern=r"^audios?:")
+    )
 
     # Register message handlers
     application.add_handler(MessageHandler(filters.AUDIO & ~filters.COMMAND, handle_audio))
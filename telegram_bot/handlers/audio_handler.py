@@ -3,11 +3,13 @@ Handlers for processing audio, voice, and video messages in the Telegram bot.
 This module uses Whisper to transcribe audio content and stores results in the database.
 """
 
+import asyncio
 import logging
+import math
 import os
 import uuid
 from pathlib import Path
-from typing import Generator, Optional, Tuple
+from typing import Generator, Optional, Set, Tuple
 
 from telegram import Update, Message
 from telegram.ext import ContextTypes
@@ -21,6 +23,12 @@ from database.config import get_db
 from database import crud
 from schemas.user import UserCreateTelegram, UserInDB
 from schemas.audio_submission import AudioSubmissionCreate
+from services.rate_limiter import rate_limiter, telegram_key
+from services.transcript_grammar import (
+    AUTO_GRAMMAR_CHECK,
+    GRAMMAR_PENDING,
+    run_transcript_grammar_check,
+)
 from utils.whisper_transcriber import transcribe_audio_with_whisper
 
 logger = logging.getLogger(__name__)
@@ -28,6 +36,9 @@ logger = logging.getLogger(__name__)
 TEMP_FILES_DIR = "temp_audio"
 os.makedirs(TEMP_FILES_DIR, exist_ok=True)
 
+# Keeps background grammar checks referenced until they finish.
+_grammar_tasks: Set[asyncio.Task] = set()
+
 
 def get_db_session() -> Generator[Session, None, None]:
     """Yield a database session from the configured generator."""
@@ -43,6 +54,18 @@ async def save_telegram_file(telegram_file, _user_id: int, extension: str) -> st
     return file_path
 
 
+async def _check_rate_limit(update: Update, user_id: int, duration: Optional[int]) -> bool:
+    """Charge the user's request and audio budgets; reply and return False if exhausted."""
+    retry_after = rate_limiter.acquire(telegram_key(user_id), audio_seconds=float(duration or 0))
+    if retry_after > 0:
+        await update.message.reply_text(
+            "You're sending audio faster than I can transcribe it. "
+            f"Please try again in {math.ceil(retry_after)} seconds."
+        )
+        return False
+    return True
+
+
 async def _create_or_get_user(
     db: Session, update: Update, user_id: int
 ) -> UserInDB:
@@ -67,8 +90,8 @@ async def _create_or_get_user(
 
 async def _transcribe_and_save(
     db: Session, file_path: str, user_id: int
-) -> Tuple[str, str]:
-    """Transcribe audio and save submission to the database."""
+) -> Tuple[str, str, int]:
+    """Transcribe audio and save submission to the database; returns text, language and ID."""
     try:
         transcription_result = transcribe_audio_with_whisper(file_path)
         transcription_text = transcription_result.get("text")
@@ -80,21 +103,48 @@ async def _transcribe_and_save(
         ):
             raise ValueError(transcription_text)
 
-        crud.create_audio_submission(
+        submission = crud.create_audio_submission(
             db,
             submission=AudioSubmissionCreate(
                 audio_path=file_path,
                 original_transcript=transcription_text,
                 language=detected_language,
+                grammar_status=GRAMMAR_PENDING if AUTO_GRAMMAR_CHECK else None,
             ),
             user_id=user_id,
         )
-        return transcription_text, detected_language
+        return transcription_text, detected_language, submission.id
     except (ValueError, CouldntDecodeError, sqlalchemy.exc.SQLAlchemyError) as exc:
         logger.error("Error in transcription or DB save: %s", exc, exc_info=True)
         raise
 
 
+async def _check_transcript_grammar(
+    update: Update, audio_id: int, transcription_text: str, detected_language: str
+) -> None:
+    """Run the grammar check of a transcript and reply with the corrections, if any."""
+    result = await run_transcript_grammar_check(audio_id, transcription_text, detected_language)
+    if not result or not result["errors"]:
+        return
+    try:
+        await update.message.reply_text(
+            f"Grammar check\n\n{result['corrected_text']}\n\n{result['explanation']}"
+        )
+    except telegram.error.TelegramError as exc:
+        logger.warning("Could not send grammar check of transcription %s: %s", audio_id, exc)
+
+
+def _schedule_grammar_check(
+    update: Update, audio_id: int, transcription_text: str, detected_language: str
+) -> None:
+    """Start the transcript's grammar check without delaying the transcription reply."""
+    task = asyncio.create_task(
+        _check_transcript_grammar(update, audio_id, transcription_text, detected_language)
+    )
+    _grammar_tasks.add(task)
+    task.add_done_callback(_grammar_tasks.discard)
+
+
 async def _handle_error(
     update: Update,
     progress_message: Optional[Message],
@@ -130,7 +180,7 @@ async def _process_audio_transcription(
 
     try:
         db_user = await _create_or_get_user(db, update, user_id)
-        transcription_text, detected_language = await _transcribe_and_save(
+        transcription_text, detected_language, audio_id = await _transcribe_and_save(
             db,
             file_path,
             db_user.id,
@@ -152,6 +202,8 @@ async def _process_audio_transcription(
             f"`{transcription_text}`"
         )
         await update.message.reply_text(output_message, parse_mode="Markdown")
+        if AUTO_GRAMMAR_CHECK:
+            _schedule_grammar_check(update, audio_id, transcription_text, detected_language)
 
     except (ValueError, sqlalchemy.exc.SQLAlchemyError, telegram.error.TelegramError) as exc:
         await _handle_error(update, progress_message, user_id, exc)
@@ -175,6 +227,8 @@ async def _process_audio_transcription(
 async def handle_audio(update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle incoming audio messages and trigger transcription."""
     user_id = update.effective_user.id
+    if not await _check_rate_limit(update, user_id, update.message.audio.duration):
+        return
     audio_file = await update.message.audio.get_file()
     file_extension = Path(audio_file.file_path).suffix if audio_file.file_path else '.mp3'
     file_path = await save_telegram_file(audio_file, user_id, file_extension)
@@ -184,6 +238,8 @@ async def handle_audio(update: Update, _context: ContextTypes.DEFAULT_TYPE) -> N
 async def handle_voice(update: Update, _context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle incoming voice messages and trigger transcription."""
     user_id = update.effective_user.id
+    if not await _check_rate_limit(update, user_id, update.message.voice.duration):
+        return
     voice_file = await update.message.voice.get_file()
     file_extension = ".ogg"
     file_path = await save_telegram_file(voice_file, user_id, file_extension)
@@ -215,6 +271,10 @@ async def handle_video(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     progress_message = None
     video_path = None
 
+    media = message.video_note or message.video
+    if media and not await _check_rate_limit(update, user_id, media.duration):
+        return
+
     try:
         if message.video_note:
             video_file = await message.video_note.get_file()
@@ -2,16 +2,24 @@
 Telegram bot command handlers.
 
 This module provides functions to handle various commands sent to the bot,
-including starting the bot, showing help, displaying user transcriptions,
-and deleting specific audio submissions.
+including starting the bot, showing help, displaying and searching user
+transcriptions, and deleting specific audio submissions.
 """
 
 # Group 1: Standard libraries
+import html
 import logging
-from typing import Generator
+from typing import Generator, List, Optional, Tuple
 
 # Group 2: Third-party libraries
-from telegram import Update, ReplyKeyboardMarkup, KeyboardButton
+from telegram import (
+    Update,
+    ReplyKeyboardMarkup,
+    KeyboardButton,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+)
+from telegram.error import TelegramError
 from telegram.ext import ContextTypes
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
@@ -19,9 +27,15 @@ from sqlalchemy.exc import SQLAlchemyError
 # Group 3: First-party modules
 from database.config import get_db
 from database import crud
+from database.fts import render_snippet
 
 logger = logging.getLogger(__name__)
 
+MY_AUDIOS_PAGE_SIZE = 5
+SEARCH_RESULTS_LIMIT = 10
+PREVIEW_LENGTH = 200
+TELEGRAM_MESSAGE_LIMIT = 4096
+
 
 def get_db_session() -> Generator[Session, None, None]:
     """
@@ -51,7 +65,8 @@ async def help_command(update: Update, _context: ContextTypes.DEFAULT_TYPE) -> N
 🤖 *Available Commands:*
 /start - Start the bot
 /help - Show this help
-/my_audios - View your saved audio transcriptions
+/my_audios - Browse your saved audio transcriptions page by page
+/search_audio <words> - Find the transcriptions where you said these words
 /delete_audio <ID> - Delete a specific audio transcription by its ID (e.g., `/delete_audio 123`)
 
 🎙 *Features:*
@@ -62,11 +77,95 @@ async def help_command(update: Update, _context: ContextTypes.DEFAULT_TYPE) -> N
     await update.message.reply_markdown(help_text)
 
 
+def _render_transcriptions_page(
+    db: Session,
+    user_id: int,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+) -> Optional[Tuple[str, InlineKeyboardMarkup]]:
+    """
+    Builds the text and inline keyboard for one page of a user's transcriptions.
+
+    Only the requested page is queried, and only a preview of each transcript
+    is loaded, so the message always stays well below Telegram's size limit.
+
+    Returns:
+        Optional[Tuple[str, InlineKeyboardMarkup]]: The HTML message and keyboard,
+        or None if the page is empty.
+    """
+    rows, has_more = crud.get_audio_submission_previews(
+        db,
+        user_id,
+        before_id=before_id,
+        after_id=after_id,
+        limit=MY_AUDIOS_PAGE_SIZE,
+        preview_length=PREVIEW_LENGTH,
+    )
+    if not rows:
+        return None
+
+    # Keyset navigation: "older" continues after the last row, "newer" before the first.
+    has_older = has_more if after_id is None else True
+    has_newer = has_more if after_id is not None else before_id is not None
+
+    response_text = "📜 <b>Your Transcriptions:</b>\n\n"
+    buttons = []
+    for row in rows:
+        timestamp_str = (
+            row.created_at.strftime("%d/%m/%Y %H:%M")
+            if row.created_at else "Unknown date"
+        )
+        preview = row.preview or ""
+        if (row.transcript_length or 0) > PREVIEW_LENGTH:
+            preview = preview.rstrip() + "…"
+        response_text += (
+            f"<b>ID:</b> <code>{row.id}</code> · {timestamp_str} · "
+            f"{html.escape((row.language or 'unknown').upper())}\n"
+            f"<i>{html.escape(preview)}</i>\n\n"
+        )
+        buttons.append([
+            InlineKeyboardButton(f"📄 Show full #{row.id}", callback_data=f"audio:full:{row.id}")
+        ])
+
+    navigation = []
+    if has_newer:
+        navigation.append(
+            InlineKeyboardButton("⬅️ Newer", callback_data=f"audios:newer:{rows[0].id}")
+        )
+    if has_older:
+        navigation.append(
+            InlineKeyboardButton("Older ➡️", callback_data=f"audios:older:{rows[-1].id}")
+        )
+    if navigation:
+        buttons.append(navigation)
+
+    return response_text, InlineKeyboardMarkup(buttons)
+
+
+def _split_message(text: str, max_length: int = TELEGRAM_MESSAGE_LIMIT) -> List[str]:
+    """
+    Splits text into chunks that fit in a single Telegram message,
+    preferring to break at newlines or spaces.
+    """
+    chunks = []
+    while len(text) > max_length:
+        cut = text.rfind("\n", 0, max_length)
+        if cut <= 0:
+            cut = text.rfind(" ", 0, max_length)
+        if cut <= 0:
+            cut = max_length
+        chunks.append(text[:cut])
+        text = text[cut:].lstrip()
+    if text:
+        chunks.append(text)
+    return chunks
+
+
 async def my_transcriptions_command(
     update: Update, _context: ContextTypes.DEFAULT_TYPE
 ) -> None:
     """
-    Handles the /my_audios command. Lists user's audio transcriptions.
+    Handles the /my_audios command. Shows the first page of the user's transcriptions.
     """
     user_telegram_id = update.effective_user.id
     logger.info(
@@ -95,9 +194,8 @@ async def my_transcriptions_command(
             user_telegram_id, db_user.id
         )
 
-        transcriptions = crud.get_audio_submissions_by_user(db, db_user.id)
-
-        if not transcriptions:
+        page = _render_transcriptions_page(db, db_user.id)
+        if page is None:
             logger.info(
                 "No saved transcriptions found for user ID %s.",
                 db_user.id
@@ -107,30 +205,151 @@ async def my_transcriptions_command(
             )
             return
 
-        logger.info(
-            "Found %d transcriptions for user ID %s.",
-            len(transcriptions), db_user.id
+        response_text, reply_markup = page
+        await update.message.reply_html(response_text, reply_markup=reply_markup)
+
+    except SQLAlchemyError as exc:
+        logger.error(
+            "DB error while loading transcriptions for user %s: %s",
+            user_telegram_id, exc, exc_info=True
+        )
+        await update.message.reply_text(
+            "A database error occurred while loading your transcriptions."
+        )
+
+    finally:
+        pass  # Session closed automatically by get_db()
+
+
+async def my_transcriptions_callback(
+    update: Update, _context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """
+    Handles the inline buttons of /my_audios: page navigation
+    (``audios:older:<id>``, ``audios:newer:<id>``) and ``audio:full:<id>``,
+    which sends a single full transcript on demand.
+    """
+    query = update.callback_query
+    await query.answer()
+    user_telegram_id = update.effective_user.id
+
+    try:
+        scope, action, raw_id = query.data.split(":")
+        anchor_id = int(raw_id)
+    except ValueError:
+        logger.warning("Malformed callback data from user %s: %s", user_telegram_id, query.data)
+        return
+
+    db_session_gen = get_db_session()
+    db = next(db_session_gen)
+    try:
+        db_user = crud.get_user_by_telegram_id(db, user_telegram_id)
+        if not db_user:
+            await query.message.reply_text("You don't have an account registered.")
+            return
+
+        if scope == "audio" and action == "full":
+            submission = crud.get_audio_submission(db, anchor_id, db_user.id)
+            if not submission:
+                await query.message.reply_text(
+                    f"Transcription with ID {anchor_id} not found."
+                )
+                return
+            transcript = (submission.original_transcript or "").strip()
+            for chunk in _split_message(transcript) or ["(empty transcript)"]:
+                await query.message.reply_text(chunk)
+            return
+
+        if scope == "audios" and action in ("older", "newer"):
+            page = _render_transcriptions_page(
+                db,
+                db_user.id,
+                before_id=anchor_id if action == "older" else None,
+                after_id=anchor_id if action == "newer" else None,
+            )
+            if page is None:
+                await query.message.reply_text("No more transcriptions.")
+                return
+            response_text, reply_markup = page
+            await query.edit_message_text(
+                response_text, parse_mode="HTML", reply_markup=reply_markup
+            )
+
+    except SQLAlchemyError as exc:
+        logger.error(
+            "DB error while paging transcriptions for user %s: %s",
+            user_telegram_id, exc, exc_info=True
+        )
+        await query.message.reply_text(
+            "A database error occurred while loading your transcriptions."
         )
-        response_text = "📜 **Your Recent Transcriptions:**\n\n"
-        for submission in transcriptions:
+    except TelegramError as exc:
+        logger.warning("Could not update transcriptions page: %s", exc)
+
+    finally:
+        pass  # Session closed automatically by get_db()
+
+
+async def search_audio_command(
+    update: Update, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """
+    Handles the /search_audio <words> command. Lists the user's best-matching
+    transcriptions with highlighted snippets.
+    """
+    user_telegram_id = update.effective_user.id
+    search_text = " ".join(context.args or []).strip()
+    if not search_text:
+        await update.message.reply_text(
+            "Please tell me what to search for. Usage: /search_audio <words>"
+        )
+        return
+
+    db_session_gen = get_db_session()
+    db = next(db_session_gen)
+    try:
+        db_user = crud.get_user_by_telegram_id(db, user_telegram_id)
+        if not db_user:
+            await update.message.reply_text(
+                "You don't have an account registered. Send an audio/video to create one."
+            )
+            return
+
+        rows = crud.search_audio_submissions(
+            db, db_user.id, search_text, limit=SEARCH_RESULTS_LIMIT
+        )
+        if not rows:
+            await update.message.reply_text(
+                f"No transcriptions found for \"{search_text}\"."
+            )
+            return
+
+        response_text = f"🔎 <b>Results for</b> <i>{html.escape(search_text)}</i>:\n\n"
+        buttons = []
+        for row in rows:
             timestamp_str = (
-                submission.created_at.strftime("%d/%m/%Y %H:%M")
-                if submission.created_at else "Unknown date"
+                row.created_at.strftime("%d/%m/%Y %H:%M")
+                if row.created_at else "Unknown date"
             )
             response_text += (
-                f"**ID:** `{submission.id}`\n"
-                f"*Timestamp:* `{timestamp_str}`\n"
-                f"`{submission.original_transcript}`\n\n"
+                f"<b>ID:</b> <code>{row.id}</code> · {timestamp_str}\n"
+                f"{render_snippet(row.snippet, '<b>', '</b>')}\n\n"
             )
-        await update.message.reply_markdown(response_text)
+            buttons.append([
+                InlineKeyboardButton(f"📄 Show full #{row.id}", callback_data=f"audio:full:{row.id}")
+            ])
+        # Snippets are a few words each, so the results fit in one message.
+        await update.message.reply_html(
+            response_text, reply_markup=InlineKeyboardMarkup(buttons)
+        )
 
     except SQLAlchemyError as exc:
         logger.error(
-            "DB error while loading transcriptions for user %s: %s",
+            "DB error while searching transcriptions for user %s: %s",
             user_telegram_id, exc, exc_info=True
         )
         await update.message.reply_text(
-            "A database error occurred while loading your transcriptions."
+            "A database error occurred while searching your transcriptions."
         )
 
     finally:
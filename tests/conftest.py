@@ -21,6 +21,8 @@ from sqlalchemy.orm import sessionmaker, Session
 from main import app
 from database.base_class import Base
 from database.config import get_db
+from services.rate_limiter import rate_limiter
+from services.translation_memory import translation_memory
 
 warnings.filterwarnings( # C0301: Line too long - split for readability (already done)
     "ignore",
@@ -46,6 +48,15 @@ def setup_database():
     yield
     Base.metadata.drop_all(bind=test_engine)
 
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """
+    Fixture to give every test fresh rate-limit buckets, so requests made by
+    earlier tests never count against later ones.
+    """
+    rate_limiter.reset()
+    yield
+
 @pytest.fixture(name="db_session")
 def db_session_fixture():
     """
@@ -63,6 +74,20 @@ def db_session_fixture():
         transaction.rollback() # Rolls back the transaction to clean the database
         connection.close()
 
+@pytest.fixture(autouse=True)
+def isolated_translation_memory(db_session: Session, monkeypatch):
+    """
+    Fixture to run the shared translation memory inside the test's transaction,
+    so its entries are rolled back with everything else, and to empty its LRU.
+    """
+    monkeypatch.setattr(
+        translation_memory, "session_factory",
+        lambda: TestingSessionLocal(bind=db_session.connection()),
+    )
+    translation_memory.clear_cache()
+    yield
+    translation_memory.clear_cache()
+
 @pytest.fixture(name="client")
 def client_fixture(db_session: Session):
     """
@@ -8,8 +8,20 @@ audio transcription and ensure correct response structures.
 import os
 
 # Group 2: Third-party libraries
+import httpx
 import pytest
 from httpx import AsyncClient  # Corrected import order (C0411)
+from sqlalchemy.orm import Session
+
+# Group 3: First-party modules
+import routers.audio
+import services.exports
+import services.transcript_grammar
+from database import crud
+from schemas.audio_submission import AudioSubmissionCreate
+from schemas.user import UserCreateTelegram
+from services.grammar_service import GrammarService
+from services.languagetool_client import AsyncLanguageToolClient
 
 AUDIO_FILE_PATH = "tests/audio/test_audio_1.ogg"
 
@@ -78,3 +90,228 @@ async def test_transcribe_audio_unauthenticated(async_client: AsyncClient):
     assert response.status_code == 401
     assert "detail" in response.json()
     assert response.json()["detail"] == "Not authenticated"
+
+
+def test_audio_submission_previews_keyset_pagination(db_session):
+    """
+    Test keyset pagination of transcript previews used by the bot's /my_audios.
+
+    Ensures pages are returned newest first, only previews are loaded,
+    and the older/newer cursors walk the history without overlap.
+
+    Args:
+        db_session (Session): Isolated database session.
+    """
+    user = crud.create_telegram_user(db_session, UserCreateTelegram(telegram_id=424242))
+    ids = [
+        crud.create_audio_submission(
+            db_session,
+            AudioSubmissionCreate(
+                audio_path=f"audio_{i}.ogg",
+                original_transcript=f"{i} " + "слово " * 100,
+                language="ru",
+            ),
+            user_id=user.id,
+        ).id
+        for i in range(7)
+    ]
+
+    first_page, has_older = crud.get_audio_submission_previews(
+        db_session, user.id, limit=5, preview_length=20
+    )
+    assert [row.id for row in first_page] == ids[::-1][:5]
+    assert has_older
+    assert all(len(row.preview) <= 20 for row in first_page)
+    assert first_page[0].transcript_length > 20
+
+    second_page, has_older = crud.get_audio_submission_previews(
+        db_session, user.id, before_id=first_page[-1].id, limit=5
+    )
+    assert [row.id for row in second_page] == ids[::-1][5:]
+    assert not has_older
+
+    back_page, has_newer = crud.get_audio_submission_previews(
+        db_session, user.id, after_id=second_page[0].id, limit=5
+    )
+    assert [row.id for row in back_page] == [row.id for row in first_page]
+    assert not has_newer
+
+
+class FakeGrammarService:
+    """Stands in for GrammarService in the background grammar stage."""
+
+    async def check_grammar_async(self, text: str, language: str, degraded: bool = True):
+        """Returns a fixed correction of the transcript."""
+        return {
+            "original_text": text,
+            "corrected_text": text.replace("ошибка", "ошибки"),
+            "explanation": "Corrections applied",
+            "errors": [],
+            "language": language,
+        }
+
+
+@pytest.mark.asyncio
+async def test_transcription_runs_grammar_check_in_background(
+    async_client: AsyncClient, auth_headers: dict, db_session, monkeypatch
+):
+    """
+    Test that a transcription requested with ``grammar_check=true`` returns
+    immediately with a pending status, and that the stored grammar result can
+    be fetched afterwards.
+
+    Args:
+        async_client (AsyncClient): Asynchronous HTTP client for making requests.
+        auth_headers (dict): Authentication headers for the authenticated user.
+        db_session (Session): Isolated database session.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(
+        routers.audio, "transcribe_audio_with_whisper",
+        lambda _path: {"text": "Это ошибка.", "language": "ru"},
+    )
+    monkeypatch.setattr(services.transcript_grammar, "GrammarService", FakeGrammarService)
+    monkeypatch.setattr(
+        services.transcript_grammar, "session_factory",
+        lambda: Session(bind=db_session.get_bind()),
+    )
+
+    with open(AUDIO_FILE_PATH, "rb") as audio_file:
+        response = await async_client.post(
+            "/api/audio/transcribe-audio?grammar_check=true",
+            headers=auth_headers,
+            files={"audio_file": ("test.ogg", audio_file, "audio/ogg")},
+        )
+    assert response.status_code == 201
+    assert response.json()["grammar_status"] == "pending"
+
+    audio_id = response.json()["id"]
+    db_session.expire_all()
+    response = await async_client.get(
+        f"/api/audio/transcriptions/{audio_id}/grammar", headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["grammar_status"] == "completed"
+    assert response.json()["grammar_result"]["corrected_text"] == "Это ошибки."
+
+
+@pytest.mark.asyncio
+async def test_transcript_grammar_check_fails_while_languagetool_is_down(
+    db_session, monkeypatch
+):
+    """
+    Test that a background grammar check during a LanguageTool outage is stored
+    as 'failed' without a result, not as a completed (degraded) check.
+
+    Args:
+        db_session (Session): Isolated database session.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    service = GrammarService()
+    service.clear_cache()
+    monkeypatch.setattr(service, "_http_client", AsyncLanguageToolClient(
+        base_urls="http://languagetool.test",
+        transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+    ))
+    monkeypatch.setattr(
+        services.transcript_grammar, "session_factory",
+        lambda: Session(bind=db_session.get_bind()),
+    )
+    user = crud.create_telegram_user(db_session, UserCreateTelegram(telegram_id=515151))
+    transcript = "Это очень длинная ошибка в тексте, который никто не проверит сегодня."
+    submission = crud.create_audio_submission(
+        db_session,
+        AudioSubmissionCreate(
+            audio_path="a.ogg", original_transcript=transcript, language="ru",
+            grammar_status="pending",
+        ),
+        user.id,
+    )
+
+    result = await services.transcript_grammar.run_transcript_grammar_check(
+        submission.id, transcript, "ru"
+    )
+
+    assert result is None
+    db_session.expire_all()
+    stored = crud.get_audio_submission(db_session, audio_id=submission.id, user_id=user.id)
+    assert stored.grammar_status == "failed"
+    assert stored.grammar_result is None
+
+
+@pytest.mark.asyncio
+async def test_export_transcriptions_streams_csv(
+    async_client: AsyncClient, auth_headers: dict, db_session, monkeypatch
+):
+    """
+    Test that the transcript export streams every transcription of the user
+    as CSV, oldest first.
+
+    Args:
+        async_client (AsyncClient): Asynchronous HTTP client for making requests.
+        auth_headers (dict): Authentication headers for the authenticated user.
+        db_session (Session): Isolated database session.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(
+        services.exports, "session_factory", lambda: Session(bind=db_session.get_bind())
+    )
+    user = crud.get_by_username(db_session, "test_user")
+    for transcript in ("Привет, мир.", 'Он сказал: "да"'):
+        crud.create_audio_submission(
+            db_session,
+            AudioSubmissionCreate(audio_path="a.ogg", original_transcript=transcript, language="ru"),
+            user_id=user.id,
+        )
+
+    response = await async_client.get("/api/audio/export?format=csv", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.splitlines()
+    assert lines[0] == "id,original_transcript,language,grammar_status,created_at"
+    assert lines[1].split(",", 1)[1].startswith('"Привет, мир.",ru,')
+    assert lines[2].split(",", 1)[1].startswith('"Он сказал: ""да""",ru,')
+
+
+@pytest.mark.asyncio
+async def test_search_transcriptions(async_client: AsyncClient, auth_headers: dict, db_session):
+    """
+    Test full-text search over the user's transcriptions: word-prefix matching,
+    bm25 ordering, escaped snippets with highlighted matches, the language
+    filter and removal of deleted transcriptions from the index.
+
+    Args:
+        async_client (AsyncClient): Asynchronous HTTP client for making requests.
+        auth_headers (dict): Authentication headers for the authenticated user.
+        db_session (Session): Isolated database session.
+    """
+    user = crud.get_by_username(db_session, "test_user")
+    ids = [
+        crud.create_audio_submission(
+            db_session,
+            AudioSubmissionCreate(audio_path="a.ogg", original_transcript=text, language=language),
+            user_id=user.id,
+        ).id
+        for text, language in (
+            ("Я купил <новую> книгу и читаю её каждый вечер, потому что это интересно.", "ru"),
+            ("Книга, книга!", "ru"),
+            ("Ich lese ein Buch.", "de"),
+        )
+    ]
+
+    response = await async_client.get("/api/audio/search?q=книг", headers=auth_headers)
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["id"] for result in results] == [ids[1], ids[0]]
+    assert results[1]["snippet"].startswith("Я купил &lt;новую&gt; <mark>книгу</mark>")
+    assert results[0]["score"] > results[1]["score"]
+
+    response = await async_client.get(
+        "/api/audio/search", params={"q": "buch", "language": "ru"}, headers=auth_headers
+    )
+    assert response.json() == []
+
+    crud.delete_audio_submission(db_session, ids[1], user.id)
+    response = await async_client.get("/api/audio/search?q=книг", headers=auth_headers)
+    assert [result["id"] for result in response.json()] == [ids[0]]
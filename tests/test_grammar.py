@@ -0,0 +1,651 @@
+"""
+Module for testing the grammar checking service.
+
+LanguageTool is replaced by in-process fakes (a client and a stub HTTP server),
+so these tests cover the service's own logic: client pooling, correction and error reporting.
+"""
+# Group 1: Standard libraries
+import asyncio
+import json
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+# Group 2: Third-party libraries
+import httpx
+import pytest
+from httpx import AsyncClient
+from language_tool_python.match import Match
+
+# Group 3: First-party modules
+from routers.grammar import grammar_service as router_grammar_service
+from services.grammar_service import GrammarService
+from services.languagetool_client import (
+    AsyncLanguageToolClient,
+    CircuitBreaker,
+    LanguageToolRequestError,
+)
+from services.rate_limiter import RATE_LIMIT_REQUESTS_BURST
+from services.spellchecker import RussianSpellchecker
+from services.text_segmentation import split_sentences, utf16_length
+from utils.sorted_index import SortedIndex, write_sorted_index
+
+
+def make_lt_match(text: str, offset: int, length: int, replacements, message="Possible typo"):
+    """Builds a match dictionary in the LanguageTool ``/v2/check`` format."""
+    return {
+        "message": message,
+        "shortMessage": "",
+        "replacements": [{"value": value} for value in replacements],
+        "offset": offset,
+        "length": length,
+        "context": {"text": text, "offset": offset, "length": length},
+        "sentence": text,
+        "type": {"typeName": "Other"},
+        "rule": {
+            "id": "MORFOLOGIK_RULE",
+            "description": "Possible typo",
+            "issueType": "misspelling",
+            "category": {"id": "TYPOS", "name": "Possible Typo"},
+        },
+        "ignoreForIncompleteSentence": False,
+        "contextForSureMatch": 0,
+    }
+
+
+def find_errors(text: str):
+    """
+    Returns a LanguageTool match for every occurrence of 'ошибка' in ``text``.
+    Offsets are in UTF-16 code units, as the real (Java) server reports them.
+    """
+    matches = []
+    start = text.find("ошибка")
+    while start != -1:
+        matches.append(make_lt_match(text, utf16_length(text[:start]), 6, ["ошибки"]))
+        start = text.find("ошибка", start + 1)
+    return matches
+
+
+class StubLanguageToolServer:
+    """
+    In-process stand-in for the LanguageTool ``/v2/check`` HTTP endpoint,
+    served through ``httpx.MockTransport``. Records requests and peak concurrency.
+    """
+
+    def __init__(self, delay: float = 0.0, version: str = "6.4", status_code: int = 200):
+        self.delay = delay
+        self.version = version
+        self.status_code = status_code
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        """Answers a check request with the matches found by ``find_errors``."""
+        form = {key: values[0] for key, values in parse_qs(request.content.decode()).items()}
+        self.requests.append(form)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.status_code != 200:
+            return httpx.Response(self.status_code)
+        if form["language"] == "xx":
+            return httpx.Response(400, text="'xx' is not a language code known to LanguageTool.")
+        return httpx.Response(200, json={
+            "software": {"name": "LanguageTool", "version": self.version},
+            "language": {"code": form["language"]},
+            "matches": find_errors(form["text"]),
+        })
+
+    def client(self, **kwargs) -> AsyncLanguageToolClient:
+        """Builds an async client wired to this stub."""
+        return AsyncLanguageToolClient(
+            base_urls="http://languagetool.test/v2/",
+            transport=httpx.MockTransport(self.handler),
+            **kwargs,
+        )
+
+
+class FakeTool:
+    """Stands in for ``language_tool_python.LanguageTool``; flags the word 'ошибка'."""
+
+    instances = []
+
+    def __init__(self, lt_language: str):
+        self.lt_language = lt_language
+        self.in_use = threading.Lock()
+        self.closed = False
+        FakeTool.instances.append(self)
+
+    def check(self, text: str):
+        """Returns one match per occurrence of 'ошибка'; fails if used concurrently."""
+        if not self.in_use.acquire(blocking=False):
+            raise AssertionError("LanguageTool client shared between requests")
+        try:
+            time.sleep(0.01)
+            return [Match(match, text) for match in find_errors(text)]
+        finally:
+            self.in_use.release()
+
+    def close(self):
+        """Marks the client as closed."""
+        self.closed = True
+
+
+@pytest.fixture(name="grammar_service")
+def grammar_service_fixture(monkeypatch):
+    """
+    Fixture providing the GrammarService singleton backed by FakeTool clients.
+    """
+    service = GrammarService()
+    service.close()
+    service.clear_cache()
+    FakeTool.instances = []
+    stub = StubLanguageToolServer()
+    monkeypatch.setattr(service, "_create_tool", FakeTool)
+    monkeypatch.setattr(service, "_http_client", stub.client())
+    monkeypatch.setattr(service, "_chunk_max_chars", 1500)
+    service.stub = stub
+    yield service
+    service.close()
+
+
+def test_check_grammar_applies_corrections(grammar_service):
+    """
+    Test that matches are turned into errors and applied to the corrected text.
+    """
+    result = grammar_service.check_grammar("Это ошибка.", "ru")
+
+    assert result["corrected_text"] == "Это ошибки."
+    assert result["errors"][0]["bad_word"] == "ошибка"
+    assert result["errors"][0]["offset"] == 4
+
+
+def test_mixed_languages_reuse_warm_clients(grammar_service):
+    """
+    Test that alternating languages keeps one warm client per language
+    instead of closing and recreating them.
+    """
+    for _ in range(5):
+        for language in ("ru", "en", "es"):
+            grammar_service.check_grammar("текст", language)
+
+    assert sorted(tool.lt_language for tool in FakeTool.instances) == ["en-US", "es-ES", "ru-RU"]
+    assert not any(tool.closed for tool in FakeTool.instances)
+
+
+def test_concurrent_checks_never_share_a_client(grammar_service):
+    """
+    Test that concurrent synchronous checks run one at a time on the language's
+    single warm client.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(
+            lambda _: grammar_service.check_grammar("Это ошибка.", "ru"), range(16)
+        ))
+
+    assert all(result["corrected_text"] == "Это ошибки." for result in results)
+    assert len(FakeTool.instances) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_bounds_concurrency():
+    """
+    Test that the async client never has more requests in flight than allowed,
+    while still running them concurrently.
+    """
+    stub = StubLanguageToolServer(delay=0.05)
+    client = stub.client(max_concurrency=4)
+
+    results = await asyncio.gather(*(client.check("Это ошибка.", "ru-RU") for _ in range(20)))
+    await client.aclose()
+
+    assert len(results) == 20
+    assert all(len(result["matches"]) == 1 for result in results)
+    assert stub.max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_grammar_endpoint_uses_async_client(
+    async_client: AsyncClient, auth_headers: dict, grammar_service
+):
+    """
+    Test the grammar endpoint end to end against the stub LanguageTool server.
+    """
+    assert router_grammar_service is grammar_service
+
+    response = await async_client.post(
+        "/api/grammar/check",
+        json={"text": "Это ошибка.", "language": "ru"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["corrected_text"] == "Это ошибки."
+    assert grammar_service.stub.requests[0]["language"] == "ru-RU"
+
+
+@pytest.mark.asyncio
+async def test_repeated_checks_are_served_from_cache(grammar_service):
+    """
+    Test that an unchanged text is answered from the cache without calling
+    LanguageTool again, and that the cache is dropped when the server version changes.
+    """
+    first = await grammar_service.check_grammar_async("Это ошибка.", "ru")
+    second = await grammar_service.check_grammar_async("Это ошибка.", "ru")
+
+    assert second == first
+    assert len(grammar_service.stub.requests) == 1
+    assert grammar_service.cache_stats()["hits"] >= 1
+
+    grammar_service.stub.version = "6.5"
+    await grammar_service.check_grammar_async("Другой текст.", "ru")
+    await grammar_service.check_grammar_async("Это ошибка.", "ru")
+
+    assert len(grammar_service.stub.requests) == 3
+    assert grammar_service.cache_stats()["server_version"] == "6.5"
+
+
+@pytest.mark.asyncio
+async def test_equivalent_spellings_are_cached_separately(grammar_service):
+    """
+    Test that an NFD spelling of a cached NFC text gets offsets and corrections
+    for its own code points, and that synchronous results, whose server version
+    is unknown, are not cached.
+    """
+    nfc_text = "Мой ошибка."
+    nfd_text = unicodedata.normalize("NFD", nfc_text)
+    assert nfd_text != nfc_text
+
+    await grammar_service.check_grammar_async(nfc_text, "ru")
+    result = await grammar_service.check_grammar_async(nfd_text, "ru")
+
+    assert result["errors"][0]["offset"] == nfd_text.index("ошибка")
+    assert result["corrected_text"] == nfd_text.replace("ошибка", "ошибки")
+
+    grammar_service.check_grammar("Это ошибка в тексте.", "ru")
+    assert grammar_service.cache_stats()["size"] == 2
+
+
+def test_split_sentences_covers_the_whole_text():
+    """
+    Test that sentence segments are contiguous and rebuild the original text.
+    """
+    text = "Привет! Как дела?\nЯ читаю «книгу». Всё"
+    segments = split_sentences(text)
+
+    assert [segment.text for segment in segments] == [
+        "Привет! ", "Как дела?\n", "Я читаю «книгу». ", "Всё"
+    ]
+    assert "".join(segment.text for segment in segments) == text
+    assert all(text[s.start:s.end] == s.text for s in segments)
+
+
+@pytest.mark.asyncio
+async def test_only_changed_sentences_are_rechecked(grammar_service):
+    """
+    Test that after an edit only the changed sentence is sent to LanguageTool,
+    and that match offsets are mapped back to whole-document positions,
+    including past characters outside the Basic Multilingual Plane.
+    """
+    original = "😀 Первое предложение. Второе предложение. Третья ошибка."
+    edited = "😀 Первое предложение. Второе предложение изменено. Третья ошибка."
+
+    await grammar_service.check_grammar_async(original, "ru")
+    assert len(grammar_service.stub.requests) == 1
+
+    result = await grammar_service.check_grammar_async(edited, "ru")
+
+    assert [request["text"] for request in grammar_service.stub.requests[1:]] == [
+        "Второе предложение изменено. "
+    ]
+    error = result["errors"][0]
+    assert edited[error["offset"]:error["offset"] + error["length"]] == "ошибка"
+    assert result["corrected_text"] == edited.replace("ошибка", "ошибки")
+
+
+@pytest.mark.asyncio
+async def test_batch_endpoint_returns_results_in_order(
+    async_client: AsyncClient, auth_headers: dict, grammar_service
+):
+    """
+    Test the batch endpoint, both as a JSON list and as an NDJSON stream.
+    """
+    items = [
+        {"text": "Первая ошибка.", "language": "ru"},
+        {"text": "No errors here.", "language": "en"},
+        {"text": "Вторая ошибка.", "language": "ru"},
+    ]
+
+    response = await async_client.post(
+        "/api/grammar/check-batch", json={"items": items}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["original_text"] for result in results] == [item["text"] for item in items]
+    assert [len(result["errors"]) for result in results] == [1, 0, 1]
+
+    response = await async_client.post(
+        "/api/grammar/check-batch?stream=true", json={"items": items}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["index"] for line in lines] == [0, 1, 2]
+    assert lines[2]["corrected_text"] == "Вторая ошибки."
+
+
+@pytest.mark.asyncio
+async def test_batch_larger_than_the_burst_is_charged_once(
+    async_client: AsyncClient, auth_headers: dict, grammar_service
+):
+    """
+    Test that a batch with more items than the request burst is accepted on a
+    full bucket, charged once (draining the bucket), and not charged again by
+    the router dependency.
+    """
+    items = [{"text": f"Текст {number}.", "language": "ru"}
+             for number in range(int(RATE_LIMIT_REQUESTS_BURST) + 10)]
+
+    response = await async_client.post(
+        "/api/grammar/check-batch", json={"items": items}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == len(items)
+
+    response = await async_client.post(
+        "/api/grammar/check", json={"text": "Текст.", "language": "ru"}, headers=auth_headers
+    )
+    assert response.status_code == 429
+
+
+LONG_TEXT = "\n\n".join(
+    f"Абзац {number}. Здесь есть ошибка. И ещё одно предложение без неё." for number in range(12)
+)
+
+
+def test_long_text_is_checked_in_chunks(grammar_service, monkeypatch):
+    """
+    Test that a long input is split into bounded chunks and corrected globally
+    with document-level offsets.
+    """
+    monkeypatch.setattr(grammar_service, "_chunk_max_chars", 150)
+
+    result = grammar_service.check_grammar(LONG_TEXT, "ru")
+
+    assert len(result["errors"]) == 12
+    assert all(
+        LONG_TEXT[error["offset"]:error["offset"] + error["length"]] == "ошибка"
+        for error in result["errors"]
+    )
+    assert result["corrected_text"] == LONG_TEXT.replace("ошибка", "ошибки")
+
+
+def test_chunked_offsets_survive_astral_characters(grammar_service, monkeypatch):
+    """
+    Test that chunks containing emoji (two UTF-16 code units each) are mapped
+    back to correct Python offsets, also while other checks run concurrently.
+    """
+    monkeypatch.setattr(grammar_service, "_chunk_max_chars", 150)
+    text = "\n\n".join(
+        f"Абзац {'😀' * number} {number}. Тут ошибка. 🎉 И ещё одна ошибка." for number in range(8)
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(
+            lambda _: grammar_service.check_grammar(text, "ru"), range(4)
+        ))
+
+    for result in results:
+        assert len(result["errors"]) == 16
+        assert all(
+            text[error["offset"]:error["offset"] + error["length"]] == "ошибка"
+            for error in result["errors"]
+        )
+        assert result["corrected_text"] == text.replace("ошибка", "ошибки")
+
+
+@pytest.mark.asyncio
+async def test_async_long_text_requests_are_bounded(grammar_service, monkeypatch):
+    """
+    Test that the async path sends bounded chunks and maps their matches back.
+    """
+    monkeypatch.setattr(grammar_service, "_chunk_max_chars", 150)
+
+    result = await grammar_service.check_grammar_async(LONG_TEXT, "ru")
+
+    assert len(grammar_service.stub.requests) > 1
+    assert all(len(request["text"]) <= 150 for request in grammar_service.stub.requests)
+    assert result["corrected_text"] == LONG_TEXT.replace("ошибка", "ошибки")
+    assert [error["offset"] for error in result["errors"]] == [
+        index for index in range(len(LONG_TEXT)) if LONG_TEXT.startswith("ошибка", index)
+    ]
+
+
+def multi_backend_client(servers, **kwargs) -> AsyncLanguageToolClient:
+    """Builds an async client balancing over stubs, one per ``http://lt<N>.test`` host."""
+    async def route(request: httpx.Request) -> httpx.Response:
+        return await servers[int(request.url.host[2:-5])].handler(request)
+
+    return AsyncLanguageToolClient(
+        base_urls=[f"http://lt{index}.test" for index in range(len(servers))],
+        transport=httpx.MockTransport(route),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_failing_backend_is_skipped_and_circuit_opens():
+    """
+    Test that requests fail over from a broken backend and that its circuit
+    opens, so later requests are no longer sent to it.
+    """
+    broken = StubLanguageToolServer(status_code=503)
+    working = StubLanguageToolServer()
+    client = multi_backend_client([broken, working], breaker_failures=2)
+
+    for _ in range(10):
+        result = await client.check("Это ошибка.", "ru-RU")
+        assert len(result["matches"]) == 1
+    stats = client.backend_stats()
+    await client.aclose()
+
+    assert len(broken.requests) == 2
+    assert len(working.requests) == 10
+    assert stats[0]["circuit"] == CircuitBreaker.OPEN
+
+
+@pytest.mark.asyncio
+async def test_rejected_requests_leave_circuits_closed(
+    async_client: AsyncClient, auth_headers: dict, grammar_service
+):
+    """
+    Test that requests LanguageTool rejects (an unknown language) are neither
+    retried on other backends nor counted as backend failures, and that the
+    endpoint answers them with 400.
+    """
+    servers = [StubLanguageToolServer(), StubLanguageToolServer()]
+    client = multi_backend_client(servers, breaker_failures=2)
+
+    for _ in range(5):
+        with pytest.raises(LanguageToolRequestError):
+            await client.check("Это ошибка.", "xx")
+    stats = client.backend_stats()
+    result = await client.check("Это ошибка.", "ru-RU")
+    await client.aclose()
+
+    assert sum(len(server.requests) for server in servers) == 6
+    assert [backend["circuit"] for backend in stats] == [CircuitBreaker.CLOSED] * 2
+    assert len(result["matches"]) == 1
+
+    response = await async_client.post(
+        "/api/grammar/check",
+        json={"text": "Это длинная ошибка в тексте.", "language": "xx"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+    assert "not a language code" in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_overloaded_backend_fails_over():
+    """
+    Test that a 429 from an overloaded backend counts as a backend failure and
+    the request is retried on the next backend.
+    """
+    overloaded = StubLanguageToolServer(status_code=429)
+    working = StubLanguageToolServer()
+    client = multi_backend_client([overloaded, working], breaker_failures=2)
+
+    for _ in range(4):
+        result = await client.check("Это ошибка.", "ru-RU")
+        assert len(result["matches"]) == 1
+    stats = client.backend_stats()
+    await client.aclose()
+
+    assert len(overloaded.requests) == 2
+    assert stats[0]["circuit"] == CircuitBreaker.OPEN
+
+
+def test_clients_of_a_previous_loop_are_closed():
+    """
+    Test that when the client is used from a new event loop, the HTTP clients
+    created for the previous loop are closed instead of leaked.
+    """
+    stub = StubLanguageToolServer()
+    client = stub.client()
+    asyncio.run(client.check("текст", "ru-RU"))
+    first = client._backends[0].client  # pylint: disable=protected-access
+
+    asyncio.run(client.check("текст", "ru-RU"))
+
+    assert first.is_closed
+    assert not client._backends[0].client.is_closed  # pylint: disable=protected-access
+    asyncio.run(client.aclose())
+
+
+@pytest.mark.asyncio
+async def test_requests_are_balanced_by_outstanding_count():
+    """
+    Test that concurrent requests are spread across backends instead of
+    piling onto one.
+    """
+    servers = [StubLanguageToolServer(delay=0.02) for _ in range(3)]
+    client = multi_backend_client(servers)
+
+    await asyncio.gather(*(client.check("текст", "ru-RU") for _ in range(30)))
+    await client.aclose()
+
+    assert [len(server.requests) for server in servers] == [10, 10, 10]
+
+
+@pytest.mark.asyncio
+async def test_slow_backend_is_hedged():
+    """
+    Test that a request slower than the latency percentile is duplicated to
+    another backend and answered by whichever responds first.
+    """
+    servers = [StubLanguageToolServer(), StubLanguageToolServer()]
+    client = multi_backend_client(servers, hedge_percentile=0.9)
+    for _ in range(40):
+        await client.check("текст", "ru-RU")
+
+    servers[0].delay = 1.0
+    started = time.monotonic()
+    for _ in range(2):
+        result = await client.check("Это ошибка.", "ru-RU")
+        assert len(result["matches"]) == 1
+    elapsed = time.monotonic() - started
+    await client.aclose()
+
+    assert elapsed < 1.0
+
+
+def test_circuit_breaker_half_opens_after_timeout():
+    """
+    Test the closed → open → half-open → closed cycle of the circuit breaker.
+    """
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allows_request()
+
+    now[0] = 10.0
+    assert breaker.allows_request()
+    breaker.on_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allows_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+SPELL_WORDS = {"это": 900, "мой": 500, "дом": 400, "том": 100, "кот": 300, "москва": 50, "сказал": 200, "и": 999}
+
+
+@pytest.fixture(name="spellchecker")
+def spellchecker_fixture(tmp_path):
+    """
+    Fixture providing a spellchecker over a small word-form index.
+    """
+    path = str(tmp_path / "ru_spell.idx")
+    write_sorted_index(path, ((word, str(count)) for word, count in SPELL_WORDS.items()))
+    checker = RussianSpellchecker(SortedIndex(path))
+    yield checker
+    checker.close()
+
+
+def test_sorted_index_lookups(tmp_path):
+    """
+    Test exact and prefix lookups in the memory-mapped sorted index.
+    """
+    path = str(tmp_path / "words.idx")
+    assert write_sorted_index(path, [("дом", "1"), ("домик", "2"), ("кот", "3"), ("дом", "4")]) == 3
+    index = SortedIndex(path)
+
+    assert len(index) == 3
+    assert index.get("дом") == b"4"
+    assert index.get("до") is None
+    assert "кот" in index
+    assert index.has_prefix("дом") and not index.has_prefix("дым")
+    assert [key for key, _ in index.iter_prefix("дом")] == ["дом", "домик"]
+    index.close()
+
+
+def test_spellchecker_suggests_frequent_neighbours(spellchecker):
+    """
+    Test that unknown words get edit-distance suggestions ranked by frequency,
+    and that mid-sentence proper names are not flagged.
+    """
+    matches = spellchecker.check("Это мой дрм, сказал Вася.")
+
+    assert len(matches) == 1
+    assert matches[0]["offset"] == 8
+    assert [r["value"] for r in matches[0]["replacements"]] == ["дом"]
+    assert [r["value"] for r in spellchecker.check("Ком")[0]["replacements"]] == ["Дом", "Кот", "Том"]
+
+
+@pytest.mark.asyncio
+async def test_spellchecker_fast_path_and_fallback(grammar_service, spellchecker, monkeypatch):
+    """
+    Test that short Russian inputs are answered in-process, and that longer inputs
+    fall back to spelling-only results while LanguageTool is down.
+    """
+    monkeypatch.setattr(grammar_service, "_spellchecker", spellchecker)
+    monkeypatch.setattr(grammar_service, "_fast_path_max_words", 3)
+
+    result = await grammar_service.check_grammar_async("мой дрм", "ru")
+    assert result["corrected_text"] == "мой дом"
+    assert not grammar_service.stub.requests
+
+    grammar_service.stub.status_code = 503
+    result = await grammar_service.check_grammar_async("Это мой кот и мой дрм.", "ru")
+    assert result["corrected_text"] == "Это мой кот и мой дом."
+    assert result["explanation"].startswith("LanguageTool is unavailable")
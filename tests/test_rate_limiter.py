@@ -0,0 +1,97 @@
+"""
+Module for testing the token-bucket rate limiter.
+
+These tests cover bucket refill, atomic charging of both budgets,
+state sharing through the SQLite store, and the HTTP 429 response.
+"""
+# Group 1: Standard libraries
+# No standard library imports needed here.
+
+# Group 2: Third-party libraries
+import pytest
+from httpx import AsyncClient
+
+# Group 3: First-party modules
+from services.rate_limiter import (
+    AUDIO_SECONDS_BUDGET,
+    REQUESTS_BUDGET,
+    BucketConfig,
+    InMemoryBucketStore,
+    RateLimiter,
+    SQLiteBucketStore,
+    rate_limiter,
+)
+
+CONFIGS = {
+    REQUESTS_BUDGET: BucketConfig(capacity=2, refill_rate=1.0),
+    AUDIO_SECONDS_BUDGET: BucketConfig(capacity=60, refill_rate=1.0),
+}
+
+
+class FakeClock:
+    """A controllable clock for deterministic refill tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_bucket_refills_over_time():
+    """
+    Test that a drained bucket rejects calls and recovers after the refill delay.
+    """
+    clock = FakeClock()
+    limiter = RateLimiter(InMemoryBucketStore(), CONFIGS, clock=clock)
+
+    assert limiter.acquire("tg:1") == 0
+    assert limiter.acquire("tg:1") == 0
+    assert limiter.acquire("tg:1") == pytest.approx(1.0)
+    # Other keys have their own buckets.
+    assert limiter.acquire("tg:2") == 0
+
+    clock.now += 1.0
+    assert limiter.acquire("tg:1") == 0
+
+
+def test_budgets_are_charged_together():
+    """
+    Test that a call rejected for audio seconds does not consume a request token.
+    """
+    clock = FakeClock()
+    limiter = RateLimiter(InMemoryBucketStore(), CONFIGS, clock=clock)
+
+    assert limiter.acquire("tg:1", audio_seconds=50) == 0
+    assert limiter.acquire("tg:1", audio_seconds=30) == pytest.approx(20.0)
+    # The request budget is still untouched by the rejected call.
+    assert limiter.acquire("tg:1") == 0
+    assert limiter.acquire("tg:1") == pytest.approx(1.0)
+
+
+def test_sqlite_store_is_shared(tmp_path):
+    """
+    Test that two limiters backed by the same SQLite file share their buckets.
+    """
+    clock = FakeClock()
+    path = str(tmp_path / "buckets.db")
+    first = RateLimiter(SQLiteBucketStore(path), CONFIGS, clock=clock)
+    second = RateLimiter(SQLiteBucketStore(path), CONFIGS, clock=clock)
+
+    assert first.acquire("api:alice") == 0
+    assert second.acquire("api:alice") == 0
+    assert first.acquire("api:alice") > 0
+
+
+@pytest.mark.asyncio
+async def test_api_returns_429_when_exhausted(async_client: AsyncClient, auth_headers: dict):
+    """
+    Test that an API user past their request budget receives 429 with Retry-After.
+    """
+    retry_after = 0.0
+    while retry_after == 0:
+        retry_after = rate_limiter.acquire("api:test_user")
+
+    response = await async_client.get("/api/vocabulary/", headers=auth_headers)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
@@ -5,14 +5,40 @@ These tests cover creating, retrieving, deleting vocabulary items,
 and also testing the translation suggestion functionality.
 """
 # Group 1: Standard libraries
-# No standard library imports needed here.
+import asyncio
+import io
+import json
+import os
+import time
+from types import SimpleNamespace
 
 # Group 2: Third-party libraries
 import pytest
+import torch
 from httpx import AsyncClient # Corrected import order (C0411)
+from sqlalchemy.orm import Session
 
 # Group 3: First-party modules
-# No first-party imports needed here for tests, as FastAPI client mocks them.
+from database import crud
+from schemas.user import UserCreateTelegram
+from schemas.vocabulary_item import VocabularyItemCreate
+from services import auth_service
+from services import exports
+from services import vocabulary_import
+from services import vocabulary_nlp_service
+from services.example_sentences import ExampleSentenceIndex, write_example_index
+from services.frequency_index import FrequencyIndex, write_frequency_index
+from services.morphology import lemma_key
+from services.rate_limiter import RATE_LIMIT_REQUESTS_BURST
+from services.translation_memory import translation_memory
+from services.translation_models import (
+    TranslationModelManager,
+    load_onnx_translation_pipeline,
+    load_translation_pipeline,
+    onnx_model_dir,
+)
+from services.vocabulary_nlp_service import VocabularyNLPService
+from utils.sorted_index import write_sorted_index
 
 
 # Placeholder for existing tests, if not provided.
@@ -41,6 +67,177 @@ async def test_create_vocabulary_item(async_client: AsyncClient, auth_headers: d
     assert response.json()["translation"] == "hello"
 
 
+@pytest.mark.asyncio
+async def test_create_duplicate_vocabulary_item_conflicts(
+    async_client: AsyncClient, auth_headers: dict
+):
+    """
+    Test that adding a word the user already has, in another case, spelling of
+    'ё' or (with pymorphy3 installed) inflected form, is rejected with 409.
+    """
+    response = await async_client.post(
+        "/api/vocabulary/", json={"russian_word": "ёлка", "translation": "fir"},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+
+    duplicates = ["Елка "]
+    if lemma_key("ёлки") == "елка":  # pymorphy3 lemmatizes inflected forms
+        duplicates.append("ёлки")
+    for duplicate in duplicates:
+        response = await async_client.post(
+            "/api/vocabulary/", json={"russian_word": duplicate, "translation": "fir"},
+            headers=auth_headers
+        )
+        assert response.status_code == 409
+        assert response.json()["detail"].startswith("'ёлка' is already in your vocabulary")
+
+
+def test_create_checks_other_forms_in_the_insert(db_session):
+    """
+    Test that creation itself refuses another form of a word the user has
+    (no separate lookup to race), but not the same word or another user's.
+    """
+    owner = crud.create_telegram_user(db_session, UserCreateTelegram(telegram_id=646464))
+    other = crud.create_telegram_user(db_session, UserCreateTelegram(telegram_id=656565))
+    crud.create_vocabulary_item(
+        db_session, VocabularyItemCreate(russian_word="ёж", translation="hedgehog"), owner.id
+    )
+
+    assert crud.create_vocabulary_item(
+        db_session, VocabularyItemCreate(russian_word="Еж", translation="hedgehog"), owner.id
+    ) is None
+    updated = crud.create_vocabulary_item(
+        db_session, VocabularyItemCreate(russian_word="ёж", translation="hedgehog (n.)"), owner.id
+    )
+    assert updated.translation == "hedgehog (n.)"
+    assert crud.create_vocabulary_item(
+        db_session, VocabularyItemCreate(russian_word="Еж", translation="hedgehog"), other.id
+    ) is not None
+    owned = crud.get_vocabulary_items_by_user(db_session, owner.id)
+    assert [item.russian_word for item in owned] == ["ёж"]
+
+
+@pytest.mark.asyncio
+async def test_create_same_vocabulary_word_upserts(
+    async_client: AsyncClient, auth_headers: dict, db_session
+):
+    """
+    Test that adding exactly the same word again updates the existing item
+    instead of duplicating it, and that bulk inserts skip words the user has.
+    """
+    first = await async_client.post(
+        "/api/vocabulary/", json={"russian_word": "мост", "translation": "bridge"},
+        headers=auth_headers
+    )
+    second = await async_client.post(
+        "/api/vocabulary/",
+        json={
+            "russian_word": "мост", "translation": "bridge (n.)",
+            "example_sentence": "Старый мост.",
+        },
+        headers=auth_headers
+    )
+    assert first.status_code == second.status_code == 201
+    assert second.json()["id"] == first.json()["id"]
+    assert second.json()["translation"] == "bridge (n.)"
+    assert second.json()["example_sentence"] == "Старый мост."
+
+    user = crud.get_by_username(db_session, "test_user")
+    inserted = crud.bulk_create_vocabulary_items(db_session, user.id, [
+        {"russian_word": word, "translation": "x", "example_sentence": None, "lemma_key": word}
+        for word in ("мост", "река")
+    ])
+    assert inserted == 1
+
+    response = await async_client.get("/api/vocabulary/", headers=auth_headers)
+    words = sorted(item["russian_word"] for item in response.json())
+    assert words == ["мост", "река"]
+
+
+@pytest.mark.asyncio
+async def test_import_vocabulary_file(async_client: AsyncClient, auth_headers: dict):
+    """
+    Test that a bulk import inserts valid rows, skips duplicates (existing items
+    and repeated rows) and reports rejected rows with their row numbers.
+    """
+    await async_client.post(
+        "/api/vocabulary/", json={"russian_word": "дом", "translation": "house"},
+        headers=auth_headers
+    )
+    csv_body = (
+        "russian_word,translation,example_sentence\n"
+        "кот,cat,Кот спит.\n"
+        "Дом,home,\n"
+        ",empty,\n"
+        "вода,\"water, drink\",\n"
+        "кот,cat again,\n"
+    )
+    response = await async_client.post(
+        "/api/vocabulary/import",
+        files={"file": ("words.csv", csv_body.encode("utf-8"), "text/csv")},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "total_rows": 5,
+        "imported": 2,
+        "duplicates": 2,
+        "failed": 1,
+        "errors": [{"row": 4, "error": "russian_word and translation must not be empty."}],
+        "errors_truncated": False,
+    }
+
+    jsonl_body = '{"russian_word": "хлеб", "translation": "bread"}\nnot json\n'
+    response = await async_client.post(
+        "/api/vocabulary/import?format=jsonl",
+        files={"file": ("words.txt", jsonl_body.encode("utf-8"), "text/plain")},
+        headers=auth_headers,
+    )
+    assert response.json()["imported"] == 1
+    assert response.json()["errors"][0]["row"] == 2
+
+    response = await async_client.get("/api/vocabulary/", headers=auth_headers)
+    translations = {item["russian_word"]: item["translation"] for item in response.json()}
+    assert translations == {"дом": "house", "кот": "cat", "вода": "water, drink", "хлеб": "bread"}
+
+
+def test_import_finds_duplicates_across_chunks(db_session):
+    """
+    Test that rows repeating a word from an earlier chunk are skipped as
+    duplicates, though only the current chunk's keys are held in memory.
+    """
+    user = crud.create_telegram_user(db_session, UserCreateTelegram(telegram_id=626262))
+    body = "кот,cat\nпёс,dog\nКот,cat again\nпёс,dog again\n".encode("utf-8")
+
+    summary = vocabulary_import.import_vocabulary(
+        db_session, user.id, io.BytesIO(body), "csv", chunk_size=2
+    )
+
+    assert (summary["imported"], summary["duplicates"]) == (2, 2)
+
+
+def test_import_reports_file_line_numbers(db_session):
+    """
+    Test that rejected rows are reported by the file line they start on,
+    counting Anki's '#' header lines and multi-line quoted fields.
+    """
+    user = crud.create_telegram_user(db_session, UserCreateTelegram(telegram_id=636363))
+    body = (
+        "#separator:tab\n"
+        "#html:false\n"
+        "кот\tcat\t\"Кот\nспит.\"\n"
+        "\tempty\n"
+        "вода\twater\n"
+        "рыба\t\n"
+    ).encode("utf-8")
+
+    summary = vocabulary_import.import_vocabulary(db_session, user.id, io.BytesIO(body), "tsv")
+
+    assert summary["imported"] == 2
+    assert [error["row"] for error in summary["errors"]] == [5, 7]
+
+
 @pytest.mark.asyncio
 async def test_get_vocabulary_items(async_client: AsyncClient, auth_headers: dict):
     """
@@ -64,6 +261,71 @@ async def test_get_vocabulary_items(async_client: AsyncClient, auth_headers: dic
     assert response.json()[0]["russian_word"] == "да"
 
 
+@pytest.mark.asyncio
+async def test_export_vocabulary_formats(
+    async_client: AsyncClient, auth_headers: dict, db_session, monkeypatch
+):
+    """
+    Test that the vocabulary export streams the user's items as NDJSON and as
+    an Anki plain-text file with tabs and newlines flattened.
+    """
+    monkeypatch.setattr(exports, "session_factory", lambda: Session(bind=db_session.get_bind()))
+    for word, translation, example in (
+        ("кот", "cat", "Кот\tспит."), ("вода", "water", None)
+    ):
+        await async_client.post(
+            "/api/vocabulary/",
+            json={"russian_word": word, "translation": translation, "example_sentence": example},
+            headers=auth_headers
+        )
+
+    response = await async_client.get("/api/vocabulary/export", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [(record["russian_word"], record["example_sentence"]) for record in records] == [
+        ("кот", "Кот\tспит."), ("вода", None)
+    ]
+
+    response = await async_client.get("/api/vocabulary/export?format=anki", headers=auth_headers)
+    assert 'filename="vocabulary.txt"' in response.headers["content-disposition"]
+    assert response.text.splitlines()[3:] == ["кот\tcat\tКот спит.", "вода\twater\t"]
+
+
+@pytest.mark.asyncio
+async def test_vocabulary_pagination_and_search(async_client: AsyncClient, auth_headers: dict):
+    """
+    Test cursor pagination of the vocabulary list and searching by a fragment
+    of the word (full-text index) or of the translation.
+    """
+    for word, translation in (("книга", "book"), ("кот", "cat"), ("учебник", "textbook")):
+        await async_client.post(
+            "/api/vocabulary/", json={"russian_word": word, "translation": translation},
+            headers=auth_headers
+        )
+
+    response = await async_client.get("/api/vocabulary/?limit=2", headers=auth_headers)
+    assert [item["russian_word"] for item in response.json()] == ["учебник", "кот"]
+    cursor = response.headers["x-next-cursor"]
+    response = await async_client.get(
+        f"/api/vocabulary/?limit=2&cursor={cursor}", headers=auth_headers
+    )
+    assert [item["russian_word"] for item in response.json()] == ["книга"]
+    assert "x-next-cursor" not in response.headers
+
+    for query, expected in (("НИГ", ["книга"]), ("BOOK", ["учебник", "книга"]), ("о", ["кот"])):
+        response = await async_client.get(
+            "/api/vocabulary/", params={"q": query}, headers=auth_headers
+        )
+        assert [item["russian_word"] for item in response.json()] == expected
+
+    # The index follows deletions.
+    book_id = response.json()[0]["id"]
+    await async_client.delete(f"/api/vocabulary/{book_id}", headers=auth_headers)
+    response = await async_client.get("/api/vocabulary/?q=кот", headers=auth_headers)
+    assert response.json() == []
+
+
 @pytest.mark.asyncio
 async def test_delete_vocabulary_item(async_client: AsyncClient, auth_headers: dict):
     """
@@ -123,3 +385,351 @@ async def test_suggest_translation(async_client: AsyncClient, auth_headers: dict
     # If you know what translation and example to expect, you can be more specific:
     # assert data["suggested_translation"] == "Milk" # Example for English
     # assert data["suggested_example_sentence"].startswith("Example: 'Milk'.") # Example for English
+
+
+@pytest.mark.asyncio
+async def test_translation_does_not_block_event_loop(monkeypatch):
+    """
+    Test that translation inference runs off the event loop, so other
+    coroutines keep running while a slow model call is in progress.
+    """
+    service = VocabularyNLPService()
+
+    def slow_translate(words, _language):
+        time.sleep(0.3)
+        return ["milk" for _ in words]
+
+    monkeypatch.setattr(service, "_translate_with_memory", slow_translate)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    result = await service.suggest_translation_and_comment_async("молоко", "en")
+    ticker_task.cancel()
+
+    assert result["suggested_translation"] == "milk"
+    assert ticks >= 10
+
+
+class FakeTranslationPipeline:
+    """Stands in for a Marian pipeline; records each call's inputs and batch size."""
+
+    def __init__(self, target_language: str):
+        self.target_language = target_language
+        self.calls = []
+
+    def __call__(self, inputs, batch_size=1, **_kwargs):
+        self.calls.append((list(inputs), batch_size))
+        return [{"translation_text": f"{word}-{self.target_language}"} for word in inputs]
+
+
+@pytest.mark.asyncio
+async def test_suggest_translations_batches_by_language(
+    async_client: AsyncClient, auth_headers: dict, monkeypatch
+):
+    """
+    Test that the batch endpoint runs one batched pipeline call per target
+    language and returns the suggestions in request order.
+    """
+    pipelines = {language: FakeTranslationPipeline(language) for language in ("en", "es")}
+    monkeypatch.setattr(
+        VocabularyNLPService(), "_get_translation_pipeline", lambda language: pipelines[language]
+    )
+    items = [
+        {"russian_word": "молоко", "target_language": "en"},
+        {"russian_word": "хлеб", "target_language": "es"},
+        {"russian_word": "вода", "target_language": "en"},
+        {"russian_word": "сыр", "target_language": "xx"},
+    ]
+
+    response = await async_client.post(
+        "/api/vocabulary/suggest-translations", json={"items": items}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["suggested_translation"] for result in results[:3]] == [
+        "молоко-en", "хлеб-es", "вода-en"
+    ]
+    assert results[3]["suggested_translation"] == "No translation available for 'xx'."
+    assert pipelines["en"].calls == [(["вода", "молоко"], 2)]
+
+
+@pytest.mark.asyncio
+async def test_suggestion_batch_larger_than_the_burst_is_charged_once(
+    async_client: AsyncClient, auth_headers: dict, monkeypatch
+):
+    """
+    Test that a suggestion batch with more words than the request burst is
+    accepted on a full bucket and drains it, instead of being rejected forever.
+    """
+    pipeline = FakeTranslationPipeline("en")
+    monkeypatch.setattr(
+        VocabularyNLPService(), "_get_translation_pipeline", lambda _language: pipeline
+    )
+    items = [{"russian_word": f"слово{number}", "target_language": "en"}
+             for number in range(int(RATE_LIMIT_REQUESTS_BURST) + 10)]
+
+    response = await async_client.post(
+        "/api/vocabulary/suggest-translations", json={"items": items}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == len(items)
+
+    response = await async_client.get("/api/vocabulary/", headers=auth_headers)
+    assert response.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_concurrent_suggestions_are_micro_batched(monkeypatch):
+    """
+    Test that concurrent single-word suggestions for one language run as one
+    batched pipeline call, with identical words translated once.
+    """
+    pipeline = FakeTranslationPipeline("en")
+    service = VocabularyNLPService()
+    monkeypatch.setattr(service, "_get_translation_pipeline", lambda _language: pipeline)
+
+    words = ["кот", "собака", "Кот", "рыба", "собака"]
+    results = await asyncio.gather(*(
+        service.suggest_translation_and_comment_async(word, "en") for word in words
+    ))
+
+    assert [result["suggested_translation"] for result in results] == [
+        "кот-en", "собака-en", "Кот-en", "рыба-en", "собака-en"
+    ]
+    assert len(pipeline.calls) == 1
+    assert sorted(pipeline.calls[0][0]) == ["Кот", "кот", "рыба", "собака"]
+
+
+@pytest.mark.asyncio
+async def test_model_translates_the_text_as_entered(monkeypatch):
+    """
+    Test that phrases and capitalized words reach the pipeline as entered
+    (trimmed), not lowercased or lemmatized, in both the batched and the
+    micro-batched path.
+    """
+    pipeline = FakeTranslationPipeline("en")
+    service = VocabularyNLPService()
+    monkeypatch.setattr(service, "_get_translation_pipeline", lambda _language: pipeline)
+
+    results = service.suggest_translations_for_language([" Красивые книги ", "Москва"], "en")
+    suggestion = await service.suggest_translation_and_comment_async("Старый Арбат", "en")
+
+    assert [result["suggested_translation"] for result in results] == [
+        "Красивые книги-en", "Москва-en"
+    ]
+    assert suggestion["suggested_translation"] == "Старый Арбат-en"
+    assert sorted(pipeline.calls[0][0]) == ["Красивые книги", "Москва"]
+    assert pipeline.calls[1][0] == ["Старый Арбат"]
+
+
+def test_other_forms_of_a_word_do_not_share_translations(monkeypatch):
+    """
+    Test that a capitalized name or an inflected form never answers for the
+    dictionary form from the translation memory (or the other way around).
+    """
+    pipeline = FakeTranslationPipeline("en")
+    service = VocabularyNLPService()
+    monkeypatch.setattr(service, "_get_translation_pipeline", lambda _language: pipeline)
+
+    service.suggest_translations_for_language(["Вера", "был"], "en")
+    results = service.suggest_translations_for_language(["вера", "быть", "Вера"], "en")
+
+    assert [result["suggested_translation"] for result in results] == [
+        "вера-en", "быть-en", "Вера-en"
+    ]
+    assert sorted(pipeline.calls[1][0]) == ["быть", "вера"]
+
+
+@pytest.mark.asyncio
+async def test_translation_memory_serves_repeated_words(
+    async_client: AsyncClient, auth_headers: dict, monkeypatch
+):
+    """
+    Test that translated words are stored in the shared translation memory,
+    answered from it without inference (also after the LRU is emptied), and
+    that only administrators can invalidate it.
+    """
+    pipeline = FakeTranslationPipeline("en")
+    monkeypatch.setattr(
+        VocabularyNLPService(), "_get_translation_pipeline", lambda _language: pipeline
+    )
+    items = [{"russian_word": "Молоко ", "target_language": "en"}]
+    before = translation_memory.stats()
+
+    for _ in range(2):
+        response = await async_client.post(
+            "/api/vocabulary/suggest-translations", json={"items": items}, headers=auth_headers
+        )
+        assert response.json()["results"][0]["suggested_translation"] == "Молоко-en"
+        translation_memory.clear_cache()
+    assert len(pipeline.calls) == 1
+    assert translation_memory.stats()["db_hits"] == before["db_hits"] + 1
+
+    response = await async_client.delete(
+        "/api/vocabulary/translation-memory?target_language=en", headers=auth_headers
+    )
+    assert response.status_code == 403
+
+    monkeypatch.setattr(auth_service, "ADMIN_USERNAMES", {"test_user"})
+    response = await async_client.delete(
+        "/api/vocabulary/translation-memory?target_language=en", headers=auth_headers
+    )
+    assert response.json() == {"deleted": 1}
+    response = await async_client.get(
+        "/api/vocabulary/translation-memory/stats", headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["lookups"] == before["lookups"] + 2
+
+
+def test_saving_translation_memories_upserts(db_session):
+    """
+    Test that storing a word the memory already has replaces its entry (as a
+    worker racing another one on the same new word does) instead of failing.
+    """
+    crud.save_translation_memories(db_session, {"мост": "bridge"}, "en", "old-model")
+    crud.save_translation_memories(
+        db_session, {"мост": "bridge (n.)", "река": "river"}, "en", "new-model"
+    )
+
+    assert crud.get_translation_memories(db_session, ["мост", "река"], "en", "new-model") == {
+        "мост": "bridge (n.)", "река": "river"
+    }
+    assert crud.get_translation_memories(db_session, ["мост"], "en", "old-model") == {}
+
+
+def test_frequency_index_answers_before_the_model(tmp_path, monkeypatch):
+    """
+    Test that words in the precomputed frequency index are translated without
+    inference, and that an index built with another model, engine or key
+    format is ignored.
+    """
+    index_path = str(tmp_path / "freq.idx")
+    write_frequency_index(
+        index_path,
+        {"en": {" дом": "house"}, "es": {"дом": "casa"}},
+        {"en": "Helsinki-NLP/opus-mt-ru-en", "es": "some-other-model"},
+    )
+    pipelines = {language: FakeTranslationPipeline(language) for language in ("en", "es")}
+    service = VocabularyNLPService()
+    monkeypatch.setattr(service, "_get_translation_pipeline", lambda language: pipelines[language])
+    monkeypatch.setattr(service, "_frequency_index", FrequencyIndex.from_path(index_path))
+
+    results = service.suggest_translations_for_language(["дом", "кот"], "en")
+    assert [result["suggested_translation"] for result in results] == ["house", "кот-en"]
+    assert pipelines["en"].calls == [(["кот"], 1)]
+    assert service.suggest_translation_and_comment("дом", "es")["suggested_translation"] == "дом-es"
+
+    # Built with PyTorch, so an app running the ONNX engine does not serve it.
+    monkeypatch.setattr(service._model_manager, "engine", "onnx")  # pylint: disable=protected-access
+    pipelines["en"].calls.clear()
+    assert service.suggest_translation_and_comment("дом", "en")["suggested_translation"] == "дом-en"
+    assert pipelines["en"].calls == [(["дом"], 1)]
+
+    # Written before keys recorded their format (lemma keys): not loaded at all.
+    stale_path = str(tmp_path / "stale.idx")
+    write_sorted_index(
+        stale_path, [("\tmodel\ten", "Helsinki-NLP/opus-mt-ru-en"), ("en\tдом", "house")]
+    )
+    assert FrequencyIndex.from_path(stale_path) is None
+
+
+def test_example_sentences_come_from_the_corpus_index(tmp_path, monkeypatch):
+    """
+    Test that suggestions use the best-ranked corpus sentence containing the
+    word, and keep the placeholder for words the corpus does not contain.
+    """
+    index_path = str(tmp_path / "examples.idx")
+    write_example_index(index_path, [
+        "Кошка спит.",
+        "Моя кошка любит тёплое молоко по утрам.",
+        "",
+        "Собака лает во дворе.",
+    ])
+    example_index = ExampleSentenceIndex.from_path(index_path)
+    monkeypatch.setattr(vocabulary_nlp_service, "get_example_index", lambda: example_index)
+    service = VocabularyNLPService()
+    monkeypatch.setattr(
+        service, "_get_translation_pipeline", lambda _language: FakeTranslationPipeline("en")
+    )
+
+    results = service.suggest_translations_for_language(["кошка", "хлеб"], "en")
+    assert results[0]["suggested_example_sentence"] == "Моя кошка любит тёплое молоко по утрам."
+    assert results[1]["suggested_example_sentence"] == "Example: 'хлеб-en'."
+    assert example_index.find("кошка", limit=5) == [
+        "Моя кошка любит тёплое молоко по утрам.", "Кошка спит."
+    ]
+
+
+class FakeModel:
+    """Stands in for a seq2seq model whose weights take ``size_mb`` megabytes."""
+
+    def __init__(self, size_mb: int):
+        self._weights = torch.zeros(size_mb * 1024 * 1024, dtype=torch.uint8)
+
+    def parameters(self):
+        """Returns the model weights."""
+        return [self._weights]
+
+    def buffers(self):
+        """Returns no buffers."""
+        return []
+
+
+def test_model_manager_evicts_least_recently_used():
+    """
+    Test that loading a model beyond the memory budget evicts the least
+    recently used one, and that loads use local files only.
+    """
+    loads = []
+
+    def loader(model_name, local_files_only):
+        loads.append((model_name, local_files_only))
+        return SimpleNamespace(model=FakeModel(size_mb=2))
+
+    manager = TranslationModelManager(
+        {"en": "model-en", "es": "model-es", "fr": "model-fr"},
+        memory_budget_mb=5,
+        local_files_only=True,
+        loader=loader,
+    )
+    manager.get("en")
+    manager.get("es")
+    manager.get("en")
+    manager.get("fr")
+
+    stats = manager.stats()
+    assert [model["target_language"] for model in stats["models"]] == ["en", "fr"]
+    assert stats["evictions"] == 1
+    assert stats["resident_mb"] == 4.0
+    assert loads == [("model-en", True), ("model-es", True), ("model-fr", True)]
+
+
+def test_onnx_engine_matches_pytorch_translations():
+    """
+    Test that the quantized ONNX Runtime engine translates common words like the
+    PyTorch model. Needs the optional packages, the cached model and its export.
+    """
+    pytest.importorskip("optimum.onnxruntime")
+    model_name = "Helsinki-NLP/opus-mt-ru-en"
+    if not os.path.isdir(onnx_model_dir(model_name)):
+        pytest.skip("No ONNX export; run scripts/export_onnx_models.py en.")
+    try:
+        reference = load_translation_pipeline(model_name, local_files_only=True)
+    except OSError:
+        pytest.skip("The PyTorch model is not in the local cache.")
+    candidate = load_onnx_translation_pipeline(model_name)
+
+    words = ["дом", "кошка", "вода", "книга", "город", "друг", "хлеб", "солнце"]
+    expected = [output["translation_text"] for output in reference(words)]
+    actual = [output["translation_text"] for output in candidate(words)]
+    # int8 weights may change the odd word, but not most of them.
+    agreeing = sum(left.lower() == right.lower() for left, right in zip(expected, actual))
+    assert agreeing >= len(words) - 1
@@ -0,0 +1,28 @@
+"""
+Utility helpers for inspecting audio files before transcription.
+"""
+
+import logging
+
+from pydub.utils import mediainfo
+
+logger = logging.getLogger(__name__)
+
+
+def get_audio_duration_seconds(audio_path: str) -> float:
+    """
+    Reads the duration of an audio file from its container metadata.
+
+    Uses ffprobe through pydub, so the file is not decoded.
+
+    Args:
+        audio_path (str): The path to the audio file.
+
+    Returns:
+        float: The duration in seconds, or 0.0 if it cannot be determined.
+    """
+    try:
+        return float(mediainfo(audio_path).get("duration", 0.0))
+    except (OSError, ValueError) as exc:
+        logger.warning("Could not read duration of %s: %s", audio_path, exc)
+        return 0.0
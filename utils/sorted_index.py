@@ -0,0 +1,147 @@
+"""
+Compact, memory-mapped sorted string index.
+
+A read-only key/value file built once (e.g. by a script in ``scripts/``) and opened
+with ``mmap``, so many processes share one copy of the data through the page cache
+and lookups cost a binary search without loading anything into Python objects.
+
+File layout (all integers little-endian uint32):
+    magic ``b"SIDX"``, version, record count,
+    ``count + 1`` offsets into the record area (the last one marks its end),
+    records ``key + b"\\x00" + value`` sorted by the UTF-8 bytes of ``key``.
+"""
+
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+_MAGIC = b"SIDX"
+_VERSION = 1
+_HEADER = struct.Struct("<4sII")
+_OFFSET = struct.Struct("<I")
+_SEPARATOR = b"\x00"
+
+
+def write_sorted_index(path: str, items: Iterable[Tuple[str, Union[str, bytes]]]) -> int:
+    """
+    Writes ``items`` as a sorted index file; later duplicates of a key replace earlier ones.
+
+    Args:
+        path (str): Destination file; written atomically through a temporary file.
+        items (Iterable[Tuple[str, Union[str, bytes]]]): Key/value pairs. Keys must
+            not contain NUL characters.
+
+    Returns:
+        int: The number of records written.
+    """
+    records = {}
+    for key, value in items:
+        encoded_key = key.encode("utf-8")
+        if _SEPARATOR in encoded_key:
+            raise ValueError(f"Index keys cannot contain NUL characters: {key!r}")
+        records[encoded_key] = value.encode("utf-8") if isinstance(value, str) else value
+
+    keys = sorted(records)
+    offsets = []
+    position = 0
+    for key in keys:
+        offsets.append(position)
+        position += len(key) + 1 + len(records[key])
+    offsets.append(position)
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as index_file:
+        index_file.write(_HEADER.pack(_MAGIC, _VERSION, len(keys)))
+        index_file.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        for key in keys:
+            index_file.write(key + _SEPARATOR + records[key])
+    os.replace(temp_path, path)
+    return len(keys)
+
+
+class SortedIndex:
+    """
+    Read-only view of a file written by ``write_sorted_index``.
+
+    Attributes:
+        path (str): The index file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as index_file:
+            size = os.fstat(index_file.fileno()).st_size
+            # An empty mmap is not allowed; a valid index always has a header.
+            if size < _HEADER.size:
+                raise ValueError(f"{path} is not a sorted index file.")
+            self._mm = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._mm.close()
+            raise ValueError(f"{path} is not a sorted index file (version {_VERSION}).")
+        self._count = count
+        self._offsets_start = _HEADER.size
+        self._records_start = self._offsets_start + (count + 1) * _OFFSET.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key.encode("utf-8")) is not None
+
+    def _offset(self, position: int) -> int:
+        return _OFFSET.unpack_from(self._mm, self._offsets_start + position * _OFFSET.size)[0]
+
+    def _record(self, position: int) -> Tuple[bytes, bytes]:
+        start = self._records_start + self._offset(position)
+        end = self._records_start + self._offset(position + 1)
+        separator = self._mm.find(_SEPARATOR, start, end)
+        return self._mm[start:separator], self._mm[separator + 1:end]
+
+    def _key(self, position: int) -> bytes:
+        start = self._records_start + self._offset(position)
+        end = self._records_start + self._offset(position + 1)
+        return self._mm[start:self._mm.find(_SEPARATOR, start, end)]
+
+    def _lower_bound(self, key: bytes) -> int:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _find(self, key: bytes) -> Optional[int]:
+        position = self._lower_bound(key)
+        if position < self._count and self._key(position) == key:
+            return position
+        return None
+
+    def get(self, key: str, default: Optional[bytes] = None) -> Optional[bytes]:
+        """Returns the value stored for ``key``, or ``default``."""
+        position = self._find(key.encode("utf-8"))
+        return self._record(position)[1] if position is not None else default
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Returns True if some key starts with ``prefix``."""
+        encoded = prefix.encode("utf-8")
+        position = self._lower_bound(encoded)
+        return position < self._count and self._key(position).startswith(encoded)
+
+    def iter_prefix(self, prefix: str) -> Iterator[Tuple[str, bytes]]:
+        """Yields ``(key, value)`` for every key starting with ``prefix``, in key order."""
+        encoded = prefix.encode("utf-8")
+        position = self._lower_bound(encoded)
+        while position < self._count:
+            key, value = self._record(position)
+            if not key.startswith(encoded):
+                break
+            yield key.decode("utf-8"), value
+            position += 1
+
+    def close(self) -> None:
+        """Unmaps the file."""
+        self._mm.close()